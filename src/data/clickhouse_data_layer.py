@@ -12,21 +12,156 @@ Key advantages:
 """
 
 import asyncio
+import os
+import queue
 import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, date
-from typing import Dict, List, Optional, Any, Union
+from itertools import combinations
+from typing import AsyncIterator, Dict, FrozenSet, Iterator, List, Optional, Any, Union
 import pandas as pd
 import logging
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, contextmanager
 
 import clickhouse_connect
 from clickhouse_connect.driver import Client
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 from . import DataLayerInterface
 from ..utils.logger_setup import setup_logger
 from ..utils.timezone_utils import get_current_time, to_utc, to_ist
 
 
+def _build_query_variants(base: str, filters: Dict[str, str], suffix: str,
+                          required: FrozenSet[str] = frozenset()) -> Dict[FrozenSet[str], str]:
+    """
+    Pre-build the SQL text for every combination of optional filters.
+    
+    Args:
+        base: Query text up to and including the first condition
+        filters: Optional filter name -> condition, in clause order
+        suffix: Query text appended after the conditions
+        required: Parameter names that are always present
+        
+    Returns:
+        Mapping of the full parameter-name set to the query text, so callers
+        can look up the query with frozenset(params)
+    """
+    variants = {}
+    for count in range(len(filters) + 1):
+        for active in combinations(filters, count):
+            conditions = "".join(f" AND {filters[name]}" for name in active)
+            variants[required | frozenset(active)] = f"{base}{conditions}{suffix}"
+    return variants
+
+
+# Data queries use server-side {name:Type} parameters: the SQL text stays
+# identical across calls and values are sent separately from the query
+_SIGNALS_QUERIES = _build_query_variants(
+    "SELECT * FROM trading_signals WHERE 1=1",
+    {
+        'symbol': "symbol = {symbol:String}",
+        'strategy': "strategy = {strategy:String}",
+        'start_time': "timestamp >= {start_time:DateTime64(3)}",
+        'end_time': "timestamp <= {end_time:DateTime64(3)}",
+    },
+    " ORDER BY timestamp DESC"
+)
+
+_LAST_SIGNAL_QUERIES = _build_query_variants(
+    "SELECT * FROM trading_signals WHERE symbol = {symbol:String} AND strategy = {strategy:String}",
+    {'since': "timestamp >= {since:DateTime64(3)}"},
+    " ORDER BY timestamp DESC LIMIT 1",
+    required=frozenset({'symbol', 'strategy'})
+)
+
+_PERFORMANCE_SUMMARY_QUERIES = _build_query_variants(
+    """
+    SELECT 
+        strategy,
+        symbol,
+        sum(total_trades) as total_trades,
+        sum(winning_trades) as winning_trades,
+        sum(losing_trades) as losing_trades,
+        sum(total_pnl) as total_pnl,
+        max(max_drawdown) as max_drawdown,
+        avg(sharpe_ratio) as avg_sharpe_ratio,
+        avg(win_rate) as avg_win_rate
+    FROM strategy_performance 
+    PREWHERE timestamp >= {start_date:DateTime64(3)}""",
+    {
+        'strategy': "strategy = {strategy:String}",
+        'symbol': "symbol = {symbol:String}",
+    },
+    " GROUP BY strategy, symbol",
+    required=frozenset({'start_date'})
+)
+
+# Tables managed by this layer, with their maintenance commands built once
+_DATA_TABLES = ('market_data', 'historical_data', 'trading_signals',
+                'options_data', 'strategy_performance')
+
+_OPTIMIZE_COMMANDS = {table: f"OPTIMIZE TABLE {table}" for table in _DATA_TABLES}
+
+_CLEANUP_COMMANDS = {
+    table: f"ALTER TABLE {table} DELETE WHERE timestamp < %(cutoff_date)s"
+    for table in _DATA_TABLES
+}
+
+# Defaults for value columns missing from the data being stored
+_MARKET_DATA_DEFAULTS = {
+    'open': 0.0, 'high': 0.0, 'low': 0.0, 'close': 0.0, 'ltp': 0.0,
+    'volume': 0, 'turnover': 0.0,
+    'price_change': 0.0, 'price_change_pct': 0.0, 'volatility': 0.0,
+    'bid_price': 0.0, 'ask_price': 0.0, 'bid_size': 0, 'ask_size': 0,
+    'metadata': ''
+}
+
+# Batch records also carry their identity columns; timestamp defaults to now
+_MARKET_DATA_BATCH_DEFAULTS = {
+    'symbol': '', 'asset_type': '', 'runner_name': '',
+    **_MARKET_DATA_DEFAULTS
+}
+
+_MARKET_DATA_BATCH_COLUMNS = ['timestamp', *_MARKET_DATA_BATCH_DEFAULTS]
+
+_OPTIONS_DATA_DEFAULTS = {
+    'strike': 0.0, 'option_type': 'CE', 'ltp': 0.0, 'bid': 0.0, 'ask': 0.0,
+    'volume': 0, 'open_interest': 0,
+    'delta': 0.0, 'gamma': 0.0, 'theta': 0.0, 'vega': 0.0,
+    'implied_volatility': 0.0, 'moneyness': 0.0, 'time_to_expiry': 0.0
+}
+
+# Maximum number of (symbol, strategy, since) entries kept by get_last_signal
+_LAST_SIGNAL_CACHE_SIZE = 1024
+
+# Repeated-value string columns stored as LowCardinality(String), so that
+# equality filters compare dictionary keys instead of full strings
+_LOW_CARDINALITY_COLUMNS = {
+    'market_data': ('asset_type',),
+    'historical_data': ('asset_type',),
+    'trading_signals': ('asset_type', 'strategy'),
+    'options_data': ('option_type',),
+    'strategy_performance': ('strategy',),
+}
+
+_TABLE_SIZES_QUERY = """
+    SELECT 
+        table,
+        formatReadableSize(sum(bytes)) as size,
+        sum(rows) as rows
+    FROM system.parts 
+    WHERE database = {database:String}
+    GROUP BY table
+"""
+
+
 class ClickHouseDataLayer(DataLayerInterface):
     """
     ClickHouse implementation of the data layer interface.
@@ -36,7 +171,8 @@ class ClickHouseDataLayer(DataLayerInterface):
     
     def __init__(self, host: str = 'localhost', port: int = 8123,
                  database: str = 'alphastock', username: str = 'default',
-                 password: str = '', pool_size: int = 10):
+                 password: str = '', pool_size: Optional[int] = None,
+                 last_signal_cache_ttl: float = 1.0):
         """
         Initialize ClickHouse data layer.
         
@@ -46,42 +182,47 @@ class ClickHouseDataLayer(DataLayerInterface):
             database: Database name
             username: Username for authentication
             password: Password for authentication
-            pool_size: Connection pool size
+            pool_size: Connection pool size (defaults to min(32, 2 * CPU count))
+            last_signal_cache_ttl: Seconds a get_last_signal result is reused
+                (0 disables the cache)
         """
         self.host = host
         self.port = port
         self.database = database
         self.username = username
         self.password = password
-        self.pool_size = pool_size
+        self.pool_size = pool_size or min(32, (os.cpu_count() or 1) * 2)
         
-        # Thread-local storage for ClickHouse clients
-        # Each thread gets its own client to avoid concurrent query issues
-        self._thread_local = threading.local()
+        # Bounded pool of ClickHouse clients. Each caller borrows a client for
+        # the duration of one operation, which avoids 'concurrent queries within
+        # the same session' errors without allocating a client per thread.
+        # Clients are created on first use, up to pool_size of them.
+        self._pool: queue.LifoQueue = queue.LifoQueue(maxsize=self.pool_size)
+        self._pool_lock = threading.Lock()
+        self._clients_created = 0
+        # One slot per pooled client, taken on the event loop before a worker
+        # thread checks a client out, so no executor thread ever waits on the
+        # pool while the holders need executor threads to finish
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
         self.client: Optional[Client] = None  # Main client for initialization
+        
+        # LRU cache for get_last_signal: (symbol, strategy, since) ->
+        # (version, expires_at, signal). store_signal bumps the version of its
+        # (symbol, strategy), which invalidates every cached entry for the pair.
+        self.last_signal_cache_ttl = last_signal_cache_ttl
+        self._last_signal_cache: OrderedDict = OrderedDict()
+        self._signal_versions: Dict[tuple, int] = {}
+        self._last_signal_lock = threading.Lock()
+        
         self.logger = setup_logger(name="ClickHouseDataLayer")
         self._initialized = False
     
     async def initialize(self) -> bool:
         """Initialize ClickHouse connection and create tables."""
         try:
-            # Create ClickHouse client
-            self.client = clickhouse_connect.get_client(
-                host=self.host,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                database=self.database,
-                send_receive_timeout=60
-            )
-            
-            # Test connection
-            result = self.client.query("SELECT 1").result_rows
-            if not result or result[0][0] != 1:
-                raise Exception("ClickHouse connection test failed")
-            
-            # Create database if it doesn't exist
-            self.client.command(f"CREATE DATABASE IF NOT EXISTS {self.database}")
+            # Connect, test and create the database off the event loop
+            await asyncio.to_thread(self._connect)
             
             # Create tables
             await self._create_tables()
@@ -94,30 +235,148 @@ class ClickHouseDataLayer(DataLayerInterface):
             self.logger.error(f"Failed to initialize ClickHouse data layer: {e}")
             return False
     
-    def _get_thread_client(self) -> Client:
+    def _connect(self):
+        """Create the main client, test the connection and create the database."""
+        self.client = self._create_client()
+        
+        # Test connection
+        result = self.client.query("SELECT 1").result_rows
+        if not result or result[0][0] != 1:
+            raise Exception("ClickHouse connection test failed")
+        
+        # Create database if it doesn't exist
+        self.client.command(f"CREATE DATABASE IF NOT EXISTS {self.database}")
+    
+    def _create_client(self) -> Client:
+        """Create a new ClickHouse client with the layer's connection settings."""
+        return clickhouse_connect.get_client(
+            host=self.host,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            database=self.database,
+            send_receive_timeout=60
+        )
+    
+    # Seconds to wait for a pooled client before giving up
+    POOL_CHECKOUT_TIMEOUT = 30.0
+    
+    def _checkout(self) -> Client:
         """
-        Get or create a ClickHouse client for the current thread.
+        Take an idle pooled client, creating one while fewer than pool_size
+        exist, else wait up to POOL_CHECKOUT_TIMEOUT for one to be returned.
         
-        This ensures each thread has its own client instance to avoid
-        'concurrent queries within the same session' errors.
+        Raises:
+            TimeoutError: If no client became free in time
+        """
+        try:
+            return self._pool.get_nowait()
+        except queue.Empty:
+            pass
+        
+        with self._pool_lock:
+            create = self._clients_created < self.pool_size
+            if create:
+                self._clients_created += 1
+        
+        if create:
+            try:
+                return self._create_client()
+            except Exception:
+                with self._pool_lock:
+                    self._clients_created -= 1
+                raise
+        
+        try:
+            return self._pool.get(timeout=self.POOL_CHECKOUT_TIMEOUT)
+        except queue.Empty:
+            raise TimeoutError(
+                f"No ClickHouse client became free within {self.POOL_CHECKOUT_TIMEOUT}s "
+                f"(pool size {self.pool_size})"
+            ) from None
+    
+    def _checkin(self, client: Client):
+        """Return a client taken with _checkout to the pool."""
+        self._pool.put_nowait(client)
+    
+    @contextmanager
+    def _acquire(self) -> Iterator[Client]:
+        """
+        Borrow a ClickHouse client from the pool.
         
+        The client is returned to the pool when the block exits, so clients
+        are recycled rather than reallocated. See _checkout for how a client
+        is obtained when none is idle.
+        
+        Yields:
+            Client: Pooled ClickHouse client
+        """
+        client = self._checkout()
+        try:
+            yield client
+        finally:
+            self._checkin(client)
+    
+    def _pool_slots(self) -> asyncio.Semaphore:
+        """Semaphore bounding pooled client holders on the running loop."""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.pool_size)
+            self._slots_loop = loop
+        return self._slots
+    
+    async def _run(self, method: str, *args, **kwargs) -> Any:
+        """
+        Call a client method on a pooled client in a worker thread.
+        
+        clickhouse-connect is synchronous, so running the call through
+        asyncio.to_thread keeps the event loop free while the query is in
+        flight and lets concurrent coroutines use separate pooled clients.
+        
+        Args:
+            method: Name of the client method (query, query_df, insert, ...)
+            *args: Positional arguments for the client method
+            **kwargs: Keyword arguments for the client method
+            
         Returns:
-            Client: Thread-local ClickHouse client
+            Whatever the client method returns
         """
-        if not hasattr(self._thread_local, 'client') or self._thread_local.client is None:
-            # Create a new client for this thread
-            self._thread_local.client = clickhouse_connect.get_client(
-                host=self.host,
-                port=self.port,
-                username=self.username,
-                password=self.password,
-                database=self.database,
-                send_receive_timeout=60
-            )
-            thread_name = threading.current_thread().name
-            self.logger.debug(f"Created new ClickHouse client for thread: {thread_name}")
+        def call():
+            with self._acquire() as client:
+                return getattr(client, method)(*args, **kwargs)
         
-        return self._thread_local.client
+        async with self._pool_slots():
+            return await asyncio.to_thread(call)
+    
+    async def _run_per_table(self, operation: str, commands: Dict[str, str],
+                             parameters: Optional[Dict] = None) -> bool:
+        """
+        Issue one independent command per table concurrently.
+        
+        Each command runs on its own pooled client. Failures are logged per
+        table and do not cancel the commands for the other tables.
+        
+        Args:
+            operation: Operation name used in log messages
+            commands: Mapping of table name to SQL command
+            parameters: Query parameters shared by all commands
+            
+        Returns:
+            bool: True if every command succeeded, False otherwise
+        """
+        results = await asyncio.gather(
+            *(self._run('command', command, parameters=parameters)
+              for command in commands.values()),
+            return_exceptions=True
+        )
+        
+        success = True
+        for table, result in zip(commands, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error during {operation} of {table}: {result}")
+                success = False
+        
+        return success
     
     async def close(self):
         """Close ClickHouse connections."""
@@ -127,10 +386,16 @@ class ClickHouseDataLayer(DataLayerInterface):
                 self.client.close()
                 self.client = None
             
-            # Close thread-local client if exists
-            if hasattr(self._thread_local, 'client') and self._thread_local.client:
-                self._thread_local.client.close()
-                self._thread_local.client = None
+            # Close idle pooled clients; clients in use are returned to the
+            # pool as usual, and new ones are created again on demand
+            while True:
+                try:
+                    client = self._pool.get_nowait()
+                except queue.Empty:
+                    break
+                client.close()
+                with self._pool_lock:
+                    self._clients_created -= 1
             
             self._initialized = False
             self.logger.info("ClickHouse data layer closed")
@@ -204,7 +469,7 @@ class ClickHouseDataLayer(DataLayerInterface):
                 timestamp DateTime64(3),
                 date Date MATERIALIZED toDate(timestamp),
                 symbol String,
-                asset_type String,
+                asset_type LowCardinality(String),
                 timeframe String,
                 open Float64,
                 high Float64,
@@ -335,7 +600,7 @@ class ClickHouseDataLayer(DataLayerInterface):
             timestamp DateTime64(3),
             date Date MATERIALIZED toDate(timestamp),
             symbol String,
-            asset_type String,
+            asset_type LowCardinality(String),
             runner_name String,
             open Float64,
             high Float64,
@@ -364,7 +629,7 @@ class ClickHouseDataLayer(DataLayerInterface):
             timestamp DateTime64(3),
             date Date MATERIALIZED toDate(timestamp),
             symbol String,
-            asset_type String,
+            asset_type LowCardinality(String),
             timeframe String,
             open Float64,
             high Float64,
@@ -385,8 +650,8 @@ class ClickHouseDataLayer(DataLayerInterface):
             date Date MATERIALIZED toDate(timestamp),
             signal_id String,
             symbol String,
-            asset_type String,
-            strategy String,
+            asset_type LowCardinality(String),
+            strategy LowCardinality(String),
             action String,
             price Float64,
             quantity UInt32,
@@ -408,7 +673,7 @@ class ClickHouseDataLayer(DataLayerInterface):
             underlying String,
             expiry_date Date,
             strike Float64,
-            option_type String,
+            option_type LowCardinality(String),
             ltp Float64,
             bid Float64,
             ask Float64,
@@ -432,7 +697,7 @@ class ClickHouseDataLayer(DataLayerInterface):
         CREATE TABLE IF NOT EXISTS strategy_performance (
             timestamp DateTime64(3),
             date Date MATERIALIZED toDate(timestamp),
-            strategy String,
+            strategy LowCardinality(String),
             symbol String,
             total_trades UInt32,
             winning_trades UInt32,
@@ -466,6 +731,42 @@ class ClickHouseDataLayer(DataLayerInterface):
             except Exception as e:
                 self.logger.error(f"Error creating table: {e}")
                 raise
+        
+        # Bring tables created before the LowCardinality change up to date
+        await self._migrate_low_cardinality_columns()
+    
+    async def _migrate_low_cardinality_columns(self):
+        """
+        Convert plain String columns listed in _LOW_CARDINALITY_COLUMNS to
+        LowCardinality(String) on tables created with the older schema.
+        """
+        try:
+            result = self.client.query(
+                """
+                SELECT table, name 
+                FROM system.columns 
+                WHERE database = %(database)s 
+                AND type = 'String'
+                """,
+                parameters={'database': self.database}
+            )
+            
+            for table, column in result.result_rows:
+                if column not in _LOW_CARDINALITY_COLUMNS.get(table, ()):
+                    continue
+                
+                try:
+                    self.client.command(
+                        f"ALTER TABLE {table} MODIFY COLUMN {column} LowCardinality(String)"
+                    )
+                    self.logger.info(f"✅ Converted {table}.{column} to LowCardinality(String)")
+                except Exception as column_error:
+                    # Sorting key columns cannot be altered on some server versions
+                    self.logger.warning(f"Could not convert {table}.{column} to LowCardinality: {column_error}")
+                    
+        except Exception as e:
+            self.logger.error(f"Error checking LowCardinality migration: {e}")
+            # Don't fail initialization, just log the error
     
     async def store_market_data(self, symbol: str, asset_type: str,
                                data: pd.DataFrame, runner_name: str) -> bool:
@@ -484,31 +785,18 @@ class ClickHouseDataLayer(DataLayerInterface):
             if 'timestamp' not in data_copy.columns:
                 data_copy['timestamp'] = get_current_time()
             
-            # Convert timestamps to UTC for storage (ClickHouse DateTime is UTC)
+            # Convert timestamps to UTC for storage (ClickHouse DateTime is UTC).
+            # utc=True converts aware values and treats naive values as UTC in
+            # a single vectorized pass.
             if 'timestamp' in data_copy.columns:
-                data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp']).apply(
-                    lambda dt: to_utc(dt) if dt.tzinfo else to_utc(to_ist(dt))
-                )
+                data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp'], utc=True)
             
             # Fill missing columns with defaults
-            required_columns = [
-                'open', 'high', 'low', 'close', 'ltp', 'volume', 'turnover',
-                'price_change', 'price_change_pct', 'volatility',
-                'bid_price', 'ask_price', 'bid_size', 'ask_size', 'metadata'
-            ]
-            
-            for col in required_columns:
+            for col, default in _MARKET_DATA_DEFAULTS.items():
                 if col not in data_copy.columns:
-                    if col in ['metadata']:
-                        data_copy[col] = ''
-                    elif col in ['bid_size', 'ask_size', 'volume']:
-                        data_copy[col] = 0
-                    else:
-                        data_copy[col] = 0.0
+                    data_copy[col] = default
             
-            # Insert data using thread-local client
-            client = self._get_thread_client()
-            client.insert_df('market_data', data_copy)
+            await self._run('insert_df', 'market_data', data_copy)
             
             self.logger.debug(f"Stored {len(data_copy)} market data records for {symbol}")
             return True
@@ -523,19 +811,21 @@ class ClickHouseDataLayer(DataLayerInterface):
                              limit: Optional[int] = None) -> pd.DataFrame:
         """Retrieve market data from ClickHouse."""
         try:
-            query = "SELECT * FROM market_data WHERE symbol = %(symbol)s"
+            # market_data is wide, so filter in PREWHERE to read only the
+            # key columns before fetching the remaining columns
+            query = "SELECT * FROM market_data PREWHERE symbol = {symbol:String}"
             params = {'symbol': symbol}
             
             if start_time:
                 # Convert IST to UTC for querying
                 start_utc = to_utc(start_time) if start_time.tzinfo else to_utc(to_ist(start_time))
-                query += " AND timestamp >= %(start_time)s"
+                query += " AND timestamp >= {start_time:DateTime64(3)}"
                 params['start_time'] = start_utc
             
             if end_time:
                 # Convert IST to UTC for querying
                 end_utc = to_utc(end_time) if end_time.tzinfo else to_utc(to_ist(end_time))
-                query += " AND timestamp <= %(end_time)s"
+                query += " AND timestamp <= {end_time:DateTime64(3)}"
                 params['end_time'] = end_utc
             
             query += " ORDER BY timestamp DESC"
@@ -543,9 +833,7 @@ class ClickHouseDataLayer(DataLayerInterface):
             if limit:
                 query += f" LIMIT {limit}"
             
-            # Use thread-local client
-            client = self._get_thread_client()
-            result = client.query_df(query, parameters=params)
+            result = await self._run('query_df', query, parameters=params)
             
             if not result.empty:
                 # Convert timestamps back to IST for display
@@ -565,14 +853,12 @@ class ClickHouseDataLayer(DataLayerInterface):
         try:
             query = """
             SELECT * FROM market_data 
-            WHERE symbol = %(symbol)s 
+            PREWHERE symbol = {symbol:String} 
             ORDER BY timestamp DESC 
             LIMIT 1
             """
             
-            # Use thread-local client
-            client = self._get_thread_client()
-            result = client.query_df(query, parameters={'symbol': symbol})
+            result = await self._run('query_df', query, parameters={'symbol': symbol})
             
             if not result.empty:
                 # Convert timestamp to IST
@@ -593,21 +879,17 @@ class ClickHouseDataLayer(DataLayerInterface):
             if data.empty:
                 return True
             
-            data_copy = data.copy()
-            data_copy['symbol'] = symbol
-            data_copy['asset_type'] = asset_type
-            data_copy['timeframe'] = timeframe
-            
-            # Ensure required columns
-            required_columns = ['open', 'high', 'low', 'close', 'volume', 'turnover']
-            for col in required_columns:
-                if col not in data_copy.columns:
-                    if col in ['volume']:
-                        data_copy[col] = 0
-                    elif col in ['turnover']:
-                        data_copy[col] = 0.0
-                    else:
-                        data_copy[col] = data_copy.get('close', 0.0)
+            # Add identifying and missing required columns in one assign
+            # (one new frame) instead of inserting them one at a time
+            close = data.get('close', 0.0)
+            fill = {'open': close, 'high': close, 'low': close, 'close': close,
+                    'volume': 0, 'turnover': 0.0}
+            data_copy = data.assign(
+                symbol=symbol,
+                asset_type=asset_type,
+                timeframe=timeframe,
+                **{col: value for col, value in fill.items() if col not in data.columns}
+            )
             
             # Convert timestamps to UTC for storage (ClickHouse DateTime is UTC)
             if 'timestamp' in data_copy.columns:
@@ -616,13 +898,9 @@ class ClickHouseDataLayer(DataLayerInterface):
                     data_copy['timestamp'] = data_copy.index
                 
                 # Convert to UTC for storage
-                data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp']).apply(
-                    lambda dt: to_utc(dt) if dt.tzinfo else to_utc(to_ist(dt))
-                )
+                data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp'], utc=True)
             
-            # Use thread-local client
-            client = self._get_thread_client()
-            client.insert_df('historical_data', data_copy)
+            await self._run('insert_df', 'historical_data', data_copy)
             
             self.logger.debug(f"Stored {len(data_copy)} historical records for {symbol}")
             return True
@@ -648,10 +926,10 @@ class ClickHouseDataLayer(DataLayerInterface):
             
             query = """
             SELECT * FROM historical_data 
-            WHERE symbol = %(symbol)s 
-            AND timeframe = %(timeframe)s
-            AND timestamp >= %(start_date)s
-            AND timestamp <= %(end_date)s
+            WHERE symbol = {symbol:String} 
+            AND timeframe = {timeframe:String}
+            AND timestamp >= {start_date:DateTime64(3)}
+            AND timestamp <= {end_date:DateTime64(3)}
             ORDER BY timestamp ASC
             """
             
@@ -662,9 +940,7 @@ class ClickHouseDataLayer(DataLayerInterface):
                 'end_date': end_utc
             }
             
-            # Use thread-local client
-            client = self._get_thread_client()
-            result = client.query_df(query, parameters=params)
+            result = await self._run('query_df', query, parameters=params)
             
             # Convert timestamps back to IST for display
             if not result.empty and 'timestamp' in result.columns:
@@ -707,10 +983,13 @@ class ClickHouseDataLayer(DataLayerInterface):
                 'metadata': signal_data.get('metadata', '')
             }
             
-            # Use thread-local client to avoid concurrent query errors
-            client = self._get_thread_client()
-            client.insert('trading_signals', [list(data_dict.values())],
-                         column_names=list(data_dict.keys()))
+            await self._run('insert', 'trading_signals', [list(data_dict.values())],
+                            column_names=list(data_dict.keys()))
+            
+            # Invalidate cached get_last_signal results for this symbol/strategy
+            version_key = (data_dict['symbol'], data_dict['strategy'])
+            with self._last_signal_lock:
+                self._signal_versions[version_key] = self._signal_versions.get(version_key, 0) + 1
             
             self.logger.debug(f"Stored signal for {signal_data.get('symbol')}")
             return True
@@ -725,53 +1004,88 @@ class ClickHouseDataLayer(DataLayerInterface):
                          end_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Retrieve trading signals."""
         try:
-            query = "SELECT * FROM trading_signals WHERE 1=1"
-            params = {}
-            
-            if symbol:
-                query += " AND symbol = %(symbol)s"
-                params['symbol'] = symbol
-            
-            if strategy:
-                query += " AND strategy = %(strategy)s"
-                params['strategy'] = strategy
-            
-            if start_time:
-                # Convert IST to UTC for querying
-                start_utc = to_utc(start_time) if start_time.tzinfo else to_utc(to_ist(start_time))
-                query += " AND timestamp >= %(start_time)s"
-                params['start_time'] = start_utc
-            
-            if end_time:
-                # Convert IST to UTC for querying
-                end_utc = to_utc(end_time) if end_time.tzinfo else to_utc(to_ist(end_time))
-                query += " AND timestamp <= %(end_time)s"
-                params['end_time'] = end_utc
-            
-            query += " ORDER BY timestamp DESC"
-            
-            # Use thread-local client to avoid concurrent query errors
-            client = self._get_thread_client()
-            result = client.query_df(query, parameters=params)
-            
-            # Convert timestamps back to IST
-            if not result.empty and 'timestamp' in result.columns:
-                result['timestamp'] = pd.to_datetime(result['timestamp']).apply(to_ist)
-            
-            # Convert to list of dicts
-            signals = result.to_dict('records')
-            
-            # Add 'id' field as alias for 'signal_id' for backward compatibility
-            for signal in signals:
-                if 'signal_id' in signal and 'id' not in signal:
-                    signal['id'] = signal['signal_id']
-            
-            return signals
+            return [signal async for signal in self.iter_signals(
+                symbol=symbol, strategy=strategy,
+                start_time=start_time, end_time=end_time
+            )]
             
         except Exception as e:
             self.logger.error(f"Error retrieving signals: {e}")
             return []
     
+    async def iter_signals(self, symbol: Optional[str] = None,
+                          strategy: Optional[str] = None,
+                          start_time: Optional[datetime] = None,
+                          end_time: Optional[datetime] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Stream trading signals block by block.
+        
+        Rows are read with query_row_block_stream and yielded as they arrive,
+        so large result sets are never fully materialized. The pooled client
+        is held until the iteration finishes or the generator is closed.
+        Query errors, including ones raised mid-stream, propagate to the
+        caller.
+        
+        Args:
+            symbol: Filter by symbol
+            strategy: Filter by strategy name
+            start_time: Start datetime for signals
+            end_time: End datetime for signals
+            
+        Yields:
+            Signal dictionaries, newest first
+        """
+        params = {}
+        
+        if symbol:
+            params['symbol'] = symbol
+        
+        if strategy:
+            params['strategy'] = strategy
+        
+        if start_time:
+            # Convert IST to UTC for querying
+            params['start_time'] = to_utc(start_time) if start_time.tzinfo else to_utc(to_ist(start_time))
+        
+        if end_time:
+            # Convert IST to UTC for querying
+            params['end_time'] = to_utc(end_time) if end_time.tzinfo else to_utc(to_ist(end_time))
+        
+        query = _SIGNALS_QUERIES[frozenset(params)]
+        
+        async with self._pool_slots():
+            # Holding a slot guarantees an idle or creatable client, so the
+            # checkout never waits on the pool
+            client = await asyncio.to_thread(self._checkout)
+            try:
+                stream = await asyncio.to_thread(
+                    client.query_row_block_stream, query, parameters=params
+                )
+                with stream:
+                    column_names = stream.source.column_names
+                    blocks = iter(stream)
+                    
+                    while True:
+                        block = await asyncio.to_thread(next, blocks, None)
+                        if block is None:
+                            break
+                        
+                        for row in block:
+                            signal = dict(zip(column_names, row))
+                            
+                            # Convert timestamp back to IST
+                            if 'timestamp' in signal:
+                                signal['timestamp'] = to_ist(signal['timestamp'])
+                            
+                            # Add 'id' field as alias for 'signal_id' for backward compatibility
+                            if 'signal_id' in signal and 'id' not in signal:
+                                signal['id'] = signal['signal_id']
+                            
+                            yield signal
+                            
+            finally:
+                self._checkin(client)
+    
     async def get_last_signal(self, symbol: str, strategy: str, 
                              since: Optional[datetime] = None) -> Optional[Dict[str, Any]]:
         """
@@ -786,44 +1100,68 @@ class ClickHouseDataLayer(DataLayerInterface):
             Dictionary containing last signal data or None if no signal found
         """
         try:
-            query = """
-                SELECT * FROM trading_signals 
-                WHERE symbol = %(symbol)s 
-                AND strategy = %(strategy)s
-            """
+            cache_key = (symbol, strategy, since)
+            with self._last_signal_lock:
+                version = self._signal_versions.get((symbol, strategy), 0)
+                cached = self._last_signal_cache.get(cache_key)
+                if cached and cached[0] == version and cached[1] > time.monotonic():
+                    self._last_signal_cache.move_to_end(cache_key)
+                    return dict(cached[2]) if cached[2] else None
+            
             params = {'symbol': symbol, 'strategy': strategy}
             
             if since:
                 # Convert IST to UTC for querying
-                since_utc = to_utc(since) if since.tzinfo else to_utc(to_ist(since))
-                query += " AND timestamp >= %(since)s"
-                params['since'] = since_utc
+                params['since'] = to_utc(since) if since.tzinfo else to_utc(to_ist(since))
             
-            query += " ORDER BY timestamp DESC LIMIT 1"
+            query = _LAST_SIGNAL_QUERIES[frozenset(params)]
             
-            # Use thread-local client to avoid concurrent query errors
-            client = self._get_thread_client()
-            result = client.query_df(query, parameters=params)
+            # Single row: read it directly rather than through a DataFrame
+            result = await self._run('query', query, parameters=params)
             
-            if result.empty:
+            if not result.result_rows:
+                self._cache_last_signal(cache_key, version, None)
                 return None
             
-            # Convert timestamp back to IST
-            if 'timestamp' in result.columns:
-                result['timestamp'] = pd.to_datetime(result['timestamp']).apply(to_ist)
+            signal = dict(zip(result.column_names, result.result_rows[0]))
             
-            signal = result.to_dict('records')[0]
+            # Convert timestamp back to IST
+            if 'timestamp' in signal:
+                signal['timestamp'] = to_ist(signal['timestamp'])
             
             # Add 'id' field as alias for 'signal_id' for backward compatibility
             if 'signal_id' in signal and 'id' not in signal:
                 signal['id'] = signal['signal_id']
             
+            self._cache_last_signal(cache_key, version, dict(signal))
             return signal
             
         except Exception as e:
             self.logger.error(f"Error retrieving last signal for {symbol}/{strategy}: {e}")
             return None
     
+    def _cache_last_signal(self, cache_key: tuple, version: int,
+                           signal: Optional[Dict[str, Any]]):
+        """
+        Cache a get_last_signal result.
+        
+        The entry is dropped if a signal for the same (symbol, strategy) was
+        stored while the query was in flight, i.e. the version has moved on.
+        """
+        if self.last_signal_cache_ttl <= 0:
+            return
+        
+        with self._last_signal_lock:
+            if self._signal_versions.get(cache_key[:2], 0) != version:
+                return
+            
+            expires_at = time.monotonic() + self.last_signal_cache_ttl
+            self._last_signal_cache[cache_key] = (version, expires_at, signal)
+            self._last_signal_cache.move_to_end(cache_key)
+            
+            while len(self._last_signal_cache) > _LAST_SIGNAL_CACHE_SIZE:
+                self._last_signal_cache.popitem(last=False)
+    
     async def store_options_data(self, underlying: str, expiry_date: str,
                                 data: pd.DataFrame) -> bool:
         """Store options chain data."""
@@ -831,36 +1169,25 @@ class ClickHouseDataLayer(DataLayerInterface):
             if data.empty:
                 return True
             
-            data_copy = data.copy()
+            # Shallow copy: new and replaced columns are added to the wrapper
+            # only, so the caller's frame is untouched and no column data is copied
+            data_copy = data.copy(deep=False)
             data_copy['underlying'] = underlying
             data_copy['expiry_date'] = expiry_date
             
             if 'timestamp' not in data_copy.columns:
-                data_copy['timestamp'] = get_current_time()
-            
-            # Convert timestamps to UTC for storage
-            if 'timestamp' in data_copy.columns:
-                data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp']).apply(
-                    lambda dt: to_utc(dt) if dt.tzinfo else to_utc(to_ist(dt))
-                )
+                # Single snapshot time, converted to UTC once for all rows
+                data_copy['timestamp'] = to_utc(get_current_time())
+            else:
+                # Convert timestamps to UTC for storage
+                data_copy['timestamp'] = pd.to_datetime(data_copy['timestamp'], utc=True)
             
             # Fill missing columns
-            required_columns = [
-                'strike', 'option_type', 'ltp', 'bid', 'ask', 'volume',
-                'open_interest', 'delta', 'gamma', 'theta', 'vega',
-                'implied_volatility', 'moneyness', 'time_to_expiry'
-            ]
-            
-            for col in required_columns:
+            for col, default in _OPTIONS_DATA_DEFAULTS.items():
                 if col not in data_copy.columns:
-                    if col == 'option_type':
-                        data_copy[col] = 'CE'
-                    elif col in ['volume', 'open_interest']:
-                        data_copy[col] = 0
-                    else:
-                        data_copy[col] = 0.0
+                    data_copy[col] = default
             
-            self.client.insert_df('options_data', data_copy)
+            await self._run('insert_df', 'options_data', data_copy)
             
             self.logger.debug(f"Stored options data for {underlying}")
             return True
@@ -874,8 +1201,8 @@ class ClickHouseDataLayer(DataLayerInterface):
         try:
             query = """
             SELECT * FROM options_data 
-            WHERE underlying = %(underlying)s 
-            AND expiry_date = %(expiry_date)s
+            PREWHERE underlying = {underlying:String} 
+            AND expiry_date = {expiry_date:Date}
             ORDER BY strike ASC, option_type ASC
             """
             
@@ -884,7 +1211,7 @@ class ClickHouseDataLayer(DataLayerInterface):
                 'expiry_date': expiry_date
             }
             
-            result = self.client.query_df(query, parameters=params)
+            result = await self._run('query_df', query, parameters=params)
             
             # Convert timestamps back to IST
             if not result.empty and 'timestamp' in result.columns:
@@ -925,8 +1252,8 @@ class ClickHouseDataLayer(DataLayerInterface):
                 'metadata': performance_data.get('metadata', '')
             }
             
-            self.client.insert('strategy_performance', [list(data_dict.values())],
-                             column_names=list(data_dict.keys()))
+            await self._run('insert', 'strategy_performance', [list(data_dict.values())],
+                            column_names=list(data_dict.keys()))
             
             return True
             
@@ -939,39 +1266,23 @@ class ClickHouseDataLayer(DataLayerInterface):
                                     days: int = 30) -> Dict[str, Any]:
         """Get performance summary."""
         try:
-            query = """
-            SELECT 
-                strategy,
-                symbol,
-                sum(total_trades) as total_trades,
-                sum(winning_trades) as winning_trades,
-                sum(losing_trades) as losing_trades,
-                sum(total_pnl) as total_pnl,
-                max(max_drawdown) as max_drawdown,
-                avg(sharpe_ratio) as avg_sharpe_ratio,
-                avg(win_rate) as avg_win_rate
-            FROM strategy_performance 
-            WHERE timestamp >= %(start_date)s
-            """
-            
+            now = get_current_time()
             params = {
-                'start_date': get_current_time() - timedelta(days=days)
+                'start_date': now - timedelta(days=days)
             }
             
             if strategy:
-                query += " AND strategy = %(strategy)s"
                 params['strategy'] = strategy
             
             if symbol:
-                query += " AND symbol = %(symbol)s"
                 params['symbol'] = symbol
             
-            query += " GROUP BY strategy, symbol"
+            query = _PERFORMANCE_SUMMARY_QUERIES[frozenset(params)]
             
-            result = self.client.query_df(query, parameters=params)
+            result = await self._run('query', query, parameters=params)
             
-            if not result.empty:
-                return result.to_dict('records')[0]
+            if result.result_rows:
+                return dict(zip(result.column_names, result.result_rows[0]))
             
             return {}
             
@@ -983,9 +1294,9 @@ class ClickHouseDataLayer(DataLayerInterface):
         """Execute a custom query."""
         try:
             if parameters:
-                result = self.client.query_df(query, parameters=parameters)
+                result = await self._run('query_df', query, parameters=parameters)
             else:
-                result = self.client.query_df(query)
+                result = await self._run('query_df', query)
             
             return result
             
@@ -997,27 +1308,21 @@ class ClickHouseDataLayer(DataLayerInterface):
         """Check the health of ClickHouse."""
         try:
             # Basic connectivity test
-            result = self.client.query("SELECT 1").result_rows
+            result = (await self._run('query', "SELECT 1")).result_rows
             
             # Get system information
-            system_info = self.client.query("""
+            system_info = (await self._run('query', """
                 SELECT 
                     name, 
                     value 
                 FROM system.settings 
                 WHERE name IN ('max_memory_usage', 'max_execution_time')
-            """).result_rows
+            """)).result_rows
             
             # Get table sizes
-            table_sizes = self.client.query(f"""
-                SELECT 
-                    table,
-                    formatReadableSize(sum(bytes)) as size,
-                    sum(rows) as rows
-                FROM system.parts 
-                WHERE database = '{self.database}'
-                GROUP BY table
-            """).result_rows
+            table_sizes = (await self._run(
+                'query', _TABLE_SIZES_QUERY, parameters={'database': self.database}
+            )).result_rows
             
             return {
                 'status': 'healthy' if result and result[0][0] == 1 else 'unhealthy',
@@ -1037,11 +1342,8 @@ class ClickHouseDataLayer(DataLayerInterface):
         """Optimize ClickHouse storage."""
         try:
             # Optimize tables
-            tables = ['market_data', 'historical_data', 'trading_signals', 
-                     'options_data', 'strategy_performance']
-            
-            for table in tables:
-                self.client.command(f"OPTIMIZE TABLE {table}")
+            if not await self._run_per_table('optimization', _OPTIMIZE_COMMANDS):
+                return False
             
             self.logger.info("Storage optimization completed")
             return True
@@ -1056,29 +1358,28 @@ class ClickHouseDataLayer(DataLayerInterface):
             if not batch_data:
                 return True
             
-            # Convert to DataFrame for efficient insertion
-            df = pd.DataFrame(batch_data)
+            now = get_current_time()
+            defaults = _MARKET_DATA_BATCH_DEFAULTS.items()
             
-            # Fill missing columns
-            required_columns = [
-                'timestamp', 'symbol', 'asset_type', 'runner_name',
-                'open', 'high', 'low', 'close', 'ltp', 'volume', 'turnover',
-                'price_change', 'price_change_pct', 'volatility',
-                'bid_price', 'ask_price', 'bid_size', 'ask_size', 'metadata'
-            ]
-            
-            for col in required_columns:
-                if col not in df.columns:
-                    if col == 'timestamp':
-                        df[col] = get_current_time()
-                    elif col in ['metadata']:
-                        df[col] = ''
-                    elif col in ['bid_size', 'ask_size', 'volume']:
-                        df[col] = 0
-                    else:
-                        df[col] = 0.0
-            
-            self.client.insert_df('market_data', df)
+            if PYARROW_AVAILABLE:
+                # Columnar Arrow table: buffers go to the server as-is,
+                # without per-value conversion in the client
+                columns = {'timestamp': [record.get('timestamp', now) for record in batch_data]}
+                for col, default in defaults:
+                    columns[col] = [record.get(col, default) for record in batch_data]
+                
+                await self._run('insert_arrow', 'market_data', pa.Table.from_pydict(columns))
+            else:
+                # Build rows directly from the records instead of going through a
+                # DataFrame, which the client would only convert back to rows
+                rows = [
+                    [record.get('timestamp', now),
+                     *[record.get(col, default) for col, default in defaults]]
+                    for record in batch_data
+                ]
+                
+                await self._run('insert', 'market_data', rows,
+                                column_names=_MARKET_DATA_BATCH_COLUMNS)
             
             self.logger.debug(f"Batch stored {len(batch_data)} market data records")
             return True
@@ -1090,13 +1391,14 @@ class ClickHouseDataLayer(DataLayerInterface):
     async def get_symbols_by_asset_type(self, asset_type: str) -> List[str]:
         """Get all symbols for a specific asset type."""
         try:
+            # Aggregate into a single set instead of a DISTINCT over raw rows
             query = """
-            SELECT DISTINCT symbol 
+            SELECT arrayJoin(groupUniqArray(symbol)) AS symbol 
             FROM market_data 
-            WHERE asset_type = %(asset_type)s
+            PREWHERE asset_type = {asset_type:String}
             """
             
-            result = self.client.query(query, parameters={'asset_type': asset_type})
+            result = await self._run('query', query, parameters={'asset_type': asset_type})
             return [row[0] for row in result.result_rows]
             
         except Exception as e:
@@ -1108,16 +1410,9 @@ class ClickHouseDataLayer(DataLayerInterface):
         try:
             cutoff_date = get_current_time() - timedelta(days=days_to_keep)
             
-            tables = ['market_data', 'historical_data', 'trading_signals', 
-                     'options_data', 'strategy_performance']
-            
-            for table in tables:
-                query = f"""
-                ALTER TABLE {table} 
-                DELETE WHERE timestamp < %(cutoff_date)s
-                """
-                
-                self.client.command(query, parameters={'cutoff_date': cutoff_date})
+            if not await self._run_per_table('cleanup', _CLEANUP_COMMANDS,
+                                             parameters={'cutoff_date': cutoff_date}):
+                return False
             
             self.logger.info(f"Cleaned up data older than {days_to_keep} days")
             return True
@@ -5,8 +5,12 @@ Provides a unified interface for creating and managing different data storage ba
 Supports ClickHouse, PostgreSQL, and Redis caching with intelligent fallbacks.
 """
 
+import asyncio
+import inspect
 import os
-from typing import Dict, List, Optional, Any, Union
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Set, Union
 import logging
 from enum import Enum
 
@@ -24,6 +28,140 @@ class DataStorageType(Enum):
     REDIS_CACHE = "redis_cache"
 
 
+@dataclass(frozen=True)
+class ClickHouseEnvConfig:
+    """ClickHouse connection defaults from CLICKHOUSE_* environment variables."""
+    host: str = 'localhost'
+    port: int = 8123
+    database: str = 'alphastock'
+    username: str = 'default'
+    password: str = ''
+    pool_size: int = 10
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def from_env(cls) -> 'ClickHouseEnvConfig':
+        """Read the environment once; later calls return the same instance."""
+        return cls(
+            host=os.getenv('CLICKHOUSE_HOST', 'localhost'),
+            port=int(os.getenv('CLICKHOUSE_PORT', '8123')),
+            database=os.getenv('CLICKHOUSE_DATABASE', 'alphastock'),
+            username=os.getenv('CLICKHOUSE_USERNAME', 'default'),
+            password=os.getenv('CLICKHOUSE_PASSWORD', ''),
+            pool_size=int(os.getenv('CLICKHOUSE_POOL_SIZE', '10'))
+        )
+
+
+@dataclass(frozen=True)
+class PostgreSQLEnvConfig:
+    """PostgreSQL connection defaults from POSTGRES_* environment variables."""
+    host: str = 'localhost'
+    port: int = 5432
+    database: str = 'alphastock'
+    username: str = 'postgres'
+    password: str = ''
+    pool_size: int = 20
+    max_overflow: int = 30
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def from_env(cls) -> 'PostgreSQLEnvConfig':
+        """Read the environment once; later calls return the same instance."""
+        return cls(
+            host=os.getenv('POSTGRES_HOST', 'localhost'),
+            port=int(os.getenv('POSTGRES_PORT', '5432')),
+            database=os.getenv('POSTGRES_DATABASE', 'alphastock'),
+            username=os.getenv('POSTGRES_USERNAME', 'postgres'),
+            password=os.getenv('POSTGRES_PASSWORD', ''),
+            pool_size=int(os.getenv('POSTGRES_POOL_SIZE', '20')),
+            max_overflow=int(os.getenv('POSTGRES_MAX_OVERFLOW', '30'))
+        )
+
+
+@dataclass(frozen=True)
+class RedisEnvConfig:
+    """Redis connection defaults from REDIS_* environment variables."""
+    host: str = 'localhost'
+    port: int = 6379
+    db: int = 0
+    password: Optional[str] = None
+    max_connections: int = 20
+    refresh_concurrency: int = 8
+    socket_timeout: Optional[float] = 0.25
+    socket_connect_timeout: Optional[float] = 0.25
+    bulk_socket_timeout: Optional[float] = 10.0
+    retry_on_timeout: bool = False
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def from_env(cls) -> 'RedisEnvConfig':
+        """Read the environment once; later calls return the same instance."""
+        return cls(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', '6379')),
+            db=int(os.getenv('REDIS_DB', '0')),
+            password=os.getenv('REDIS_PASSWORD', None),
+            max_connections=int(os.getenv('REDIS_MAX_CONNECTIONS', '20')),
+            refresh_concurrency=int(os.getenv('CACHE_REFRESH_CONCURRENCY', '8')),
+            socket_timeout=float(os.getenv('REDIS_SOCKET_TIMEOUT', '0.25')),
+            socket_connect_timeout=float(os.getenv('REDIS_SOCKET_CONNECT_TIMEOUT', '0.25')),
+            bulk_socket_timeout=float(os.getenv('REDIS_BULK_SOCKET_TIMEOUT', '10')),
+            retry_on_timeout=os.getenv('REDIS_RETRY_ON_TIMEOUT', '0') == '1'
+        )
+
+
+def _init_params(cls) -> frozenset:
+    """Names of the keyword arguments a backend's constructor accepts."""
+    return frozenset(inspect.signature(cls.__init__).parameters) - {'self'}
+
+
+# Constructor arguments accepted by each backend (including tuning knobs
+# without an environment variable); other config keys are ignored
+_CLICKHOUSE_KEYS = _init_params(ClickHouseDataLayer)
+_POSTGRESQL_KEYS = _init_params(PostgreSQLDataLayer)
+_REDIS_KEYS = _init_params(RedisCacheLayer)
+
+
+@dataclass(frozen=True)
+class CacheTTLPolicy:
+    """
+    Cache TTLs in seconds for each cached entity.
+    
+    Fast-moving data (latest ticks) can expire in seconds while slow-moving
+    data (symbol lists) is kept for hours.
+    """
+    market_data: int = 300
+    latest: int = 30
+    latest_local: int = 5               # in-process copy of latest ticks (0 disables)
+    signals: int = 1800
+    options_chain: int = 180
+    performance: int = 900
+    symbols_by_asset_type: int = 3600
+    negative: int = 30                  # empty market data / options chain results
+    
+    @classmethod
+    def from_config(cls, overrides: Optional[Dict[str, Any]] = None) -> 'CacheTTLPolicy':
+        """
+        Build a policy from CACHE_TTL_<ENTITY> environment variables,
+        with values from the configuration taking precedence.
+        
+        Args:
+            overrides: Entity name -> TTL mapping (e.g. the 'cache.ttl' config section)
+            
+        Returns:
+            CacheTTLPolicy instance
+        """
+        values = {}
+        for field in fields(cls):
+            env_value = os.getenv(f"CACHE_TTL_{field.name.upper()}")
+            if env_value is not None:
+                values[field.name] = int(env_value)
+            if overrides and field.name in overrides:
+                values[field.name] = int(overrides[field.name])
+        
+        return cls(**values)
+
+
 class HybridDataLayer(DataLayerInterface):
     """
     Hybrid data layer that combines primary storage with Redis caching.
@@ -33,41 +171,117 @@ class HybridDataLayer(DataLayerInterface):
     - Redis caching for performance
     - Intelligent fallbacks
     - Automatic cache invalidation
+    
+    Only built when caching is enabled; without a cache the factory returns
+    the primary storage itself. If the cache fails to initialize, its
+    methods fall through (reads go to primary storage, writes are skipped).
     """
     
+    # Shared by all instances; setup_logger is only called once at import
+    logger = setup_logger(name="HybridDataLayer")
+    
     def __init__(self, primary_storage: DataLayerInterface, 
-                 cache_layer: Optional[RedisCacheLayer] = None):
+                 cache_layer: RedisCacheLayer,
+                 ttl_policy: Optional[CacheTTLPolicy] = None):
         """
         Initialize hybrid data layer.
         
         Args:
             primary_storage: Primary data storage backend
-            cache_layer: Optional Redis cache layer
+            cache_layer: Redis cache layer
+            ttl_policy: Cache TTLs per entity (defaults to CacheTTLPolicy.from_config())
         """
         self.primary_storage = primary_storage
         self.cache_layer = cache_layer
-        self.logger = setup_logger(name="HybridDataLayer")
+        
+        # The cache layer may be shared (see create_redis_cache_layer); this
+        # instance owns one reference and must release it exactly once
+        self._cache_released = False
+        
+        # Bind uncached methods straight to primary storage, skipping a wrapper coroutine
+        for name in self._DELEGATED_METHODS:
+            setattr(self, name, getattr(primary_storage, name))
+        self.ttl_policy = ttl_policy or CacheTTLPolicy.from_config()
         self._initialized = False
+        
+        # Race cache and primary storage on signal reads (trades DB load for latency)
+        self.speculative_read = os.getenv('SPECULATIVE_READ', '0') == '1'
+        self._speculative_tasks: Set[asyncio.Task] = set()
+        
+        # Write-through cache updates running off the store path (see _bg)
+        self._bg_tasks: Set[asyncio.Task] = set()
+    
+    # Methods served by primary storage alone. Instances bind them directly in
+    # __init__; the class-level definitions below only satisfy DataLayerInterface.
+    _DELEGATED_METHODS = (
+        'store_historical_data', 'get_historical_data', 'get_performance_summary',
+        'execute_query', 'optimize_storage', 'cleanup_old_data',
+    )
+    
+    # Seconds a backend health check may take before it is reported as timed out
+    HEALTH_CHECK_TIMEOUT = 1.0
+    
+    # Cached reads derived from each stored entity: entity -> (key args -> key specs).
+    # Entries written through by the store itself are refreshed, not listed here.
+    _CACHE_DEPENDENCIES = {
+        'market_data': lambda symbol, asset_type: [
+            ('market_data', symbol, ''),   # recent window served by get_market_data
+            ('symbols', asset_type),       # the symbol may be new for its asset type
+        ],
+    }
+    
+    def _bg(self, coro):
+        """Run a non-essential cache write in the background; close() waits for it."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        task.add_done_callback(self._log_bg_error)
+    
+    def _log_bg_error(self, task: asyncio.Task):
+        """Log a background cache write that raised."""
+        if not task.cancelled() and task.exception() is not None:
+            self.logger.error(f"Background cache write failed: {task.exception()}")
+    
+    async def _release_cache(self):
+        """Release this instance's reference to the (shared) cache layer once."""
+        if self._cache_released:
+            return
+        self._cache_released = True
+        await self.cache_layer.close()
+    
+    async def _invalidate_for(self, entity: str, **kwargs):
+        """Evict cached reads that depend on a successfully stored entity."""
+        key_specs = self._CACHE_DEPENDENCIES[entity](**kwargs)
+        await self.cache_layer.invalidate_keys(key_specs)
     
     async def initialize(self) -> bool:
         """Initialize both primary storage and cache."""
         try:
-            # Initialize primary storage
-            primary_success = await self.primary_storage.initialize()
+            # Warm up primary storage and cache connections concurrently
+            primary_success, cache_success = await asyncio.gather(
+                self.primary_storage.initialize(),
+                self.cache_layer.initialize(),
+                return_exceptions=True
+            )
+            
+            if isinstance(primary_success, BaseException):
+                raise primary_success
+            
+            if isinstance(cache_success, BaseException):
+                self.logger.warning(f"Cache layer initialization raised: {cache_success}")
+                cache_success = False
+            
             if not primary_success:
                 self.logger.error("Failed to initialize primary storage")
+                await self._release_cache()
                 return False
             
-            # Initialize cache (optional)
-            cache_success = True
-            if self.cache_layer:
-                cache_success = await self.cache_layer.initialize()
-                if not cache_success:
-                    self.logger.warning("Failed to initialize cache layer, continuing without cache")
-                    self.cache_layer = None
+            if not cache_success:
+                # The uninitialized cache layer passes reads through and skips writes
+                self.logger.warning("Failed to initialize cache layer, continuing without cache")
             
             self._initialized = True
-            self.logger.info(f"Hybrid data layer initialized (cache: {'enabled' if self.cache_layer else 'disabled'})")
+            self.logger.info(f"Hybrid data layer initialized (cache: {'enabled' if cache_success else 'disabled'})")
             return True
             
         except Exception as e:
@@ -77,11 +291,13 @@ class HybridDataLayer(DataLayerInterface):
     async def close(self):
         """Close both primary storage and cache connections."""
         try:
+            # Let pending cache writes and speculative reads finish first
+            await asyncio.gather(*self._bg_tasks, *self._speculative_tasks, return_exceptions=True)
+            
             if self.primary_storage:
                 await self.primary_storage.close()
             
-            if self.cache_layer:
-                await self.cache_layer.close()
+            await self._release_cache()
             
             self._initialized = False
             self.logger.info("Hybrid data layer closed")
@@ -97,9 +313,15 @@ class HybridDataLayer(DataLayerInterface):
                 symbol, asset_type, data, runner_name
             )
             
-            # Cache the data if primary storage succeeded
-            if success and self.cache_layer:
-                await self.cache_layer.cache_market_data(symbol, data, asset_type)
+            # Invalidate dependent reads and cache the data if primary storage succeeded.
+            # Invalidation is awaited so a following read can't see the old window;
+            # the write-through itself runs in the background.
+            if success:
+                await self._invalidate_for('market_data', symbol=symbol, asset_type=asset_type)
+                self._bg(self.cache_layer.cache_market_data(
+                    symbol, data, asset_type,
+                    ttl=self.ttl_policy.market_data, latest_ttl=self.ttl_policy.latest
+                ))
             
             return success
             
@@ -108,55 +330,72 @@ class HybridDataLayer(DataLayerInterface):
             return False
     
     async def get_market_data(self, symbol: str, start_time=None, end_time=None, limit=None):
-        """Get market data with cache-first approach."""
+        """Get market data with stale-while-revalidate caching of recent data."""
         try:
-            # Try cache first for recent data
-            if self.cache_layer and not start_time and not end_time and (not limit or limit <= 100):
-                cached_data = await self.cache_layer.get_cached_market_data(symbol)
-                if cached_data is not None and not cached_data.empty:
-                    self.logger.debug(f"Served market data for {symbol} from cache")
-                    return cached_data
-            
-            # Fallback to primary storage
-            data = await self.primary_storage.get_market_data(symbol, start_time, end_time, limit)
-            
-            # Cache the result for future use
-            if self.cache_layer and data is not None and not data.empty:
-                await self.cache_layer.cache_market_data(symbol, data)
+            # Recent data is served from cache; stale entries refresh in the background
+            if not start_time and not end_time and (not limit or limit <= 100):
+                return await self.cache_layer.get_or_set_swr(
+                    'market_data', (symbol, ''),
+                    lambda: self.primary_storage.get_market_data(symbol, start_time, end_time, limit),
+                    ttl=self.ttl_policy.market_data,
+                    data_type='dataframe',
+                    downcast=True,
+                    negative_ttl=self.ttl_policy.negative
+                )
             
-            return data
+            # Range queries go straight to primary storage
+            return await self.primary_storage.get_market_data(symbol, start_time, end_time, limit)
             
         except Exception as e:
             self.logger.error(f"Error getting market data: {e}")
             return None
     
-    async def get_latest_market_data(self, symbol: str):
-        """Get latest market data with cache-first approach."""
+    async def get_market_data_many(self, symbols: List[str], limit=None) -> Dict[str, Any]:
+        """
+        Get recent market data for many symbols.
+        
+        Cached frames are read with one MGET; the misses are loaded
+        concurrently through get_market_data, which also caches them.
+        
+        Args:
+            symbols: Symbols to fetch
+            limit: Row limit for symbols loaded from primary storage
+            
+        Returns:
+            Symbol -> DataFrame
+        """
         try:
-            # Try cache first
-            if self.cache_layer:
-                cached_data = await self.cache_layer.get_cached_latest_data(symbol)
-                if cached_data is not None:
-                    self.logger.debug(f"Served latest data for {symbol} from cache")
-                    return cached_data
+            result = await self.cache_layer.get_cached_market_data_many(symbols)
             
-            # Fallback to primary storage
-            data = await self.primary_storage.get_latest_market_data(symbol)
+            missing = [symbol for symbol in symbols if symbol not in result]
+            if missing:
+                frames = await asyncio.gather(
+                    *(self.get_market_data(symbol, limit=limit) for symbol in missing)
+                )
+                result.update(zip(missing, frames))
             
-            # Cache the result
-            if self.cache_layer and data is not None:
-                # Convert Series to DataFrame for caching
-                import pandas as pd
-                df = pd.DataFrame([data])
-                await self.cache_layer.cache_market_data(symbol, df)
+            return result
             
-            return data
+        except Exception as e:
+            self.logger.error(f"Error getting market data for {len(symbols)} symbols: {e}")
+            return {}
+    
+    async def get_latest_market_data(self, symbol: str):
+        """Get latest market data with stale-while-revalidate caching."""
+        try:
+            return await self.cache_layer.get_or_set_swr(
+                'latest_data', (symbol,),
+                lambda: self.primary_storage.get_latest_market_data(symbol),
+                ttl=self.ttl_policy.latest,
+                data_type='series',
+                local_ttl=self.ttl_policy.latest_local
+            )
             
         except Exception as e:
             self.logger.error(f"Error getting latest market data: {e}")
             return None
     
-    # Delegate other methods to primary storage
+    # Delegate other methods to primary storage (shadowed per instance, see _DELEGATED_METHODS)
     async def store_historical_data(self, symbol: str, asset_type: str, data, timeframe: str) -> bool:
         return await self.primary_storage.store_historical_data(symbol, asset_type, data, timeframe)
     
@@ -165,42 +404,65 @@ class HybridDataLayer(DataLayerInterface):
     
     async def store_signal(self, signal_data: Dict[str, Any]) -> bool:
         success = await self.primary_storage.store_signal(signal_data)
-        if success and self.cache_layer:
-            await self.cache_layer.cache_signal(signal_data)
+        if success:
+            self._bg(self.cache_layer.cache_signal(signal_data, ttl=self.ttl_policy.signals))
         return success
     
     async def get_signals(self, symbol=None, strategy=None, start_time=None, end_time=None):
         # Try cache for symbol-specific recent signals
-        if self.cache_layer and symbol and not start_time and not end_time:
+        if symbol and not start_time and not end_time:
+            if self.speculative_read:
+                return await self._get_signals_speculative(symbol, strategy)
+            
             cached_signals = await self.cache_layer.get_cached_signals_for_symbol(symbol)
             if cached_signals:
                 return cached_signals
         
         return await self.primary_storage.get_signals(symbol, strategy, start_time, end_time)
     
+    async def _get_signals_speculative(self, symbol: str, strategy=None):
+        """
+        Query cache and primary storage at the same time.
+        
+        A non-empty cache result is returned as soon as it arrives; otherwise
+        the already running primary query is awaited, so a miss costs
+        max(t_cache, t_db) instead of their sum. A primary query that lost
+        the race is left to finish in the background rather than cancelled,
+        so it can return its pooled connection.
+        """
+        db_task = asyncio.create_task(self.primary_storage.get_signals(symbol, strategy, None, None))
+        
+        cached_signals = await self.cache_layer.get_cached_signals_for_symbol(symbol)
+        if cached_signals:
+            self._speculative_tasks.add(db_task)
+            db_task.add_done_callback(self._speculative_tasks.discard)
+            return cached_signals
+        
+        return await db_task
+    
     async def store_options_data(self, underlying: str, expiry_date: str, data) -> bool:
         success = await self.primary_storage.store_options_data(underlying, expiry_date, data)
-        if success and self.cache_layer:
-            await self.cache_layer.cache_options_chain(underlying, expiry_date, data)
+        if success:
+            self._bg(self.cache_layer.cache_options_chain(
+                underlying, expiry_date, data, ttl=self.ttl_policy.options_chain
+            ))
         return success
     
     async def get_options_chain(self, underlying: str, expiry_date: str):
-        # Try cache first
-        if self.cache_layer:
-            cached_data = await self.cache_layer.get_cached_options_chain(underlying, expiry_date)
-            if cached_data is not None:
-                return cached_data
-        
-        data = await self.primary_storage.get_options_chain(underlying, expiry_date)
-        if data is not None and self.cache_layer:
-            await self.cache_layer.cache_options_chain(underlying, expiry_date, data)
-        
-        return data
+        return await self.cache_layer.get_or_set_swr(
+            'options', (underlying, expiry_date),
+            lambda: self.primary_storage.get_options_chain(underlying, expiry_date),
+            ttl=self.ttl_policy.options_chain,
+            data_type='dataframe',
+            negative_ttl=self.ttl_policy.negative
+        )
     
     async def store_performance_data(self, strategy: str, symbol: str, performance_data: Dict[str, Any]) -> bool:
         success = await self.primary_storage.store_performance_data(strategy, symbol, performance_data)
-        if success and self.cache_layer:
-            await self.cache_layer.cache_performance_data(strategy, symbol, performance_data)
+        if success:
+            self._bg(self.cache_layer.cache_performance_data(
+                strategy, symbol, performance_data, ttl=self.ttl_policy.performance
+            ))
         return success
     
     async def get_performance_summary(self, strategy=None, symbol=None, days: int = 30):
@@ -209,36 +471,56 @@ class HybridDataLayer(DataLayerInterface):
     async def execute_query(self, query: str, parameters=None):
         return await self.primary_storage.execute_query(query, parameters)
     
+    async def _probe(self, name: str, health_check) -> Dict[str, Any]:
+        """Run one backend health check, bounded by HEALTH_CHECK_TIMEOUT."""
+        try:
+            return await asyncio.wait_for(health_check(), timeout=self.HEALTH_CHECK_TIMEOUT)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"{name} health check timed out after {self.HEALTH_CHECK_TIMEOUT}s")
+            return {'status': 'timeout', 'error': f"no response within {self.HEALTH_CHECK_TIMEOUT}s"}
+    
     async def health_check(self) -> Dict[str, Any]:
-        primary_health = await self.primary_storage.health_check()
-        cache_health = {}
-        if self.cache_layer:
-            cache_health = await self.cache_layer.health_check()
+        # Probe both backends concurrently so a slow one doesn't add to the other
+        primary_health, cache_health = await asyncio.gather(
+            self._probe('Primary storage', self.primary_storage.health_check),
+            self._probe('Cache layer', self.cache_layer.health_check)
+        )
+        
+        healthy = (primary_health.get('status') == 'healthy'
+                   and cache_health.get('status') != 'timeout')
         
         return {
             'primary_storage': primary_health,
             'cache_layer': cache_health,
-            'overall_status': 'healthy' if primary_health.get('status') == 'healthy' else 'degraded'
+            'overall_status': 'healthy' if healthy else 'degraded'
         }
     
     async def optimize_storage(self) -> bool:
         return await self.primary_storage.optimize_storage()
     
     async def batch_store_market_data(self, batch_data: List[Dict[str, Any]]) -> bool:
-        return await self.primary_storage.batch_store_market_data(batch_data)
+        success = await self.primary_storage.batch_store_market_data(batch_data)
+        if success:
+            entries: Dict[tuple, List[Dict[str, Any]]] = {}
+            for record in batch_data:
+                entries.setdefault((record.get('symbol', ''), record.get('asset_type', '')), []).append(record)
+            
+            key_specs = []
+            for symbol, asset_type in entries:
+                key_specs.extend(self._CACHE_DEPENDENCIES['market_data'](symbol, asset_type))
+            await self.cache_layer.invalidate_keys(key_specs)
+            
+            self._bg(self.cache_layer.cache_market_data_batch(
+                entries, ttl=self.ttl_policy.market_data, latest_ttl=self.ttl_policy.latest
+            ))
+        return success
     
     async def get_symbols_by_asset_type(self, asset_type: str) -> List[str]:
-        # Try cache first
-        if self.cache_layer:
-            cached_symbols = await self.cache_layer.get_cached_symbols_by_asset_type(asset_type)
-            if cached_symbols is not None:
-                return cached_symbols
-        
-        symbols = await self.primary_storage.get_symbols_by_asset_type(asset_type)
-        if symbols and self.cache_layer:
-            await self.cache_layer.cache_symbols_by_asset_type(asset_type, symbols)
-        
-        return symbols
+        return await self.cache_layer.get_or_set_swr(
+            'symbols', (asset_type,),
+            lambda: self.primary_storage.get_symbols_by_asset_type(asset_type),
+            ttl=self.ttl_policy.symbols_by_asset_type
+        )
     
     async def cleanup_old_data(self, days_to_keep: int = 365) -> bool:
         return await self.primary_storage.cleanup_old_data(days_to_keep)
@@ -251,76 +533,92 @@ class DataLayerFactory:
     Supports multiple storage backends and configuration options.
     """
     
+    # Shared by all instances; setup_logger is only called once at import
+    logger = setup_logger(name="DataLayerFactory")
+    
+    # Config 'type' value -> primary storage type
+    _PRIMARY_TYPES = {
+        'clickhouse': DataStorageType.CLICKHOUSE,
+        'postgresql': DataStorageType.POSTGRESQL,
+    }
+    
+    # Primary storage type -> (config section, factory method name)
+    _PRIMARY_FACTORIES = {
+        DataStorageType.CLICKHOUSE: ('clickhouse', 'create_clickhouse_layer'),
+        DataStorageType.POSTGRESQL: ('postgresql', 'create_postgresql_layer'),
+    }
+    
+    # Cache config strings that disable caching
+    _CACHE_DISABLED = frozenset({'none', 'false', 'disabled'})
+    
     def __init__(self):
-        self.logger = setup_logger(name="DataLayerFactory")
+        # Redis cache layers shared per (host, port, db)
+        self._redis_layers: Dict[tuple, RedisCacheLayer] = {}
     
     def create_clickhouse_layer(self, **kwargs) -> ClickHouseDataLayer:
         """Create ClickHouse data layer."""
-        config = {
-            'host': os.getenv('CLICKHOUSE_HOST', 'localhost'),
-            'port': int(os.getenv('CLICKHOUSE_PORT', '8123')),
-            'database': os.getenv('CLICKHOUSE_DATABASE', 'alphastock'),
-            'username': os.getenv('CLICKHOUSE_USERNAME', 'default'),
-            'password': os.getenv('CLICKHOUSE_PASSWORD', ''),
-            'pool_size': int(os.getenv('CLICKHOUSE_POOL_SIZE', '10'))
-        }
+        config = asdict(ClickHouseEnvConfig.from_env())
         
         # Filter out unsupported keys from kwargs
-        valid_keys = {'host', 'port', 'database', 'username', 'password', 'pool_size'}
-        filtered_kwargs = {k: v for k, v in kwargs.items() if k in valid_keys}
-        config.update(filtered_kwargs)
+        config.update({k: v for k, v in kwargs.items() if k in _CLICKHOUSE_KEYS})
         
         return ClickHouseDataLayer(**config)
     
     def create_postgresql_layer(self, **kwargs) -> PostgreSQLDataLayer:
         """Create PostgreSQL data layer."""
-        config = {
-            'host': os.getenv('POSTGRES_HOST', 'localhost'),
-            'port': int(os.getenv('POSTGRES_PORT', '5432')),
-            'database': os.getenv('POSTGRES_DATABASE', 'alphastock'),
-            'username': os.getenv('POSTGRES_USERNAME', 'postgres'),
-            'password': os.getenv('POSTGRES_PASSWORD', ''),
-            'pool_size': int(os.getenv('POSTGRES_POOL_SIZE', '20')),
-            'max_overflow': int(os.getenv('POSTGRES_MAX_OVERFLOW', '30'))
-        }
-        config.update(kwargs)
+        config = asdict(PostgreSQLEnvConfig.from_env())
+        
+        # Filter out unsupported keys from kwargs
+        config.update({k: v for k, v in kwargs.items() if k in _POSTGRESQL_KEYS})
         
         return PostgreSQLDataLayer(**config)
     
     def create_redis_cache_layer(self, **kwargs) -> RedisCacheLayer:
-        """Create Redis cache layer."""
-        config = {
-            'host': os.getenv('REDIS_HOST', 'localhost'),
-            'port': int(os.getenv('REDIS_PORT', '6379')),
-            'db': int(os.getenv('REDIS_DB', '0')),
-            'password': os.getenv('REDIS_PASSWORD', None),
-            'max_connections': int(os.getenv('REDIS_MAX_CONNECTIONS', '20'))
-        }
-        config.update(kwargs)
+        """
+        Create Redis cache layer.
         
-        return RedisCacheLayer(**config)
+        Layers are shared per (host, port, db), so repeated calls reuse one
+        connection pool; the other settings of the first call win. Every
+        caller owns a reference and calls close() once - the pool is closed
+        when the last reference is released.
+        """
+        config = asdict(RedisEnvConfig.from_env())
+        
+        # Filter out unsupported keys from kwargs (e.g. decode_responses in
+        # config/database.json, which RedisCacheLayer always sets itself)
+        config.update({k: v for k, v in kwargs.items() if k in _REDIS_KEYS})
+        
+        key = (config['host'], config['port'], config['db'])
+        layer = self._redis_layers.get(key)
+        if layer is not None:
+            return layer.retain()
+        
+        layer = RedisCacheLayer(**config)
+        self._redis_layers[key] = layer
+        return layer
     
     def create_hybrid_layer(self, primary_type: DataStorageType = DataStorageType.CLICKHOUSE,
-                           enable_cache: bool = True, **kwargs) -> HybridDataLayer:
+                           enable_cache: bool = True, **kwargs) -> DataLayerInterface:
         """
         Create hybrid data layer with primary storage and optional caching.
         
         Args:
             primary_type: Primary storage type (ClickHouse or PostgreSQL)
             enable_cache: Whether to enable Redis caching
-            **kwargs: Additional configuration parameters
+            **kwargs: Additional configuration parameters ('clickhouse',
+                'postgresql', 'redis' and 'cache_ttl' sections)
             
         Returns:
-            HybridDataLayer instance
+            HybridDataLayer instance, or the primary storage itself when
+            caching is disabled or the cache layer could not be created
         """
         # Create primary storage
-        if primary_type == DataStorageType.CLICKHOUSE:
-            primary_storage = self.create_clickhouse_layer(**kwargs.get('clickhouse', {}))
-        elif primary_type == DataStorageType.POSTGRESQL:
-            primary_storage = self.create_postgresql_layer(**kwargs.get('postgresql', {}))
-        else:
+        if primary_type not in self._PRIMARY_FACTORIES:
             raise ValueError(f"Unsupported primary storage type: {primary_type}")
         
+        section, factory_name = self._PRIMARY_FACTORIES[primary_type]
+        primary_storage = getattr(self, factory_name)(**kwargs.get(section, {}))
+        
         # Create cache layer if enabled
         cache_layer = None
         if enable_cache:
@@ -329,7 +627,13 @@ class DataLayerFactory:
             except Exception as e:
                 self.logger.warning(f"Failed to create Redis cache layer: {e}")
         
-        return HybridDataLayer(primary_storage, cache_layer)
+        # Without a cache there is nothing to combine; skip the wrapper entirely
+        if cache_layer is None:
+            return primary_storage
+        
+        ttl_policy = CacheTTLPolicy.from_config(kwargs.get('cache_ttl'))
+        
+        return HybridDataLayer(primary_storage, cache_layer, ttl_policy)
     
     def create_from_config(self, config: Dict[str, Any]) -> DataLayerInterface:
         """
@@ -342,31 +646,31 @@ class DataLayerFactory:
             DataLayerInterface instance
         """
         storage_type = config.get('type', 'postgresql').lower()
+        primary_type = self._PRIMARY_TYPES.get(storage_type)
+        if primary_type is None:
+            raise ValueError(f"Unknown storage type: {storage_type}")
         
         # Handle cache configuration - can be dict, string, or boolean
         cache_config = config.get('cache', {})
-        if isinstance(cache_config, str):
-            # If cache is a string like "none" or "redis", handle accordingly
-            enable_cache = cache_config.lower() not in ['none', 'false', 'disabled']
-            cache_config = config.get('redis', {}) if enable_cache else {}
-        elif isinstance(cache_config, dict):
+        cache_ttl = {}
+        if isinstance(cache_config, dict):
             enable_cache = cache_config.get('enabled', True)
+            cache_ttl = cache_config.get('ttl', {})
+            redis_config = {k: v for k, v in cache_config.items() if k not in ('enabled', 'ttl')}
         else:
-            enable_cache = bool(cache_config)
-            cache_config = config.get('redis', {})
-        
-        if storage_type == 'clickhouse':
-            primary_type = DataStorageType.CLICKHOUSE
-        elif storage_type == 'postgresql':
-            primary_type = DataStorageType.POSTGRESQL
-        else:
-            raise ValueError(f"Unknown storage type: {storage_type}")
+            # A string like "none" or "redis", or a boolean; settings come from 'redis'
+            if isinstance(cache_config, str):
+                enable_cache = cache_config.lower() not in self._CACHE_DISABLED
+            else:
+                enable_cache = bool(cache_config)
+            redis_config = config.get('redis', {}) if enable_cache else {}
         
-        # Extract configuration for each component
+        # Only the selected primary storage's section is needed
+        section, _ = self._PRIMARY_FACTORIES[primary_type]
         kwargs = {
-            'clickhouse': config.get('clickhouse', {}),
-            'postgresql': config.get('postgresql', {}),
-            'redis': cache_config
+            section: config.get(section, {}),
+            'redis': redis_config,
+            'cache_ttl': cache_ttl
         }
         
         return self.create_hybrid_layer(primary_type, enable_cache, **kwargs)
@@ -6,23 +6,228 @@ Uses TimescaleDB extension when available for better time series performance.
 """
 
 import asyncio
+import itertools
+import json
+import time
+from collections import OrderedDict
+from itertools import combinations
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, FrozenSet, List, Optional, Any, Set, Tuple, Union
 import pandas as pd
 import logging
 from contextlib import asynccontextmanager
 
 import psycopg2
 import psycopg2.extras
+import asyncpg
 from sqlalchemy import create_engine, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 import sqlalchemy as sa
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from . import DataLayerInterface
 from ..utils.logger_setup import setup_logger
 from ..utils.timezone_utils import get_current_time, to_ist, to_utc, is_market_hours
 
+# Columns written by COPY for each bulk-loaded table (id and created_at use defaults)
+_MARKET_DATA_COLUMNS = [
+    'timestamp', 'symbol', 'asset_type', 'runner_name',
+    'open', 'high', 'low', 'close', 'ltp', 'volume', 'turnover',
+    'price_change', 'price_change_pct', 'volatility',
+    'bid_price', 'ask_price', 'bid_size', 'ask_size', 'metadata'
+]
+
+_HISTORICAL_DATA_COLUMNS = [
+    'timestamp', 'symbol', 'asset_type', 'timeframe',
+    'open', 'high', 'low', 'close', 'volume', 'turnover'
+]
+
+_OPTIONS_DATA_COLUMNS = [
+    'timestamp', 'underlying', 'expiry_date', 'strike', 'option_type',
+    'ltp', 'bid', 'ask', 'volume', 'open_interest',
+    'delta', 'gamma', 'theta', 'vega', 'implied_volatility',
+    'moneyness', 'time_to_expiry'
+]
+
+def _build_query_variants(base: str, filters: Dict[str, str], suffix: str,
+                          required: Tuple[str, ...] = (),
+                          limit: bool = False) -> Dict[FrozenSet[str], Tuple[str, List[str]]]:
+    """
+    Pre-build the SQL text for every combination of optional filters.
+    
+    Args:
+        base: Query text binding the required parameters as $1..$n
+        filters: Optional filter name -> condition with a {} placeholder, in clause order
+        suffix: Query text appended after the conditions
+        required: Parameter names bound by base, in order
+        limit: Also build variants ending in a bound LIMIT
+        
+    Returns:
+        Mapping of the full parameter-name set to (query text, parameter
+        names in bind order), so callers can look up with frozenset(params)
+    """
+    variants = {}
+    for count in range(len(filters) + 1):
+        for active in combinations(filters, count):
+            names = [*required, *active]
+            conditions = "".join(
+                f" AND {filters[name].format(f'${position}')}"
+                for position, name in enumerate(active, start=len(required) + 1)
+            )
+            query = f"{base}{conditions}{suffix}"
+            variants[frozenset(names)] = (query, names)
+            if limit:
+                variants[frozenset(names) | {'limit'}] = (f"{query} LIMIT ${len(names) + 1}", [*names, 'limit'])
+    return variants
+
+
+# Query text is fixed per filter combination, so asyncpg's per-connection
+# statement cache reuses one prepared statement for each shape
+_MARKET_DATA_QUERIES = _build_query_variants(
+    "SELECT * FROM market_data WHERE symbol = $1",
+    {
+        'start_time': "timestamp >= {}",
+        'end_time': "timestamp <= {}",
+    },
+    " ORDER BY timestamp DESC",
+    required=('symbol',),
+    limit=True
+)
+
+_SIGNALS_QUERIES = _build_query_variants(
+    "SELECT * FROM trading_signals WHERE 1=1",
+    {
+        'symbol': "symbol = {}",
+        'strategy': "strategy = {}",
+        'start_time': "timestamp >= {}",
+        'end_time': "timestamp <= {}",
+    },
+    " ORDER BY timestamp DESC"
+)
+
+# Dead connections are detected by TCP keepalives instead of a SELECT 1 per
+# pool checkout: libpq options for psycopg2, server settings for asyncpg
+_PSYCOPG2_KEEPALIVES = {
+    'keepalives': 1,
+    'keepalives_idle': 30,
+    'keepalives_interval': 10,
+    'keepalives_count': 3
+}
+
+_ASYNCPG_KEEPALIVES = {
+    'tcp_keepalives_idle': '30',
+    'tcp_keepalives_interval': '10',
+    'tcp_keepalives_count': '3'
+}
+
+# Pool settings for the SQLAlchemy engines. Hot paths run on the asyncpg
+# pool (sized by pool_size / max_overflow); the engines only serve schema
+# setup, VACUUM, health checks and ad-hoc queries. LIFO checkout keeps the
+# few connections they use warm and lets idle extras time out server-side.
+_ENGINE_POOL_OPTIONS = {
+    'pool_size': 2,
+    'max_overflow': 3,
+    'pool_recycle': 1800,
+    'pool_use_lifo': True
+}
+
+# Rows per server-side cursor fetch for large range reads
+_CURSOR_FETCH_ROWS = 10_000
+
+# Maximum number of symbols kept by the get_latest_market_data cache
+_LATEST_CACHE_SIZE = 1024
+
+# NOTIFY channel carrying the symbol of every inserted market_data row
+_MARKET_DATA_CHANNEL = 'market_data_insert'
+
+# Missing columns are zero-filled; these take an integer zero
+_INT_COLUMNS = frozenset({'volume', 'bid_size', 'ask_size', 'open_interest'})
+
+_SIGNAL_COLUMNS = [
+    'timestamp', 'signal_id', 'symbol', 'asset_type', 'strategy', 'action',
+    'price', 'quantity', 'confidence', 'target', 'stop_loss', 'metadata'
+]
+
+
+def _frame_rows(data: pd.DataFrame, columns: List[str],
+                overrides: Optional[Dict[str, Any]] = None,
+                defaults: Optional[Dict[str, Any]] = None):
+    """
+    Build COPY rows column-wise from a DataFrame without copying it.
+    
+    Args:
+        data: Source frame, left untouched
+        columns: Target columns, in COPY order
+        overrides: Values (scalar or Series) used even if the frame has the column
+        defaults: Values (scalar or Series) used only if the frame lacks the column
+    
+    Returns:
+        Iterator of row tuples; missing cells are None, and columns missing
+        from the frame are zero-filled
+    """
+    overrides = overrides or {}
+    defaults = defaults or {}
+    sources = []
+    
+    for col in columns:
+        if col in overrides:
+            value = overrides[col]
+        elif col in data.columns:
+            value = data[col]
+        elif col in defaults:
+            value = defaults[col]
+        else:
+            value = 0 if col in _INT_COLUMNS else 0.0
+        
+        if not isinstance(value, pd.Series):
+            value = itertools.repeat(value, len(data))
+        elif col in _INT_COLUMNS and value.dtype.kind == 'f':
+            # Integer columns with gaps come back from pandas as float NaN
+            value = value.astype('Int64') if value.hasnans else value.astype('int64')
+        
+        if isinstance(value, pd.Series) and value.hasnans:
+            # Binary COPY would store float NaN as 'NaN' (and NaT / NA fail);
+            # missing cells must arrive as None to be written as NULL
+            value = value.astype(object).where(value.notna(), None)
+        
+        sources.append(value)
+    
+    return zip(*sources)
+
+
+def _json_text(value: Any) -> str:
+    """Encode a metadata value as JSON text for a JSONB column; strings pass through as-is."""
+    if value is None:
+        return '{}'
+    if isinstance(value, str):
+        return value
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(value, default=str)
+
+
+def _jsonb_encode(value: Any) -> bytes:
+    """asyncpg binary jsonb encoder: format version 1 followed by the JSON text."""
+    return b'\x01' + _json_text(value).encode()
+
+
+def _jsonb_decode(data: bytes) -> Any:
+    """asyncpg binary jsonb decoder."""
+    return json.loads(data[1:])
+
+
+def _utc_timestamps(data: pd.DataFrame, default: Any) -> pd.Series:
+    """Frame timestamps (or the default) as tz-aware UTC; naive values are taken as UTC."""
+    if 'timestamp' in data.columns:
+        return pd.to_datetime(data['timestamp'], utc=True)
+    return pd.Series(pd.to_datetime(default, utc=True), index=data.index)
+
 
 class PostgreSQLDataLayer(DataLayerInterface):
     """
@@ -31,9 +236,22 @@ class PostgreSQLDataLayer(DataLayerInterface):
     Optimized for trading data with proper indexing and partitioning.
     """
     
+    # Buffered signals are written once this many are pending, or after the interval
+    SIGNAL_BATCH_SIZE = 500
+    SIGNAL_FLUSH_INTERVAL = 0.1
+    
+    # store_market_data calls arriving within this window share one COPY (0 disables)
+    MARKET_DATA_COALESCE_WINDOW = 0.05
+    
+    # cleanup_old_data deletes from plain tables this many rows per transaction,
+    # pausing between batches so inserts and autovacuum keep up
+    CLEANUP_BATCH_SIZE = 10_000
+    CLEANUP_BATCH_PAUSE = 0.1
+    
     def __init__(self, host: str = 'localhost', port: int = 5432,
                  database: str = 'alphastock', username: str = 'postgres',
-                 password: str = '', pool_size: int = 20, max_overflow: int = 30):
+                 password: str = '', pool_size: int = 20, max_overflow: int = 30,
+                 latest_cache_ttl: float = 0.2):
         """
         Initialize PostgreSQL data layer.
         
@@ -43,8 +261,10 @@ class PostgreSQLDataLayer(DataLayerInterface):
             database: Database name
             username: Username for authentication
             password: Password for authentication
-            pool_size: Connection pool size
-            max_overflow: Maximum pool overflow
+            pool_size: Connections the asyncpg pool keeps open
+            max_overflow: Extra asyncpg connections opened under load
+            latest_cache_ttl: Seconds a get_latest_market_data row is reused
+                (0 disables the cache)
         """
         self.host = host
         self.port = port
@@ -60,8 +280,38 @@ class PostgreSQLDataLayer(DataLayerInterface):
         self.logger = setup_logger(name="PostgreSQLDataLayer")
         self._initialized = False
         
-        # Connection strings
-        self.sync_url = f"postgresql://{username}:{password}@{host}:{port}/{database}"
+        # Pending (signal row, caller future) pairs and the timer that flushes them
+        self._signal_buffer: List[tuple] = []
+        self._signal_flush_task: Optional[asyncio.Task] = None
+        
+        # Coalesced store_market_data frames and the future their callers await
+        self._market_data_pending: List[tuple] = []
+        self._market_data_future: Optional[asyncio.Future] = None
+        self._market_data_flush_task: Optional[asyncio.Task] = None
+        
+        # LRU cache for get_latest_market_data: symbol -> (version, expires_at, row).
+        # Local writes and NOTIFYs from other writers bump the symbol's version.
+        self.latest_cache_ttl = latest_cache_ttl
+        self._latest_cache: OrderedDict = OrderedDict()
+        self._latest_versions: Dict[str, int] = {}
+        self._listen_conn = None
+        
+        # asyncpg pool used directly by COPY, single-row and range-read paths
+        self._pg_pool: Optional[asyncpg.Pool] = None
+        
+        # Tables converted to TimescaleDB hypertables by _setup_timescaledb
+        self._hypertables: Set[str] = set()
+        
+        # Set once the strategy_performance_daily continuous aggregate exists
+        self._performance_rollup = False
+        
+        # Set once the market_data_symbols_daily continuous aggregate exists
+        self._symbols_rollup = False
+        
+        # Connection strings; the sync URL names psycopg2 explicitly, since newer
+        # SQLAlchemy maps bare postgresql:// to psycopg 3, which rejects the
+        # executemany options passed to create_engine
+        self.sync_url = f"postgresql+psycopg2://{username}:{password}@{host}:{port}/{database}"
         self.async_url = f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{database}"
     
     async def initialize(self) -> bool:
@@ -70,19 +320,33 @@ class PostgreSQLDataLayer(DataLayerInterface):
             # Create sync engine for setup operations
             self.engine = create_engine(
                 self.sync_url,
-                pool_size=self.pool_size,
-                max_overflow=self.max_overflow,
-                pool_pre_ping=True,
-                pool_recycle=3600
+                **_ENGINE_POOL_OPTIONS,
+                connect_args=_PSYCOPG2_KEEPALIVES,
+                # Multi-row executes go out as VALUES lists / execute_batch pages
+                executemany_mode='values_plus_batch',
+                executemany_batch_page_size=500
             )
             
             # Create async engine for operations
             self.async_engine = create_async_engine(
                 self.async_url,
-                pool_size=self.pool_size,
-                max_overflow=self.max_overflow,
-                pool_pre_ping=True,
-                pool_recycle=3600
+                **_ENGINE_POOL_OPTIONS,
+                connect_args={'server_settings': _ASYNCPG_KEEPALIVES}
+            )
+            
+            # Raw asyncpg pool for hot paths that don't need SQLAlchemy
+            self._pg_pool = await asyncpg.create_pool(
+                host=self.host,
+                port=self.port,
+                database=self.database,
+                user=self.username,
+                password=self.password,
+                min_size=self.pool_size,
+                max_size=self.pool_size + self.max_overflow,
+                max_inactive_connection_lifetime=1800,
+                command_timeout=30,
+                server_settings=_ASYNCPG_KEEPALIVES,
+                init=self._init_connection
             )
             
             # Create session factory
@@ -93,17 +357,20 @@ class PostgreSQLDataLayer(DataLayerInterface):
             )
             
             # Test connection
-            with self.engine.connect() as conn:
-                result = conn.execute(text("SELECT 1")).fetchone()
-                if not result or result[0] != 1:
+            async with self._raw_connection() as conn:
+                if await conn.fetchval("SELECT 1") != 1:
                     raise Exception("PostgreSQL connection test failed")
             
             # Create database if it doesn't exist (handled externally)
-            # Create tables and indexes
-            await self._create_tables()
+            # Create tables and indexes; schema setup uses the sync engine,
+            # so it runs in a worker thread to keep the event loop free
+            await asyncio.to_thread(self._create_tables)
             
             # Try to enable TimescaleDB if available
-            await self._setup_timescaledb()
+            await asyncio.to_thread(self._setup_timescaledb)
+            await asyncio.to_thread(self._sync_timestamp_indexes)
+            
+            await self._start_market_data_listener()
             
             self._initialized = True
             self.logger.info("PostgreSQL data layer initialized successfully")
@@ -116,6 +383,24 @@ class PostgreSQLDataLayer(DataLayerInterface):
     async def close(self):
         """Close PostgreSQL connections."""
         try:
+            # Let pending flushes finish; cancelling one mid-COPY would lose
+            # the batch it already took from the buffer
+            if self._signal_flush_task:
+                await self._signal_flush_task
+            
+            if self._market_data_flush_task:
+                await self._market_data_flush_task
+            
+            if self._listen_conn:
+                await self._listen_conn.close()
+                self._listen_conn = None
+            
+            if self._pg_pool:
+                await self._flush_market_data()
+                await self._flush_signals()
+                await self._pg_pool.close()
+                self._pg_pool = None
+            
             if self.async_engine:
                 await self.async_engine.dispose()
                 self.async_engine = None
@@ -129,7 +414,166 @@ class PostgreSQLDataLayer(DataLayerInterface):
         except Exception as e:
             self.logger.error(f"Error closing PostgreSQL data layer: {e}")
     
-    async def _setup_timescaledb(self):
+    @staticmethod
+    async def _init_connection(conn):
+        """Set up each pooled asyncpg connection."""
+        # Metadata is bound as dicts or JSON text and read back as Python objects
+        await conn.set_type_codec(
+            'jsonb', encoder=_jsonb_encode, decoder=_jsonb_decode,
+            schema='pg_catalog', format='binary'
+        )
+        # Short OLTP statements never amortize JIT compilation
+        await conn.execute("SET jit = off")
+    
+    @asynccontextmanager
+    async def _raw_connection(self):
+        """Borrow a connection from the shared asyncpg pool."""
+        async with self._pg_pool.acquire() as conn:
+            yield conn
+    
+    async def _read_frame(self, query: str, params: Optional[Dict] = None) -> pd.DataFrame:
+        """
+        Run a SELECT with named parameters on the async engine, streaming rows
+        through a server-side cursor _CURSOR_FETCH_ROWS at a time and building
+        the DataFrame chunk by chunk.
+        """
+        async with self.async_engine.connect() as conn:
+            result = await conn.stream(text(query), params or {})
+            columns = list(result.keys())
+            chunks = [
+                pd.DataFrame.from_records(rows, columns=columns)
+                async for rows in result.partitions(_CURSOR_FETCH_ROWS)
+            ]
+        
+        if not chunks:
+            return pd.DataFrame(columns=columns)
+        
+        return chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+    
+    async def _fetch_frame(self, query: str, *args, parse_dates: Optional[List[str]] = None,
+                           stream: bool = False) -> pd.DataFrame:
+        """
+        Run a SELECT over asyncpg's binary protocol and build the DataFrame
+        column-wise from the returned records.
+        
+        With stream=True rows are pulled through a server-side cursor
+        _CURSOR_FETCH_ROWS at a time, so only one chunk of Record objects is
+        alive at once instead of the whole result.
+        """
+        async with self._raw_connection() as conn:
+            if stream:
+                chunks = []
+                async with conn.transaction():
+                    cursor = await conn.cursor(query, *args)
+                    while True:
+                        records = await cursor.fetch(_CURSOR_FETCH_ROWS)
+                        if not records:
+                            break
+                        chunks.append(pd.DataFrame.from_records(records, columns=list(records[0].keys())))
+                        if len(records) < _CURSOR_FETCH_ROWS:
+                            break
+            else:
+                records = await conn.fetch(query, *args)
+                chunks = [pd.DataFrame.from_records(records, columns=list(records[0].keys()))] if records else []
+        
+        if not chunks:
+            return pd.DataFrame()
+        
+        result = chunks[0] if len(chunks) == 1 else pd.concat(chunks, ignore_index=True)
+        for col in parse_dates or []:
+            result[col] = pd.to_datetime(result[col], utc=True)
+        
+        return result
+    
+    @staticmethod
+    def _as_timestamptz(value: Any) -> datetime:
+        """Coerce a timestamp-like value to an aware datetime; naive values are taken as UTC."""
+        ts = pd.Timestamp(value)
+        if ts.tzinfo is None:
+            ts = ts.tz_localize('UTC')
+        return ts.to_pydatetime()
+    
+    async def _copy_rows(self, table: str, records, columns: List[str]):
+        """Bulk load row tuples with binary COPY FROM STDIN."""
+        async with self._raw_connection() as conn:
+            await conn.copy_records_to_table(table, records=records, columns=columns)
+    
+    async def _start_market_data_listener(self):
+        """
+        LISTEN for market_data inserts so cached latest rows written by other
+        processes are dropped immediately rather than when their TTL runs out.
+        """
+        if self.latest_cache_ttl <= 0:
+            return
+        
+        try:
+            self._listen_conn = await asyncpg.connect(
+                host=self.host, port=self.port, database=self.database,
+                user=self.username, password=self.password
+            )
+            await self._listen_conn.add_listener(_MARKET_DATA_CHANNEL, self._on_market_data_insert)
+        except Exception as e:
+            self._listen_conn = None
+            self.logger.warning(f"Could not listen for market data inserts: {e}")
+    
+    def _on_market_data_insert(self, connection, pid, channel, payload):
+        """NOTIFY callback: the payload is the symbol of the inserted row."""
+        self._invalidate_latest(payload)
+    
+    def _invalidate_latest(self, *symbols: str):
+        """Drop cached latest rows for the given symbols."""
+        for symbol in symbols:
+            self._latest_versions[symbol] = self._latest_versions.get(symbol, 0) + 1
+            self._latest_cache.pop(symbol, None)
+    
+    async def _copy_ignore_conflicts(self, table: str, records, columns: List[str],
+                                     conflict_columns: List[str]):
+        """
+        COPY rows into a transaction-scoped staging table, then insert them,
+        skipping rows that hit the given unique key instead of failing the batch.
+        """
+        staging = f"{table}_staging"
+        column_list = ', '.join(columns)
+        
+        async with self._raw_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    f"CREATE TEMP TABLE {staging} (LIKE {table} INCLUDING DEFAULTS) ON COMMIT DROP"
+                )
+                await conn.copy_records_to_table(staging, records=records, columns=columns)
+                await conn.execute(
+                    f"INSERT INTO {table} ({column_list}) "
+                    f"SELECT {column_list} FROM {staging} "
+                    f"ON CONFLICT ({', '.join(conflict_columns)}) DO NOTHING"
+                )
+    
+    # Plain tables cleanup_old_data deletes from by timestamp; trading_signals
+    # is left out as it always has idx_signals_timestamp
+    _TIMESTAMP_INDEXED_TABLES = ('market_data', 'historical_data', 'options_data', 'strategy_performance')
+    
+    def _sync_timestamp_indexes(self):
+        """
+        Give each plain table a timestamp index for _delete_before, and drop it
+        from hypertables, where chunk pruning and drop_chunks make it dead weight.
+        Runs after _setup_timescaledb, once hypertable status is known.
+        """
+        with self.engine.begin() as conn:
+            for table_name in self._TIMESTAMP_INDEXED_TABLES:
+                if table_name in self._hypertables:
+                    index_sql = f"DROP INDEX IF EXISTS idx_{table_name}_timestamp;"
+                else:
+                    index_sql = (
+                        f"CREATE INDEX IF NOT EXISTS idx_{table_name}_timestamp "
+                        f"ON {table_name}(timestamp);"
+                    )
+                
+                try:
+                    with conn.begin_nested():
+                        conn.execute(text(index_sql))
+                except Exception as e:
+                    self.logger.warning(f"Error syncing timestamp index on {table_name}: {e}")
+    
+    def _setup_timescaledb(self):
         """Try to set up TimescaleDB extension for better time series performance."""
         try:
             with self.engine.connect() as conn:
@@ -145,26 +589,136 @@ class PostgreSQLDataLayer(DataLayerInterface):
                     # Enable TimescaleDB
                     conn.execute(text("CREATE EXTENSION IF NOT EXISTS timescaledb;"))
                     
-                    # Convert tables to hypertables
+                    conn.commit()
+                    
+                    # Convert tables to compressed hypertables:
+                    # (table, chunk interval, compress segmentby, compress after)
+                    # trading_signals stays a plain table: its global signal_id
+                    # uniqueness cannot be kept on a hypertable.
                     tables_to_convert = [
-                        ('market_data', 'timestamp'),
-                        ('historical_data', 'timestamp'),
-                        ('trading_signals', 'timestamp'),
-                        ('options_data', 'timestamp'),
-                        ('strategy_performance', 'timestamp')
+                        ('market_data', '1 day', 'symbol', '2 days'),
+                        ('historical_data', '7 days', 'symbol, timeframe', '7 days'),
+                        ('options_data', '1 day', 'underlying, expiry_date, option_type', '2 days'),
+                        ('strategy_performance', '7 days', 'strategy, symbol', '30 days')
                     ]
                     
-                    for table_name, time_column in tables_to_convert:
+                    for table_name, chunk_interval, segment_by, compress_after in tables_to_convert:
                         try:
-                            conn.execute(text(f"""
-                                SELECT create_hypertable('{table_name}', '{time_column}',
-                                    if_not_exists => TRUE);
-                            """))
-                            self.logger.info(f"Converted {table_name} to hypertable")
+                            # Savepoint per table so one failure doesn't abort the rest
+                            with conn.begin_nested():
+                                conn.execute(text(f"""
+                                    SELECT create_hypertable('{table_name}', 'timestamp',
+                                        chunk_time_interval => INTERVAL '{chunk_interval}',
+                                        create_default_indexes => FALSE,
+                                        migrate_data => TRUE,
+                                        if_not_exists => TRUE);
+                                """))
+                                conn.execute(text(
+                                    f"SELECT set_chunk_time_interval('{table_name}', INTERVAL '{chunk_interval}');"
+                                ))
+                                
+                                compressed = conn.execute(text("""
+                                    SELECT compression_enabled FROM timescaledb_information.hypertables
+                                    WHERE hypertable_name = :table_name;
+                                """), {'table_name': table_name}).scalar()
+                                
+                                if not compressed:
+                                    conn.execute(text(f"""
+                                        ALTER TABLE {table_name} SET (
+                                            timescaledb.compress,
+                                            timescaledb.compress_segmentby = '{segment_by}',
+                                            timescaledb.compress_orderby = 'timestamp DESC'
+                                        );
+                                    """))
+                                
+                                conn.execute(text(f"""
+                                    SELECT add_compression_policy('{table_name}', INTERVAL '{compress_after}',
+                                        if_not_exists => TRUE);
+                                """))
+                            conn.commit()
+                            self._hypertables.add(table_name)
+                            self.logger.info(f"Converted {table_name} to compressed hypertable")
                         except Exception as e:
                             self.logger.debug(f"Could not convert {table_name} to hypertable: {e}")
                     
-                    conn.commit()
+                    # Raw ticks are only kept for 90 days
+                    try:
+                        with conn.begin_nested():
+                            conn.execute(text("""
+                                SELECT add_retention_policy('market_data', INTERVAL '90 days',
+                                    if_not_exists => TRUE);
+                            """))
+                        conn.commit()
+                    except Exception as e:
+                        self.logger.debug(f"Could not add market_data retention policy: {e}")
+                    
+                    # Daily performance rollup. Averages are kept as sum/count so
+                    # multi-day summaries weight every row like the raw query does.
+                    try:
+                        with conn.begin_nested():
+                            conn.execute(text("""
+                                CREATE MATERIALIZED VIEW IF NOT EXISTS strategy_performance_daily
+                                WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+                                SELECT
+                                    time_bucket(INTERVAL '1 day', timestamp) AS day,
+                                    strategy,
+                                    symbol,
+                                    SUM(total_trades) AS total_trades,
+                                    SUM(winning_trades) AS winning_trades,
+                                    SUM(losing_trades) AS losing_trades,
+                                    SUM(total_pnl) AS total_pnl,
+                                    MAX(max_drawdown) AS max_drawdown,
+                                    SUM(sharpe_ratio) AS sharpe_ratio_sum,
+                                    COUNT(sharpe_ratio) AS sharpe_ratio_count,
+                                    SUM(win_rate) AS win_rate_sum,
+                                    COUNT(win_rate) AS win_rate_count
+                                FROM strategy_performance
+                                GROUP BY day, strategy, symbol
+                                WITH NO DATA;
+                            """))
+                            conn.execute(text("""
+                                SELECT add_continuous_aggregate_policy('strategy_performance_daily',
+                                    start_offset => NULL,
+                                    end_offset => INTERVAL '1 hour',
+                                    schedule_interval => INTERVAL '1 hour',
+                                    if_not_exists => TRUE);
+                            """))
+                        conn.commit()
+                        self._performance_rollup = True
+                    except Exception as e:
+                        self.logger.debug(f"Could not create strategy_performance_daily: {e}")
+                    
+                    # Symbols seen per asset type and day, so symbol lookups read
+                    # a few rows per symbol instead of every tick
+                    try:
+                        with conn.begin_nested():
+                            conn.execute(text("""
+                                CREATE MATERIALIZED VIEW IF NOT EXISTS market_data_symbols_daily
+                                WITH (timescaledb.continuous, timescaledb.materialized_only = false) AS
+                                SELECT
+                                    time_bucket(INTERVAL '1 day', timestamp) AS day,
+                                    asset_type,
+                                    symbol
+                                FROM market_data
+                                GROUP BY day, asset_type, symbol
+                                WITH NO DATA;
+                            """))
+                            conn.execute(text("""
+                                CREATE INDEX IF NOT EXISTS idx_market_data_symbols_daily_asset_type
+                                ON market_data_symbols_daily(asset_type, symbol);
+                            """))
+                            conn.execute(text("""
+                                SELECT add_continuous_aggregate_policy('market_data_symbols_daily',
+                                    start_offset => NULL,
+                                    end_offset => INTERVAL '1 hour',
+                                    schedule_interval => INTERVAL '1 hour',
+                                    if_not_exists => TRUE);
+                            """))
+                        conn.commit()
+                        self._symbols_rollup = True
+                    except Exception as e:
+                        self.logger.debug(f"Could not create market_data_symbols_daily: {e}")
+                    
                     self.logger.info("TimescaleDB extension enabled successfully")
                 else:
                     self.logger.info("TimescaleDB not available, using standard PostgreSQL")
@@ -172,50 +726,52 @@ class PostgreSQLDataLayer(DataLayerInterface):
         except Exception as e:
             self.logger.warning(f"Could not set up TimescaleDB: {e}")
     
-    async def _create_tables(self):
+    def _create_tables(self):
         """Create all required tables."""
         # Market data table
         market_data_table = """
         CREATE TABLE IF NOT EXISTS market_data (
-            id BIGSERIAL PRIMARY KEY,
+            id BIGSERIAL,
             timestamp TIMESTAMPTZ NOT NULL,
             symbol VARCHAR(50) NOT NULL,
             asset_type VARCHAR(20) NOT NULL,
             runner_name VARCHAR(50) NOT NULL,
-            open DECIMAL(15,4),
-            high DECIMAL(15,4),
-            low DECIMAL(15,4),
-            close DECIMAL(15,4),
-            ltp DECIMAL(15,4),
+            open DOUBLE PRECISION,
+            high DOUBLE PRECISION,
+            low DOUBLE PRECISION,
+            close DOUBLE PRECISION,
+            ltp DOUBLE PRECISION,
             volume BIGINT DEFAULT 0,
-            turnover DECIMAL(20,2) DEFAULT 0,
-            price_change DECIMAL(15,4) DEFAULT 0,
-            price_change_pct DECIMAL(8,4) DEFAULT 0,
-            volatility DECIMAL(8,4) DEFAULT 0,
-            bid_price DECIMAL(15,4) DEFAULT 0,
-            ask_price DECIMAL(15,4) DEFAULT 0,
+            turnover DOUBLE PRECISION DEFAULT 0,
+            price_change DOUBLE PRECISION DEFAULT 0,
+            price_change_pct DOUBLE PRECISION DEFAULT 0,
+            volatility DOUBLE PRECISION DEFAULT 0,
+            bid_price DOUBLE PRECISION DEFAULT 0,
+            ask_price DOUBLE PRECISION DEFAULT 0,
             bid_size INTEGER DEFAULT 0,
             ask_size INTEGER DEFAULT 0,
             metadata JSONB DEFAULT '{}',
-            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, timestamp)
         );
         """
         
         # Historical OHLC data table
         historical_data_table = """
         CREATE TABLE IF NOT EXISTS historical_data (
-            id BIGSERIAL PRIMARY KEY,
+            id BIGSERIAL,
             timestamp TIMESTAMPTZ NOT NULL,
             symbol VARCHAR(50) NOT NULL,
             asset_type VARCHAR(20) NOT NULL,
             timeframe VARCHAR(10) NOT NULL,
-            open DECIMAL(15,4) NOT NULL,
-            high DECIMAL(15,4) NOT NULL,
-            low DECIMAL(15,4) NOT NULL,
-            close DECIMAL(15,4) NOT NULL,
+            open DOUBLE PRECISION NOT NULL,
+            high DOUBLE PRECISION NOT NULL,
+            low DOUBLE PRECISION NOT NULL,
+            close DOUBLE PRECISION NOT NULL,
             volume BIGINT DEFAULT 0,
-            turnover DECIMAL(20,2) DEFAULT 0,
+            turnover DOUBLE PRECISION DEFAULT 0,
             created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, timestamp),
             UNIQUE(symbol, timeframe, timestamp)
         );
         """
@@ -230,11 +786,11 @@ class PostgreSQLDataLayer(DataLayerInterface):
             asset_type VARCHAR(20) NOT NULL,
             strategy VARCHAR(50) NOT NULL,
             action VARCHAR(10) NOT NULL,
-            price DECIMAL(15,4) NOT NULL,
+            price DOUBLE PRECISION NOT NULL,
             quantity INTEGER DEFAULT 0,
-            confidence DECIMAL(5,4) DEFAULT 0,
-            target DECIMAL(15,4) DEFAULT 0,
-            stop_loss DECIMAL(15,4) DEFAULT 0,
+            confidence DOUBLE PRECISION DEFAULT 0,
+            target DOUBLE PRECISION DEFAULT 0,
+            stop_loss DOUBLE PRECISION DEFAULT 0,
             metadata JSONB DEFAULT '{}',
             created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
         );
@@ -243,32 +799,33 @@ class PostgreSQLDataLayer(DataLayerInterface):
         # Options data table
         options_data_table = """
         CREATE TABLE IF NOT EXISTS options_data (
-            id BIGSERIAL PRIMARY KEY,
+            id BIGSERIAL,
             timestamp TIMESTAMPTZ NOT NULL,
             underlying VARCHAR(50) NOT NULL,
             expiry_date DATE NOT NULL,
-            strike DECIMAL(15,4) NOT NULL,
+            strike DOUBLE PRECISION NOT NULL,
             option_type VARCHAR(2) NOT NULL, -- CE or PE
-            ltp DECIMAL(15,4),
-            bid DECIMAL(15,4),
-            ask DECIMAL(15,4),
+            ltp DOUBLE PRECISION,
+            bid DOUBLE PRECISION,
+            ask DOUBLE PRECISION,
             volume BIGINT DEFAULT 0,
             open_interest BIGINT DEFAULT 0,
-            delta DECIMAL(8,6),
-            gamma DECIMAL(8,6),
-            theta DECIMAL(8,6),
-            vega DECIMAL(8,6),
-            implied_volatility DECIMAL(8,6),
-            moneyness DECIMAL(8,6),
-            time_to_expiry DECIMAL(10,6),
-            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+            delta DOUBLE PRECISION,
+            gamma DOUBLE PRECISION,
+            theta DOUBLE PRECISION,
+            vega DOUBLE PRECISION,
+            implied_volatility DOUBLE PRECISION,
+            moneyness DOUBLE PRECISION,
+            time_to_expiry DOUBLE PRECISION,
+            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, timestamp)
         );
         """
         
         # Performance data table
         performance_table = """
         CREATE TABLE IF NOT EXISTS strategy_performance (
-            id BIGSERIAL PRIMARY KEY,
+            id BIGSERIAL,
             timestamp TIMESTAMPTZ NOT NULL,
             strategy VARCHAR(50) NOT NULL,
             symbol VARCHAR(50) NOT NULL,
@@ -276,25 +833,28 @@ class PostgreSQLDataLayer(DataLayerInterface):
             winning_trades INTEGER DEFAULT 0,
             losing_trades INTEGER DEFAULT 0,
             total_pnl DECIMAL(15,4) DEFAULT 0,
-            max_drawdown DECIMAL(8,4) DEFAULT 0,
-            sharpe_ratio DECIMAL(8,4) DEFAULT 0,
-            win_rate DECIMAL(5,4) DEFAULT 0,
-            avg_win DECIMAL(15,4) DEFAULT 0,
-            avg_loss DECIMAL(15,4) DEFAULT 0,
+            max_drawdown DOUBLE PRECISION DEFAULT 0,
+            sharpe_ratio DOUBLE PRECISION DEFAULT 0,
+            win_rate DOUBLE PRECISION DEFAULT 0,
+            avg_win DOUBLE PRECISION DEFAULT 0,
+            avg_loss DOUBLE PRECISION DEFAULT 0,
             metadata JSONB DEFAULT '{}',
-            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP
+            created_at TIMESTAMPTZ DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (id, timestamp)
         );
         """
         
         # Create indexes for performance
         indexes = [
-            # Market data indexes
-            "CREATE INDEX IF NOT EXISTS idx_market_data_symbol_timestamp ON market_data(symbol, timestamp DESC);",
+            # Market data indexes: (symbol, timestamp DESC, id) serves latest-row
+            # lookups and keyset pagination; time-only scans rely on chunk pruning,
+            # or on the index _sync_timestamp_indexes adds to plain tables
+            "CREATE INDEX IF NOT EXISTS idx_market_data_symbol_ts_id ON market_data(symbol, timestamp DESC, id);",
             "CREATE INDEX IF NOT EXISTS idx_market_data_asset_type ON market_data(asset_type);",
-            "CREATE INDEX IF NOT EXISTS idx_market_data_timestamp ON market_data(timestamp DESC);",
+            "DROP INDEX IF EXISTS idx_market_data_symbol_timestamp;",
             
-            # Historical data indexes
-            "CREATE INDEX IF NOT EXISTS idx_historical_data_symbol_timeframe ON historical_data(symbol, timeframe, timestamp DESC);",
+            # Historical data is served by its UNIQUE(symbol, timeframe, timestamp) index
+            "DROP INDEX IF EXISTS idx_historical_data_symbol_timeframe;",
             
             # Signals indexes
             "CREATE INDEX IF NOT EXISTS idx_signals_symbol_strategy ON trading_signals(symbol, strategy, timestamp DESC);",
@@ -308,8 +868,41 @@ class PostgreSQLDataLayer(DataLayerInterface):
             "CREATE INDEX IF NOT EXISTS idx_performance_strategy_symbol ON strategy_performance(strategy, symbol, timestamp DESC);"
         ]
         
-        # Execute table and index creation
-        with self.engine.connect() as conn:
+        # Let autovacuum keep up with the write-heavy tables instead of
+        # periodic full-table VACUUMs: trigger after ~1-2% of rows change
+        # (insert-driven thresholds need PostgreSQL 13+) and let each run do
+        # more work before sleeping
+        autovacuum_settings = []
+        for table_name in ('market_data', 'options_data', 'trading_signals'):
+            autovacuum_settings.append(f"""
+                ALTER TABLE {table_name} SET (
+                    autovacuum_vacuum_scale_factor = 0.02,
+                    autovacuum_analyze_scale_factor = 0.01,
+                    autovacuum_vacuum_cost_limit = 2000
+                );
+            """)
+            autovacuum_settings.append(
+                f"ALTER TABLE {table_name} SET (autovacuum_vacuum_insert_scale_factor = 0.02);"
+            )
+        
+        notify_trigger = [
+            f"""
+            CREATE OR REPLACE FUNCTION notify_market_data_insert() RETURNS trigger AS $$
+            BEGIN
+                PERFORM pg_notify('{_MARKET_DATA_CHANNEL}', NEW.symbol);
+                RETURN NULL;
+            END;
+            $$ LANGUAGE plpgsql;
+            """,
+            "DROP TRIGGER IF EXISTS market_data_notify ON market_data;",
+            """
+            CREATE TRIGGER market_data_notify AFTER INSERT ON market_data
+            FOR EACH ROW EXECUTE FUNCTION notify_market_data_insert();
+            """
+        ]
+        
+        # Execute table and index creation; begin() commits on success
+        with self.engine.begin() as conn:
             tables = [
                 market_data_table,
                 historical_data_table,
@@ -326,64 +919,107 @@ class PostgreSQLDataLayer(DataLayerInterface):
                     self.logger.error(f"Error creating table: {e}")
                     raise
             
+            # Savepoints keep one failed statement from aborting the transaction
             for index_sql in indexes:
                 try:
-                    conn.execute(text(index_sql))
+                    with conn.begin_nested():
+                        conn.execute(text(index_sql))
                 except Exception as e:
                     self.logger.warning(f"Error creating index: {e}")
             
-            conn.commit()
+            for settings_sql in autovacuum_settings:
+                try:
+                    with conn.begin_nested():
+                        conn.execute(text(settings_sql))
+                except Exception as e:
+                    self.logger.warning(f"Error tuning autovacuum: {e}")
+            
+            # Announce inserted symbols so other processes can drop cached
+            # latest rows; NOTIFY collapses duplicates within a transaction
+            try:
+                with conn.begin_nested():
+                    for trigger_sql in notify_trigger:
+                        conn.execute(text(trigger_sql))
+            except Exception as e:
+                self.logger.warning(f"Error creating market data trigger: {e}")
     
     async def store_market_data(self, symbol: str, asset_type: str,
                                data: pd.DataFrame, runner_name: str) -> bool:
-        """Store market data in PostgreSQL."""
+        """
+        Store market data in PostgreSQL.
+        
+        Calls made within MARKET_DATA_COALESCE_WINDOW are written together by
+        store_market_data_many; each caller gets the result of the shared COPY.
+        """
+        if data.empty:
+            return True
+        
+        if self.MARKET_DATA_COALESCE_WINDOW <= 0:
+            return await self.store_market_data_many([(symbol, asset_type, data, runner_name)])
+        
+        self._market_data_pending.append((symbol, asset_type, data, runner_name))
+        
+        if self._market_data_future is None:
+            self._market_data_future = asyncio.get_running_loop().create_future()
+            self._market_data_flush_task = asyncio.create_task(self._delayed_market_data_flush())
+        
+        return await asyncio.shield(self._market_data_future)
+    
+    async def _delayed_market_data_flush(self):
+        """Flush coalesced market data after MARKET_DATA_COALESCE_WINDOW."""
+        await asyncio.sleep(self.MARKET_DATA_COALESCE_WINDOW)
+        self._market_data_flush_task = None
+        await self._flush_market_data()
+    
+    async def _flush_market_data(self):
+        """Write all coalesced frames and hand the result to their callers."""
+        batch, self._market_data_pending = self._market_data_pending, []
+        future, self._market_data_future = self._market_data_future, None
+        if future is None:
+            return
+        
+        future.set_result(await self.store_market_data_many(batch))
+    
+    async def store_market_data_many(self, frames: List[tuple]) -> bool:
+        """
+        Store market data for many symbols with a single COPY.
+        
+        Args:
+            frames: (symbol, asset_type, data, runner_name) tuples
+        
+        Returns:
+            True if every frame was stored
+        """
         try:
-            if data.empty:
+            frames = [frame for frame in frames if not frame[2].empty]
+            if not frames:
                 return True
             
-            # Prepare data for insertion
-            data_copy = data.copy()
-            data_copy['symbol'] = symbol
-            data_copy['asset_type'] = asset_type
-            data_copy['runner_name'] = runner_name
-            
-            # Ensure timestamp column
-            if 'timestamp' not in data_copy.columns:
-                data_copy['timestamp'] = get_current_time()
-            
-            # Fill missing columns with defaults
-            required_columns = [
-                'open', 'high', 'low', 'close', 'ltp', 'volume', 'turnover',
-                'price_change', 'price_change_pct', 'volatility',
-                'bid_price', 'ask_price', 'bid_size', 'ask_size'
-            ]
-            
-            for col in required_columns:
-                if col not in data_copy.columns:
-                    if col in ['bid_size', 'ask_size', 'volume']:
-                        data_copy[col] = 0
-                    else:
-                        data_copy[col] = 0.0
-            
-            # Add metadata column
-            if 'metadata' not in data_copy.columns:
-                data_copy['metadata'] = '{}'
-            
-            # Insert using pandas to_sql for efficiency
-            data_copy.to_sql(
-                'market_data',
-                self.engine,
-                if_exists='append',
-                index=False,
-                method='multi',
-                chunksize=1000
+            records = itertools.chain.from_iterable(
+                _frame_rows(
+                    data, _MARKET_DATA_COLUMNS,
+                    overrides={
+                        'timestamp': _utc_timestamps(data, get_current_time()),
+                        'symbol': symbol,
+                        'asset_type': asset_type,
+                        'runner_name': runner_name,
+                        'metadata': data['metadata'].map(_json_text) if 'metadata' in data.columns else '{}'
+                    }
+                )
+                for symbol, asset_type, data, runner_name in frames
             )
             
-            self.logger.debug(f"Stored {len(data_copy)} market data records for {symbol}")
+            await self._copy_rows('market_data', records, _MARKET_DATA_COLUMNS)
+            self._invalidate_latest(*{frame[0] for frame in frames})
+            
+            self.logger.debug(
+                f"Stored {sum(len(frame[2]) for frame in frames)} market data records "
+                f"for {len(frames)} frames"
+            )
             return True
             
         except Exception as e:
-            self.logger.error(f"Error storing market data for {symbol}: {e}")
+            self.logger.error(f"Error storing market data for {len(frames)} frames: {e}")
             return False
     
     async def get_market_data(self, symbol: str,
@@ -392,28 +1028,19 @@ class PostgreSQLDataLayer(DataLayerInterface):
                              limit: Optional[int] = None) -> pd.DataFrame:
         """Retrieve market data from PostgreSQL."""
         try:
-            query = "SELECT * FROM market_data WHERE symbol = %(symbol)s"
             params = {'symbol': symbol}
             
             if start_time:
-                query += " AND timestamp >= %(start_time)s"
-                params['start_time'] = start_time
+                params['start_time'] = self._as_timestamptz(start_time)
             
             if end_time:
-                query += " AND timestamp <= %(end_time)s"
-                params['end_time'] = end_time
-            
-            query += " ORDER BY timestamp DESC"
+                params['end_time'] = self._as_timestamptz(end_time)
             
             if limit:
-                query += f" LIMIT {limit}"
+                params['limit'] = int(limit)
             
-            result = pd.read_sql(
-                text(query),
-                self.engine,
-                params=params,
-                parse_dates=['timestamp']
-            )
+            query, names = _MARKET_DATA_QUERIES[frozenset(params)]
+            result = await self._fetch_frame(query, *(params[name] for name in names), parse_dates=['timestamp'])
             
             if not result.empty:
                 result.set_index('timestamp', inplace=True)
@@ -428,29 +1055,47 @@ class PostgreSQLDataLayer(DataLayerInterface):
     async def get_latest_market_data(self, symbol: str) -> Optional[pd.Series]:
         """Get the latest market data point for a symbol."""
         try:
-            query = """
-            SELECT * FROM market_data 
-            WHERE symbol = %(symbol)s 
-            ORDER BY timestamp DESC 
-            LIMIT 1
-            """
-            
-            result = pd.read_sql(
-                text(query),
-                self.engine,
-                params={'symbol': symbol},
-                parse_dates=['timestamp']
-            )
-            
-            if not result.empty:
-                return result.iloc[0]
-            
-            return None
+            version = self._latest_versions.get(symbol, 0)
+            cached = self._latest_cache.get(symbol)
+            if cached and cached[0] == version and cached[1] > time.monotonic():
+                self._latest_cache.move_to_end(symbol)
+                return cached[2].copy() if cached[2] is not None else None
+            
+            # Single row: fetch it directly rather than through a DataFrame
+            async with self._raw_connection() as conn:
+                row = await conn.fetchrow(
+                    "SELECT * FROM market_data WHERE symbol = $1 ORDER BY timestamp DESC LIMIT 1",
+                    symbol
+                )
+            
+            latest = None
+            if row is not None:
+                latest = pd.Series(dict(row))
+                latest['timestamp'] = pd.Timestamp(latest['timestamp'])
+            
+            self._cache_latest(symbol, version, latest)
+            return latest.copy() if latest is not None else None
             
         except Exception as e:
             self.logger.error(f"Error getting latest market data for {symbol}: {e}")
             return None
     
+    def _cache_latest(self, symbol: str, version: int, latest: Optional[pd.Series]):
+        """
+        Cache a get_latest_market_data result.
+        
+        The entry is dropped if a row for the symbol was inserted while the
+        query was in flight, i.e. the version has moved on.
+        """
+        if self.latest_cache_ttl <= 0 or self._latest_versions.get(symbol, 0) != version:
+            return
+        
+        self._latest_cache[symbol] = (version, time.monotonic() + self.latest_cache_ttl, latest)
+        self._latest_cache.move_to_end(symbol)
+        
+        while len(self._latest_cache) > _LATEST_CACHE_SIZE:
+            self._latest_cache.popitem(last=False)
+    
     async def store_historical_data(self, symbol: str, asset_type: str,
                                    data: pd.DataFrame, timeframe: str) -> bool:
         """Store historical OHLC data."""
@@ -458,42 +1103,30 @@ class PostgreSQLDataLayer(DataLayerInterface):
             if data.empty:
                 return True
             
-            data_copy = data.copy()
-            data_copy['symbol'] = symbol
-            data_copy['asset_type'] = asset_type
-            data_copy['timeframe'] = timeframe
-            
-            # Ensure required columns
-            required_columns = ['open', 'high', 'low', 'close', 'volume', 'turnover']
-            for col in required_columns:
-                if col not in data_copy.columns:
-                    if col in ['volume']:
-                        data_copy[col] = 0
-                    elif col in ['turnover']:
-                        data_copy[col] = 0.0
-                    else:
-                        data_copy[col] = data_copy.get('close', 0.0)
-            
-            # Insert using pandas (handles duplicates with ON CONFLICT)
-            data_copy.to_sql(
-                'historical_data',
-                self.engine,
-                if_exists='append',
-                index=False,
-                method='multi',
-                chunksize=1000
+            # Missing open/high/low fall back to close
+            close = data['close'] if 'close' in data.columns else 0.0
+            records = _frame_rows(
+                data, _HISTORICAL_DATA_COLUMNS,
+                overrides={
+                    'timestamp': _utc_timestamps(data, data.index),
+                    'symbol': symbol,
+                    'asset_type': asset_type,
+                    'timeframe': timeframe
+                },
+                defaults={'open': close, 'high': close, 'low': close, 'close': close}
+            )
+            
+            await self._copy_ignore_conflicts(
+                'historical_data', records, _HISTORICAL_DATA_COLUMNS,
+                ['symbol', 'timeframe', 'timestamp']
             )
             
-            self.logger.debug(f"Stored {len(data_copy)} historical records for {symbol}")
+            self.logger.debug(f"Stored {len(data)} historical records for {symbol}")
             return True
             
         except Exception as e:
-            if "duplicate key value" in str(e).lower():
-                self.logger.debug(f"Some historical data already exists for {symbol}")
-                return True
-            else:
-                self.logger.error(f"Error storing historical data for {symbol}: {e}")
-                return False
+            self.logger.error(f"Error storing historical data for {symbol}: {e}")
+            return False
     
     async def get_historical_data(self, symbol: str, timeframe: str,
                                  start_date: datetime, end_date: datetime) -> pd.DataFrame:
@@ -501,25 +1134,17 @@ class PostgreSQLDataLayer(DataLayerInterface):
         try:
             query = """
             SELECT * FROM historical_data 
-            WHERE symbol = %(symbol)s 
-            AND timeframe = %(timeframe)s
-            AND timestamp >= %(start_date)s
-            AND timestamp <= %(end_date)s
+            WHERE symbol = $1 
+            AND timeframe = $2
+            AND timestamp >= $3
+            AND timestamp <= $4
             ORDER BY timestamp ASC
             """
             
-            params = {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'start_date': start_date,
-                'end_date': end_date
-            }
-            
-            result = pd.read_sql(
-                text(query),
-                self.engine,
-                params=params,
-                parse_dates=['timestamp']
+            result = await self._fetch_frame(
+                query, symbol, timeframe,
+                self._as_timestamptz(start_date), self._as_timestamptz(end_date),
+                parse_dates=['timestamp'], stream=True
             )
             
             if not result.empty:
@@ -532,42 +1157,110 @@ class PostgreSQLDataLayer(DataLayerInterface):
             return pd.DataFrame()
     
     async def store_signal(self, signal_data: Dict[str, Any]) -> bool:
-        """Store trading signal."""
+        """
+        Queue a trading signal for a batched write.
+        
+        Signals are flushed with COPY once SIGNAL_BATCH_SIZE are pending or
+        SIGNAL_FLUSH_INTERVAL seconds after the first one was queued. Returns
+        once the flush has written (or failed to write) this signal.
+        """
         try:
-            query = """
-            INSERT INTO trading_signals 
-            (timestamp, signal_id, symbol, asset_type, strategy, action, 
-             price, quantity, confidence, target, stop_loss, metadata)
-            VALUES (%(timestamp)s, %(signal_id)s, %(symbol)s, %(asset_type)s, 
-                    %(strategy)s, %(action)s, %(price)s, %(quantity)s, 
-                    %(confidence)s, %(target)s, %(stop_loss)s, %(metadata)s)
-            """
-            
-            params = {
-                'timestamp': signal_data.get('timestamp', get_current_time()),
-                'signal_id': signal_data.get('signal_id', ''),
-                'symbol': signal_data.get('symbol', ''),
-                'asset_type': signal_data.get('asset_type', ''),
-                'strategy': signal_data.get('strategy', ''),
-                'action': signal_data.get('action', ''),
-                'price': float(signal_data.get('price', 0.0)),
-                'quantity': int(signal_data.get('quantity', 0)),
-                'confidence': float(signal_data.get('confidence', 0.0)),
-                'target': float(signal_data.get('target', 0.0)),
-                'stop_loss': float(signal_data.get('stop_loss', 0.0)),
-                'metadata': signal_data.get('metadata', '{}')
-            }
-            
-            with self.engine.connect() as conn:
-                conn.execute(text(query), params)
-                conn.commit()
-            
-            self.logger.debug(f"Stored signal for {signal_data.get('symbol')}")
-            return True
+            row = (
+                self._as_timestamptz(signal_data.get('timestamp', get_current_time())),
+                signal_data.get('signal_id', ''),
+                signal_data.get('symbol', ''),
+                signal_data.get('asset_type', ''),
+                signal_data.get('strategy', ''),
+                signal_data.get('action', ''),
+                float(signal_data.get('price', 0.0)),
+                int(signal_data.get('quantity', 0)),
+                float(signal_data.get('confidence', 0.0)),
+                float(signal_data.get('target', 0.0)),
+                float(signal_data.get('stop_loss', 0.0)),
+                _json_text(signal_data.get('metadata'))
+            )
             
         except Exception as e:
             self.logger.error(f"Error storing signal: {e}")
             return False
+        
+        future = asyncio.get_running_loop().create_future()
+        self._signal_buffer.append((row, future))
+        
+        if len(self._signal_buffer) >= self.SIGNAL_BATCH_SIZE:
+            # Shielded so a cancelled caller cannot strand the other callers' futures
+            await asyncio.shield(self._flush_signals())
+        elif self._signal_flush_task is None:
+            self._signal_flush_task = asyncio.create_task(self._delayed_signal_flush())
+        
+        return await asyncio.shield(future)
+    
+    async def _delayed_signal_flush(self):
+        """Flush pending signals every SIGNAL_FLUSH_INTERVAL until none are left."""
+        try:
+            while True:
+                await asyncio.sleep(self.SIGNAL_FLUSH_INTERVAL)
+                await self._flush_signals()
+                if not self._signal_buffer:
+                    break
+        finally:
+            self._signal_flush_task = None
+    
+    async def _flush_signals(self) -> bool:
+        """
+        Write all pending signals in one COPY, skipping duplicate signal_ids.
+        
+        If the COPY fails the rows are inserted one by one, so a single bad
+        row only fails its own caller. Each caller's future gets the result
+        for its row.
+        
+        Returns:
+            True if every pending signal was stored
+        """
+        batch, self._signal_buffer = self._signal_buffer, []
+        if not batch:
+            return True
+        
+        try:
+            await self._copy_ignore_conflicts(
+                'trading_signals', [row for row, _ in batch], _SIGNAL_COLUMNS, ['signal_id']
+            )
+            self.logger.debug(f"Stored {len(batch)} signals")
+            results = [True] * len(batch)
+            
+        except Exception as e:
+            self.logger.warning(f"Batch insert of {len(batch)} signals failed, retrying per row: {e}")
+            results = await self._insert_signals_per_row([row for row, _ in batch])
+        
+        for (_, future), stored in zip(batch, results):
+            if not future.done():
+                future.set_result(stored)
+        
+        return all(results)
+    
+    async def _insert_signals_per_row(self, rows: List[tuple]) -> List[bool]:
+        """Insert signal rows individually, returning whether each one was stored."""
+        query = (
+            f"INSERT INTO trading_signals ({', '.join(_SIGNAL_COLUMNS)}) "
+            f"VALUES ({', '.join(f'${i}' for i in range(1, len(_SIGNAL_COLUMNS) + 1))}) "
+            f"ON CONFLICT (signal_id) DO NOTHING"
+        )
+        results = []
+        
+        try:
+            async with self._raw_connection() as conn:
+                for row in rows:
+                    try:
+                        await conn.execute(query, *row)
+                        results.append(True)
+                    except Exception as e:
+                        self.logger.error(f"Error storing signal {row[1]}: {e}")
+                        results.append(False)
+                        
+        except Exception as e:
+            self.logger.error(f"Error storing {len(rows)} signals: {e}")
+        
+        return results + [False] * (len(rows) - len(results))
     
     async def get_signals(self, symbol: Optional[str] = None,
                          strategy: Optional[str] = None,
@@ -575,33 +1268,25 @@ class PostgreSQLDataLayer(DataLayerInterface):
                          end_time: Optional[datetime] = None) -> List[Dict[str, Any]]:
         """Retrieve trading signals."""
         try:
-            query = "SELECT * FROM trading_signals WHERE 1=1"
+            # Make queued signals visible to this read
+            await asyncio.shield(self._flush_signals())
+            
             params = {}
             
             if symbol:
-                query += " AND symbol = %(symbol)s"
                 params['symbol'] = symbol
             
             if strategy:
-                query += " AND strategy = %(strategy)s"
                 params['strategy'] = strategy
             
             if start_time:
-                query += " AND timestamp >= %(start_time)s"
-                params['start_time'] = start_time
+                params['start_time'] = self._as_timestamptz(start_time)
             
             if end_time:
-                query += " AND timestamp <= %(end_time)s"
-                params['end_time'] = end_time
+                params['end_time'] = self._as_timestamptz(end_time)
             
-            query += " ORDER BY timestamp DESC"
-            
-            result = pd.read_sql(
-                text(query),
-                self.engine,
-                params=params,
-                parse_dates=['timestamp']
-            )
+            query, names = _SIGNALS_QUERIES[frozenset(params)]
+            result = await self._fetch_frame(query, *(params[name] for name in names), parse_dates=['timestamp'])
             
             return result.to_dict('records')
             
@@ -616,38 +1301,18 @@ class PostgreSQLDataLayer(DataLayerInterface):
             if data.empty:
                 return True
             
-            data_copy = data.copy()
-            data_copy['underlying'] = underlying
-            data_copy['expiry_date'] = expiry_date
-            
-            if 'timestamp' not in data_copy.columns:
-                data_copy['timestamp'] = get_current_time()
-            
-            # Fill missing columns
-            required_columns = [
-                'strike', 'option_type', 'ltp', 'bid', 'ask', 'volume',
-                'open_interest', 'delta', 'gamma', 'theta', 'vega',
-                'implied_volatility', 'moneyness', 'time_to_expiry'
-            ]
-            
-            for col in required_columns:
-                if col not in data_copy.columns:
-                    if col == 'option_type':
-                        data_copy[col] = 'CE'
-                    elif col in ['volume', 'open_interest']:
-                        data_copy[col] = 0
-                    else:
-                        data_copy[col] = 0.0
-            
-            data_copy.to_sql(
-                'options_data',
-                self.engine,
-                if_exists='append',
-                index=False,
-                method='multi',
-                chunksize=500
+            records = _frame_rows(
+                data, _OPTIONS_DATA_COLUMNS,
+                overrides={
+                    'timestamp': _utc_timestamps(data, get_current_time()),
+                    'underlying': underlying,
+                    'expiry_date': pd.Timestamp(expiry_date).date()
+                },
+                defaults={'option_type': 'CE'}
             )
             
+            await self._copy_rows('options_data', records, _OPTIONS_DATA_COLUMNS)
+            
             self.logger.debug(f"Stored options data for {underlying}")
             return True
             
@@ -660,22 +1325,16 @@ class PostgreSQLDataLayer(DataLayerInterface):
         try:
             query = """
             SELECT * FROM options_data 
-            WHERE underlying = %(underlying)s 
-            AND expiry_date = %(expiry_date)s
+            WHERE underlying = $1 
+            AND expiry_date = $2
             ORDER BY strike ASC, option_type ASC
             """
             
-            params = {
-                'underlying': underlying,
-                'expiry_date': expiry_date
-            }
-            
-            result = pd.read_sql(
-                text(query),
-                self.engine,
-                params=params,
-                parse_dates=['timestamp', 'expiry_date']
+            result = await self._fetch_frame(
+                query, underlying, pd.Timestamp(expiry_date).date(), parse_dates=['timestamp']
             )
+            if not result.empty:
+                result['expiry_date'] = pd.to_datetime(result['expiry_date'])
             
             return result
             
@@ -692,31 +1351,26 @@ class PostgreSQLDataLayer(DataLayerInterface):
             (timestamp, strategy, symbol, total_trades, winning_trades, 
              losing_trades, total_pnl, max_drawdown, sharpe_ratio, 
              win_rate, avg_win, avg_loss, metadata)
-            VALUES (%(timestamp)s, %(strategy)s, %(symbol)s, %(total_trades)s,
-                    %(winning_trades)s, %(losing_trades)s, %(total_pnl)s,
-                    %(max_drawdown)s, %(sharpe_ratio)s, %(win_rate)s,
-                    %(avg_win)s, %(avg_loss)s, %(metadata)s)
+            VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10, $11, $12, $13)
             """
             
-            params = {
-                'timestamp': performance_data.get('timestamp', get_current_time()),
-                'strategy': strategy,
-                'symbol': symbol,
-                'total_trades': int(performance_data.get('total_trades', 0)),
-                'winning_trades': int(performance_data.get('winning_trades', 0)),
-                'losing_trades': int(performance_data.get('losing_trades', 0)),
-                'total_pnl': float(performance_data.get('total_pnl', 0.0)),
-                'max_drawdown': float(performance_data.get('max_drawdown', 0.0)),
-                'sharpe_ratio': float(performance_data.get('sharpe_ratio', 0.0)),
-                'win_rate': float(performance_data.get('win_rate', 0.0)),
-                'avg_win': float(performance_data.get('avg_win', 0.0)),
-                'avg_loss': float(performance_data.get('avg_loss', 0.0)),
-                'metadata': performance_data.get('metadata', '{}')
-            }
-            
-            with self.engine.connect() as conn:
-                conn.execute(text(query), params)
-                conn.commit()
+            async with self._raw_connection() as conn:
+                await conn.execute(
+                    query,
+                    self._as_timestamptz(performance_data.get('timestamp', get_current_time())),
+                    strategy,
+                    symbol,
+                    int(performance_data.get('total_trades', 0)),
+                    int(performance_data.get('winning_trades', 0)),
+                    int(performance_data.get('losing_trades', 0)),
+                    float(performance_data.get('total_pnl', 0.0)),
+                    float(performance_data.get('max_drawdown', 0.0)),
+                    float(performance_data.get('sharpe_ratio', 0.0)),
+                    float(performance_data.get('win_rate', 0.0)),
+                    float(performance_data.get('avg_win', 0.0)),
+                    float(performance_data.get('avg_loss', 0.0)),
+                    performance_data.get('metadata') or {}
+                )
             
             return True
             
@@ -727,38 +1381,57 @@ class PostgreSQLDataLayer(DataLayerInterface):
     async def get_performance_summary(self, strategy: Optional[str] = None,
                                     symbol: Optional[str] = None,
                                     days: int = 30) -> Dict[str, Any]:
-        """Get performance summary."""
+        """
+        Get performance summary.
+        
+        Reads the strategy_performance_daily rollup when TimescaleDB is
+        available; the window then starts at the beginning of the first day.
+        """
         try:
-            query = """
-            SELECT 
-                strategy,
-                symbol,
-                SUM(total_trades) as total_trades,
-                SUM(winning_trades) as winning_trades,
-                SUM(losing_trades) as losing_trades,
-                SUM(total_pnl) as total_pnl,
-                MAX(max_drawdown) as max_drawdown,
-                AVG(sharpe_ratio) as avg_sharpe_ratio,
-                AVG(win_rate) as avg_win_rate
-            FROM strategy_performance 
-            WHERE timestamp >= %(start_date)s
-            """
-            
-            params = {
-                'start_date': get_current_time() - timedelta(days=days)
-            }
+            if self._performance_rollup:
+                query = """
+                SELECT 
+                    strategy,
+                    symbol,
+                    SUM(total_trades) as total_trades,
+                    SUM(winning_trades) as winning_trades,
+                    SUM(losing_trades) as losing_trades,
+                    SUM(total_pnl) as total_pnl,
+                    MAX(max_drawdown) as max_drawdown,
+                    SUM(sharpe_ratio_sum) / NULLIF(SUM(sharpe_ratio_count), 0) as avg_sharpe_ratio,
+                    SUM(win_rate_sum) / NULLIF(SUM(win_rate_count), 0) as avg_win_rate
+                FROM strategy_performance_daily 
+                WHERE day >= time_bucket(INTERVAL '1 day', $1::timestamptz)
+                """
+            else:
+                query = """
+                SELECT 
+                    strategy,
+                    symbol,
+                    SUM(total_trades) as total_trades,
+                    SUM(winning_trades) as winning_trades,
+                    SUM(losing_trades) as losing_trades,
+                    SUM(total_pnl) as total_pnl,
+                    MAX(max_drawdown) as max_drawdown,
+                    AVG(sharpe_ratio) as avg_sharpe_ratio,
+                    AVG(win_rate) as avg_win_rate
+                FROM strategy_performance 
+                WHERE timestamp >= $1
+                """
+            
+            args = [self._as_timestamptz(get_current_time() - timedelta(days=days))]
             
             if strategy:
-                query += " AND strategy = %(strategy)s"
-                params['strategy'] = strategy
+                args.append(strategy)
+                query += f" AND strategy = ${len(args)}"
             
             if symbol:
-                query += " AND symbol = %(symbol)s"
-                params['symbol'] = symbol
+                args.append(symbol)
+                query += f" AND symbol = ${len(args)}"
             
             query += " GROUP BY strategy, symbol"
             
-            result = pd.read_sql(text(query), self.engine, params=params)
+            result = await self._fetch_frame(query, *args)
             
             if not result.empty:
                 return result.to_dict('records')[0]
@@ -772,11 +1445,7 @@ class PostgreSQLDataLayer(DataLayerInterface):
     async def execute_query(self, query: str, parameters: Optional[Dict] = None) -> Any:
         """Execute a custom query."""
         try:
-            result = pd.read_sql(
-                text(query),
-                self.engine,
-                params=parameters or {}
-            )
+            result = await self._read_frame(query, parameters)
             
             return result
             
@@ -787,17 +1456,17 @@ class PostgreSQLDataLayer(DataLayerInterface):
     async def health_check(self) -> Dict[str, Any]:
         """Check the health of PostgreSQL."""
         try:
-            with self.engine.connect() as conn:
+            async with self.async_engine.connect() as conn:
                 # Basic connectivity test
-                result = conn.execute(text("SELECT 1")).fetchone()
+                result = (await conn.execute(text("SELECT 1"))).fetchone()
                 
                 # Get database size
-                db_size = conn.execute(text("""
+                db_size = (await conn.execute(text("""
                     SELECT pg_size_pretty(pg_database_size(current_database()))
-                """)).fetchone()
+                """))).fetchone()
                 
                 # Get table sizes
-                table_sizes = conn.execute(text("""
+                table_sizes = (await conn.execute(text("""
                     SELECT 
                         schemaname,
                         tablename,
@@ -806,14 +1475,14 @@ class PostgreSQLDataLayer(DataLayerInterface):
                     FROM pg_tables 
                     WHERE schemaname = 'public'
                     ORDER BY pg_total_relation_size(schemaname||'.'||tablename) DESC;
-                """)).fetchall()
+                """))).fetchall()
                 
                 # Get connection info
-                conn_info = conn.execute(text("""
+                conn_info = (await conn.execute(text("""
                     SELECT count(*) as active_connections
                     FROM pg_stat_activity 
                     WHERE state = 'active';
-                """)).fetchone()
+                """))).fetchone()
                 
             return {
                 'status': 'healthy' if result and result[0] == 1 else 'unhealthy',
@@ -831,20 +1500,14 @@ class PostgreSQLDataLayer(DataLayerInterface):
             }
     
     async def optimize_storage(self) -> bool:
-        """Optimize PostgreSQL storage."""
+        """
+        Run an on-demand VACUUM ANALYZE.
+        
+        Routine cleanup is left to the per-table autovacuum settings; this
+        only covers recently written data (see _vacuum_tables).
+        """
         try:
-            with self.engine.connect() as conn:
-                # Run VACUUM and ANALYZE on all tables
-                tables = ['market_data', 'historical_data', 'trading_signals', 
-                         'options_data', 'strategy_performance']
-                
-                for table in tables:
-                    conn.execute(text(f"VACUUM ANALYZE {table}"))
-                
-                # Update statistics
-                conn.execute(text("ANALYZE"))
-                
-                conn.commit()
+            await asyncio.to_thread(self._vacuum_tables)
             
             self.logger.info("Storage optimization completed")
             return True
@@ -853,45 +1516,51 @@ class PostgreSQLDataLayer(DataLayerInterface):
             self.logger.error(f"Error optimizing storage: {e}")
             return False
     
+    def _vacuum_tables(self):
+        """
+        VACUUM ANALYZE plain tables and only the last two days' chunks of
+        hypertables (older chunks are compressed and no longer change), in a
+        single statement. VACUUM cannot run inside a transaction block.
+        """
+        tables = ['market_data', 'historical_data', 'trading_signals', 
+                 'options_data', 'strategy_performance']
+        
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            targets = []
+            for table in tables:
+                if table in self._hypertables:
+                    targets.extend(conn.execute(text(
+                        "SELECT show_chunks(CAST(:table AS regclass), "
+                        "newer_than => now() - INTERVAL '2 days')::text;"
+                    ), {'table': table}).scalars())
+                else:
+                    targets.append(table)
+            
+            if targets:
+                conn.execute(text(f"VACUUM (ANALYZE) {', '.join(targets)}"))
+    
     async def batch_store_market_data(self, batch_data: List[Dict[str, Any]]) -> bool:
         """Store multiple market data records in a batch."""
         try:
             if not batch_data:
                 return True
             
-            # Convert to DataFrame for efficient insertion
+            # Convert to DataFrame so timestamps are normalized column-wise
             df = pd.DataFrame(batch_data)
             
-            # Fill missing columns
-            required_columns = [
-                'timestamp', 'symbol', 'asset_type', 'runner_name',
-                'open', 'high', 'low', 'close', 'ltp', 'volume', 'turnover',
-                'price_change', 'price_change_pct', 'volatility',
-                'bid_price', 'ask_price', 'bid_size', 'ask_size'
-            ]
-            
-            for col in required_columns:
-                if col not in df.columns:
-                    if col == 'timestamp':
-                        df[col] = get_current_time()
-                    elif col in ['bid_size', 'ask_size', 'volume']:
-                        df[col] = 0
-                    else:
-                        df[col] = 0.0
-            
-            # Add metadata
-            if 'metadata' not in df.columns:
-                df['metadata'] = '{}'
-            
-            df.to_sql(
-                'market_data',
-                self.engine,
-                if_exists='append',
-                index=False,
-                method='multi',
-                chunksize=1000
+            records = _frame_rows(
+                df, _MARKET_DATA_COLUMNS,
+                overrides={
+                    'timestamp': _utc_timestamps(df, get_current_time()),
+                    'metadata': df['metadata'].map(_json_text) if 'metadata' in df.columns else '{}'
+                },
+                defaults={'symbol': '', 'asset_type': '', 'runner_name': ''}
             )
             
+            await self._copy_rows('market_data', records, _MARKET_DATA_COLUMNS)
+            if 'symbol' in df.columns:
+                self._invalidate_latest(*df['symbol'].unique())
+            
             self.logger.debug(f"Batch stored {len(batch_data)} market data records")
             return True
             
@@ -900,13 +1569,20 @@ class PostgreSQLDataLayer(DataLayerInterface):
             return False
     
     async def get_symbols_by_asset_type(self, asset_type: str) -> List[str]:
-        """Get all symbols for a specific asset type."""
+        """
+        Get all symbols for a specific asset type.
+        
+        Reads the market_data_symbols_daily rollup when TimescaleDB is
+        available instead of scanning every market_data row.
+        """
         try:
-            with self.engine.connect() as conn:
-                result = conn.execute(
-                    text("SELECT DISTINCT symbol FROM market_data WHERE asset_type = :asset_type"),
-                    {"asset_type": asset_type}
-                ).fetchall()
+            source = 'market_data_symbols_daily' if self._symbols_rollup else 'market_data'
+            
+            async with self._raw_connection() as conn:
+                result = await conn.fetch(
+                    f"SELECT DISTINCT symbol FROM {source} WHERE asset_type = $1",
+                    asset_type
+                )
                 
                 return [row[0] for row in result]
             
@@ -915,23 +1591,30 @@ class PostgreSQLDataLayer(DataLayerInterface):
             return []
     
     async def cleanup_old_data(self, days_to_keep: int = 365) -> bool:
-        """Clean up old data beyond the retention period."""
+        """
+        Clean up old data beyond the retention period.
+        
+        Hypertables drop whole chunks older than the cutoff, so retention is
+        exact to the chunk interval; plain tables delete rows in short
+        batches (see _delete_before).
+        """
         try:
-            cutoff_date = get_current_time() - timedelta(days=days_to_keep)
+            cutoff_date = self._as_timestamptz(get_current_time() - timedelta(days=days_to_keep))
             
             tables = ['market_data', 'historical_data', 'trading_signals', 
                      'options_data', 'strategy_performance']
             
-            with self.engine.connect() as conn:
+            async with self._raw_connection() as conn:
                 for table in tables:
-                    result = conn.execute(
-                        text(f"DELETE FROM {table} WHERE timestamp < :cutoff_date"),
-                        {"cutoff_date": cutoff_date}
-                    )
-                    
-                    self.logger.info(f"Deleted {result.rowcount} old records from {table}")
-                
-                conn.commit()
+                    if table in self._hypertables:
+                        dropped = await conn.fetch(
+                            f"SELECT drop_chunks('{table}', older_than => $1::timestamptz)",
+                            cutoff_date
+                        )
+                        self.logger.info(f"Dropped {len(dropped)} old chunks from {table}")
+                    else:
+                        deleted = await self._delete_before(conn, table, cutoff_date)
+                        self.logger.info(f"Deleted {deleted} old records from {table}")
             
             self.logger.info(f"Cleaned up data older than {days_to_keep} days")
             return True
@@ -939,3 +1622,28 @@ class PostgreSQLDataLayer(DataLayerInterface):
         except Exception as e:
             self.logger.error(f"Error cleaning up old data: {e}")
             return False
+    
+    async def _delete_before(self, conn, table: str, cutoff_date: datetime) -> int:
+        """
+        Delete rows older than cutoff_date from a plain table, CLEANUP_BATCH_SIZE
+        rows per autocommitted statement, so no single transaction holds row
+        locks on (or writes WAL for) the whole backlog.
+        
+        Returns:
+            Number of rows deleted
+        """
+        # Batches are located through the timestamp index that
+        # _sync_timestamp_indexes keeps on every plain table
+        deleted = 0
+        while True:
+            status = await conn.execute(f"""
+                DELETE FROM {table} WHERE ctid IN (
+                    SELECT ctid FROM {table} WHERE timestamp < $1 LIMIT {self.CLEANUP_BATCH_SIZE}
+                )
+            """, cutoff_date)
+            count = int(status.split()[-1])
+            deleted += count
+            
+            if count < self.CLEANUP_BATCH_SIZE:
+                return deleted
+            await asyncio.sleep(self.CLEANUP_BATCH_PAUSE)
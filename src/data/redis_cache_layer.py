@@ -8,17 +8,137 @@ Used in conjunction with primary data storage for optimal performance.
 import asyncio
 import json
 import pickle
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Union
+from typing import Awaitable, Callable, Dict, List, Optional, Any, Set, Tuple, Union
+import numpy as np
 import pandas as pd
 import logging
 
 import redis.asyncio as redis
 import redis.exceptions
+from redis.utils import HIREDIS_AVAILABLE
+
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import lz4.frame
+    LZ4_AVAILABLE = True
+except ImportError:
+    LZ4_AVAILABLE = False
 
 from ..utils.logger_setup import setup_logger
 from ..utils.timezone_utils import get_current_time, to_ist, to_utc, is_market_hours
 
+# Marks DataFrames cached as an Arrow IPC stream; other DataFrame payloads
+# are pickled row records
+_ARROW_MAGIC = b'ARW1'
+
+# Marks dicts/lists cached as MessagePack; without the tag they are JSON
+_MSGPACK_MAGIC = b'MPK1'
+
+# Marks an LZ4-compressed payload; the decompressed bytes carry their own tag
+_LZ4_MAGIC = b'LZ41'
+
+# Payloads smaller than this are stored uncompressed
+_COMPRESS_MIN_BYTES = 256
+
+# DataFrames with more rows / payloads with more bytes than this are
+# (de)serialized in a worker thread so they don't stall the event loop
+_OFFLOAD_ROWS = 5_000
+_OFFLOAD_BYTES = 256 * 1024
+
+
+def _dataframe_to_arrow(df: pd.DataFrame) -> bytes:
+    """Serialize a DataFrame column-wise as an Arrow IPC stream (LZ4 when available)."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    options = pa.ipc.IpcWriteOptions(
+        compression='lz4' if pa.Codec.is_available('lz4') else None
+    )
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+        writer.write_table(table)
+    return _ARROW_MAGIC + sink.getvalue().to_pybytes()
+
+
+def _downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Return a copy of df with float64 columns as float32 and int64 columns as
+    int32 where every value fits. Narrower integer types are avoided: cached
+    volumes or counts in int8/int16 would overflow on the reader's arithmetic.
+    The input is untouched.
+    """
+    columns = {col: df[col].astype('float32') for col in df.select_dtypes('float64').columns}
+    int32 = np.iinfo(np.int32)
+    for col in df.select_dtypes('int64').columns:
+        values = df[col]
+        if values.empty or (values.min() >= int32.min and values.max() <= int32.max):
+            columns[col] = values.astype('int32')
+    return df.assign(**columns) if columns else df
+
+
+def _compress(payload: bytes) -> bytes:
+    """LZ4-compress a serialized payload unless it is small or already compressed."""
+    if (not LZ4_AVAILABLE or len(payload) < _COMPRESS_MIN_BYTES
+            or payload.startswith(_ARROW_MAGIC)):
+        return payload
+    return _LZ4_MAGIC + lz4.frame.compress(payload, compression_level=0)
+
+
+def _dataframe_from_arrow(data: bytes) -> pd.DataFrame:
+    """Deserialize a DataFrame written by _dataframe_to_arrow."""
+    return pa.ipc.open_stream(data[len(_ARROW_MAGIC):]).read_all().to_pandas()
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+    
+    Opens after fail_threshold failures in a row. While open, allow() returns
+    False; once reset_after seconds have passed it lets one trial call through
+    per window (half-open). A success closes it again.
+    """
+    
+    def __init__(self, fail_threshold: int = 5, reset_after: float = 30.0):
+        self.fail_threshold = fail_threshold
+        self.reset_after = reset_after
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+    
+    @property
+    def open(self) -> bool:
+        return self._opened_at is not None
+    
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        
+        now = time.monotonic()
+        if now - self._opened_at >= self.reset_after:
+            self._opened_at = now
+            return True
+        return False
+    
+    def success(self):
+        self._failures = 0
+        self._opened_at = None
+    
+    def failure(self):
+        self._failures += 1
+        if self._failures >= self.fail_threshold:
+            self._opened_at = time.monotonic()
+
 
 class RedisCacheLayer:
     """
@@ -33,7 +153,11 @@ class RedisCacheLayer:
     
     def __init__(self, host: str = 'localhost', port: int = 6379,
                  db: int = 0, password: Optional[str] = None,
-                 max_connections: int = 20):
+                 max_connections: int = 20, refresh_concurrency: int = 8,
+                 socket_timeout: Optional[float] = 0.25, local_cache_size: int = 10_000,
+                 socket_connect_timeout: Optional[float] = 0.25,
+                 bulk_socket_timeout: Optional[float] = 10.0,
+                 retry_on_timeout: bool = False):
         """
         Initialize Redis cache layer.
         
@@ -43,17 +167,60 @@ class RedisCacheLayer:
             db: Redis database number
             password: Redis password (if required)
             max_connections: Maximum connections in pool
+            refresh_concurrency: Maximum concurrent stale-while-revalidate refreshes
+            socket_timeout: Seconds a hot-path command waits for its reply
+                (None waits forever)
+            local_cache_size: Entries kept in the in-process cache used by
+                get_or_set_swr(local_ttl=...)
+            socket_connect_timeout: Seconds to establish a connection
+            bulk_socket_timeout: Reply timeout for admin commands (INFO, FLUSHDB,
+                SCAN walks) and multi-symbol MGETs / pipelines, which run on a
+                separate connection pool (None waits forever)
+            retry_on_timeout: Retry a command once after a timeout (doubles
+                the worst-case latency of a slow call)
         """
         self.host = host
         self.port = port
         self.db = db
         self.password = password
         self.max_connections = max_connections
+        self.socket_timeout = socket_timeout
+        self.socket_connect_timeout = socket_connect_timeout
+        self.bulk_socket_timeout = bulk_socket_timeout
+        self.retry_on_timeout = retry_on_timeout
         
         self.pool = None
         self.redis = None
+        
+        # Client for slow admin and bulk commands, so their replies aren't cut
+        # off by (and don't trip the breaker through) the hot-path timeout
+        self._bulk_pool = None
+        self._bulk_redis = None
         self.logger = setup_logger(name="RedisCacheLayer")
         self._initialized = False
+        self._init_lock = asyncio.Lock()
+        
+        # Users sharing this layer; the connection pool closes with the last one
+        self._ref_count = 1
+        
+        # Background stale-while-revalidate refreshes (kept referenced until done).
+        # At most refresh_concurrency run at once and each key refreshes once
+        # per process at a time, so expiry storms can't flood primary storage.
+        self._refresh_tasks: Set[asyncio.Task] = set()
+        self._refresh_sem = asyncio.Semaphore(refresh_concurrency)
+        self._inflight: Set[str] = set()
+        
+        # Skip Redis entirely after repeated failures, so a dead or slow Redis
+        # costs nothing instead of a timeout on every call
+        self._breaker = CircuitBreaker(fail_threshold=5, reset_after=30.0)
+        
+        # In-process LRU in front of Redis for hot keys: key -> (expires_at, value).
+        # Writes and invalidations through this layer drop entries; other
+        # processes' writes show up once the entry's local TTL runs out.
+        # Concurrent local misses for a key share one load.
+        self.local_cache_size = local_cache_size
+        self._local: OrderedDict = OrderedDict()
+        self._local_loads: Dict[str, asyncio.Future] = {}
         
         # Cache key prefixes
         self.PREFIXES = {
@@ -78,42 +245,80 @@ class RedisCacheLayer:
             'session': 86400,        # 24 hours
             'analytics': 600         # 10 minutes
         }
+        
+        # Keys per SCAN page / UNLINK call when walking the keyspace by pattern
+        self.SCAN_BATCH = 500
+    
+    def retain(self) -> 'RedisCacheLayer':
+        """Register another user of this (shared) layer; each user calls close() once."""
+        self._ref_count += 1
+        return self
     
     async def initialize(self) -> bool:
-        """Initialize Redis connection."""
-        try:
-            # Create connection pool
-            self.pool = redis.ConnectionPool(
-                host=self.host,
-                port=self.port,
-                db=self.db,
-                password=self.password,
-                max_connections=self.max_connections,
-                decode_responses=False,  # Handle binary data
-                retry_on_timeout=True,
-                health_check_interval=30
-            )
-            
-            # Create Redis client
-            self.redis = redis.Redis(connection_pool=self.pool)
-            
-            # Test connection
-            await self.redis.ping()
-            
-            # Set up Redis configuration
-            await self._setup_redis_config()
-            
-            self._initialized = True
-            self.logger.info("Redis cache layer initialized successfully")
-            return True
-            
-        except Exception as e:
-            self.logger.error(f"Failed to initialize Redis cache layer: {e}")
-            return False
+        """Initialize Redis connection (no-op if a sharing user already did)."""
+        async with self._init_lock:
+            if self._initialized:
+                return True
+            
+            try:
+                # Create connection pools
+                self.pool = self._create_pool(self.max_connections, self.socket_timeout)
+                self._bulk_pool = self._create_pool(self.BULK_MAX_CONNECTIONS, self.bulk_socket_timeout)
+                
+                # redis-py picks the hiredis C parser on its own when installed
+                if not HIREDIS_AVAILABLE:
+                    self.logger.warning("hiredis not installed; Redis replies are parsed in pure Python")
+                
+                # Create Redis clients
+                self.redis = redis.Redis(connection_pool=self.pool)
+                self._bulk_redis = redis.Redis(connection_pool=self._bulk_pool)
+                
+                # Test connection
+                await self.redis.ping()
+                
+                # Set up Redis configuration
+                await self._setup_redis_config()
+                
+                self._initialized = True
+                self.logger.info("Redis cache layer initialized successfully")
+                return True
+                
+            except Exception as e:
+                self.logger.error(f"Failed to initialize Redis cache layer: {e}")
+                return False
+    
+    # Connections in the admin / bulk pool
+    BULK_MAX_CONNECTIONS = 4
+    
+    def _create_pool(self, max_connections: int,
+                     socket_timeout: Optional[float]) -> redis.ConnectionPool:
+        """Create a connection pool with the given reply timeout."""
+        return redis.ConnectionPool(
+            host=self.host,
+            port=self.port,
+            db=self.db,
+            password=self.password,
+            max_connections=max_connections,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=self.socket_connect_timeout,
+            decode_responses=False,  # Handle binary data
+            retry_on_timeout=self.retry_on_timeout,
+            health_check_interval=30
+        )
     
     async def close(self):
-        """Close Redis connections."""
+        """Close Redis connections once the last user (see retain()) closes."""
+        if self._ref_count > 1:
+            self._ref_count -= 1
+            return
+        self._ref_count = 0
+        
         try:
+            for task in self._refresh_tasks:
+                task.cancel()
+            
+            self._local.clear()
+            
             if self.redis:
                 await self.redis.aclose()
                 self.redis = None
@@ -122,6 +327,14 @@ class RedisCacheLayer:
                 await self.pool.aclose()
                 self.pool = None
             
+            if self._bulk_redis:
+                await self._bulk_redis.aclose()
+                self._bulk_redis = None
+            
+            if self._bulk_pool:
+                await self._bulk_pool.aclose()
+                self._bulk_pool = None
+            
             self._initialized = False
             self.logger.info("Redis cache layer closed")
         except Exception as e:
@@ -139,7 +352,7 @@ class RedisCacheLayer:
             
             for key, value in config_commands:
                 try:
-                    await self.redis.config_set(key, value)
+                    await self._bulk_redis.config_set(key, value)
                 except Exception as e:
                     self.logger.debug(f"Could not set Redis config {key}: {e}")
             
@@ -148,6 +361,10 @@ class RedisCacheLayer:
         except Exception as e:
             self.logger.warning(f"Could not optimize Redis configuration: {e}")
     
+    def _cache_available(self) -> bool:
+        """Whether cache calls should reach Redis (initialized and breaker not open)."""
+        return self._initialized and self._breaker.allow()
+    
     def _make_key(self, prefix: str, *args) -> str:
         """Create a standardized cache key."""
         key_parts = [self.PREFIXES.get(prefix, prefix)]
@@ -155,14 +372,33 @@ class RedisCacheLayer:
         return ':'.join(key_parts)
     
     async def _serialize_data(self, data: Any) -> bytes:
-        """Serialize data for Redis storage."""
+        """Serialize data for Redis storage (LZ4-compressed above a size threshold)."""
+        if isinstance(data, pd.DataFrame) and len(data) > _OFFLOAD_ROWS:
+            return await asyncio.to_thread(lambda: _compress(self._encode(data)))
+        return _compress(self._encode(data))
+    
+    def _encode(self, data: Any) -> bytes:
+        """Encode data into its tagged (Arrow/MessagePack) or plain JSON/pickle form."""
         try:
             if isinstance(data, pd.DataFrame):
+                if PYARROW_AVAILABLE:
+                    # Column-oriented: each column is one typed buffer instead of
+                    # per-row dicts repeating every column name
+                    try:
+                        return _dataframe_to_arrow(data)
+                    except (pa.ArrowException, TypeError, ValueError) as e:
+                        self.logger.debug(f"Falling back to pickled records: {e}")
+                
                 # Use pickle for DataFrames (more efficient than JSON)
                 return pickle.dumps(data.to_dict('records'))
             elif isinstance(data, pd.Series):
                 return pickle.dumps(data.to_dict())
             elif isinstance(data, (dict, list)):
+                if MSGPACK_AVAILABLE:
+                    try:
+                        return _MSGPACK_MAGIC + msgpack.packb(data, use_bin_type=True)
+                    except (TypeError, ValueError, OverflowError):
+                        pass  # Types msgpack can't encode take the JSON/pickle path
                 return json.dumps(data).encode('utf-8')
             else:
                 return pickle.dumps(data)
@@ -171,13 +407,37 @@ class RedisCacheLayer:
             return pickle.dumps(data)
     
     async def _deserialize_data(self, data: bytes, data_type: str = 'auto') -> Any:
-        """Deserialize data from Redis."""
+        """Deserialize data from Redis (large payloads in a worker thread)."""
+        if len(data) > _OFFLOAD_BYTES:
+            return await asyncio.to_thread(self._decode, data, data_type)
+        return self._decode(data, data_type)
+    
+    def _decode(self, data: bytes, data_type: str = 'auto') -> Any:
+        """Decode a payload written by _serialize_data."""
         try:
-            if data_type == 'json':
+            if data.startswith(_LZ4_MAGIC):
+                if not LZ4_AVAILABLE:
+                    self.logger.warning("Cached LZ4 payload found but lz4 is not installed")
+                    return None
+                data = lz4.frame.decompress(data[len(_LZ4_MAGIC):])
+            
+            if data.startswith(_ARROW_MAGIC):
+                if not PYARROW_AVAILABLE:
+                    self.logger.warning("Cached Arrow payload found but pyarrow is not installed")
+                    return None
+                return _dataframe_from_arrow(data)
+            elif data.startswith(_MSGPACK_MAGIC):
+                if not MSGPACK_AVAILABLE:
+                    self.logger.warning("Cached MessagePack payload found but msgpack is not installed")
+                    return None
+                return msgpack.unpackb(data[len(_MSGPACK_MAGIC):], raw=False)
+            elif data_type == 'json':
                 return json.loads(data.decode('utf-8'))
             elif data_type == 'dataframe':
                 records = pickle.loads(data)
                 return pd.DataFrame(records)
+            elif data_type == 'series':
+                return pd.Series(pickle.loads(data))
             else:
                 # Auto-detect or use pickle
                 try:
@@ -188,49 +448,377 @@ class RedisCacheLayer:
             self.logger.error(f"Error deserializing data: {e}")
             return None
     
+    # Stale-While-Revalidate Reads
+    async def get_or_set_swr(self, prefix: str, key_args: tuple,
+                             factory: Callable[[], Awaitable[Any]],
+                             ttl: Optional[int] = None, stale_ttl: Optional[int] = None,
+                             data_type: str = 'auto', downcast: bool = False,
+                             negative_ttl: Optional[int] = None,
+                             local_ttl: Optional[float] = None) -> Any:
+        """
+        Read through the cache with stale-while-revalidate semantics.
+        
+        The value is stored for ttl + stale_ttl seconds next to a
+        '<key>:fresh_until' marker that expires after ttl seconds. A fresh
+        value is returned as is. A stale value (marker expired) is returned
+        immediately while a single background task, guarded by a
+        '<key>:refreshing' SET NX lock, reloads it through factory. Only a
+        complete miss waits for factory.
+        
+        With negative_ttl, an empty result from factory is remembered by a
+        '<key>:miss' marker, and later reads return an empty result without
+        calling factory until the marker expires or the key is written.
+        
+        Args:
+            prefix: Cache key prefix name (see PREFIXES)
+            key_args: Remaining cache key parts
+            factory: Coroutine function loading the value from primary storage
+            ttl: Seconds the value is fresh (defaults to TTL[prefix])
+            stale_ttl: Extra seconds a stale value may be served (defaults to ttl)
+            data_type: Deserialization hint for _deserialize_data
+            downcast: Store DataFrames with 32-bit floats / int32 where values fit
+                (the value returned to the caller keeps its dtypes)
+            negative_ttl: Seconds an empty result is remembered (disabled if None)
+            local_ttl: Seconds a value is also kept in this process and served
+                without a Redis round trip (disabled if None or 0); each caller
+                gets its own copy, so mutating a result can't corrupt the entry
+            
+        Returns:
+            Cached or freshly loaded value
+        """
+        if not self._cache_available():
+            return await factory()
+        
+        key = self._make_key(prefix, *key_args)
+        
+        if local_ttl:
+            value = self._local_get(key)
+            if value is not None:
+                return self._private_copy(value)
+            
+            load = self._local_loads.get(key)
+            if load is None:
+                load = asyncio.ensure_future(self._read_through(
+                    key, prefix, factory, ttl, stale_ttl, data_type, downcast, negative_ttl
+                ))
+                self._local_loads[key] = load
+                load.add_done_callback(lambda _: self._local_loads.pop(key, None))
+            
+            value = await asyncio.shield(load)
+            if self._is_cacheable(value):
+                self._local_put(key, value, local_ttl)
+            # Concurrent callers share the load's result as well as the entry
+            return self._private_copy(value)
+        
+        return await self._read_through(
+            key, prefix, factory, ttl, stale_ttl, data_type, downcast, negative_ttl
+        )
+    
+    async def _read_through(self, key: str, prefix: str,
+                            factory: Callable[[], Awaitable[Any]],
+                            ttl: Optional[int], stale_ttl: Optional[int],
+                            data_type: str, downcast: bool,
+                            negative_ttl: Optional[int]) -> Any:
+        """Redis and primary-storage part of get_or_set_swr."""
+        ttl = ttl or self.TTL.get(prefix, 300)
+        stale_ttl = ttl if stale_ttl is None else stale_ttl
+        
+        # Only the Redis round trip counts towards the circuit breaker
+        try:
+            cached, fresh, miss = await self.redis.mget(key, f"{key}:fresh_until", f"{key}:miss")
+            self._breaker.success()
+        except Exception as e:
+            self._breaker.failure()
+            self.logger.error(f"Error reading {key} from cache: {e}")
+            return await factory()
+        
+        if cached is not None:
+            value = await self._deserialize_data(cached, data_type)
+            if value is not None:
+                if fresh is None:
+                    self._schedule_refresh(key, factory, ttl, stale_ttl, downcast)
+                self.logger.debug(f"Served {key} from cache ({'fresh' if fresh else 'stale'})")
+                return value
+        
+        if miss is not None and negative_ttl:
+            self.logger.debug(f"Served {key} from negative cache")
+            return pd.DataFrame() if data_type == 'dataframe' else None
+        
+        value = await factory()
+        if negative_ttl and not self._is_cacheable(value):
+            await self._store_miss(key, negative_ttl)
+        else:
+            await self._store_swr(key, value, ttl, stale_ttl, downcast)
+        return value
+    
+    def _local_get(self, key: str) -> Any:
+        """Return an unexpired in-process entry (refreshing its LRU position), else None."""
+        entry = self._local.get(key)
+        if entry is None:
+            return None
+        
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._local[key]
+            return None
+        
+        self._local.move_to_end(key)
+        return value
+    
+    def _local_put(self, key: str, value: Any, local_ttl: float):
+        """Keep a value in process for local_ttl seconds, evicting the least recently used."""
+        self._local[key] = (time.monotonic() + local_ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_cache_size:
+            self._local.popitem(last=False)
+    
+    @staticmethod
+    def _private_copy(value: Any) -> Any:
+        """Shallow-copy a mutable in-process value before handing it to a caller."""
+        if isinstance(value, (pd.DataFrame, pd.Series, list, dict)):
+            return value.copy()
+        return value
+    
+    def _local_drop(self, *keys: str):
+        """Forget in-process copies of keys written or invalidated through this layer."""
+        for key in keys:
+            self._local.pop(key, None)
+    
+    @staticmethod
+    def _is_cacheable(value: Any) -> bool:
+        """Whether a loaded value is worth caching (not None or empty)."""
+        if isinstance(value, (pd.DataFrame, pd.Series)):
+            return not value.empty
+        return bool(value)
+    
+    async def _store_swr(self, key: str, value: Any, ttl: int, stale_ttl: int,
+                         downcast: bool = False):
+        """Store a value and its freshness marker in one round trip."""
+        self._local_drop(key)
+        if not self._is_cacheable(value):
+            return
+        
+        try:
+            if downcast and isinstance(value, pd.DataFrame):
+                value = _downcast_numeric(value)
+            
+            serialized_data = await self._serialize_data(value)
+            
+            async with self.redis.pipeline(transaction=False) as pipe:
+                self._pipe_swr(pipe, key, serialized_data, ttl, stale_ttl)
+                await pipe.execute()
+            self._breaker.success()
+                
+        except Exception as e:
+            self._breaker.failure()
+            self.logger.error(f"Error caching {key}: {e}")
+    
+    async def _store_miss(self, key: str, negative_ttl: int):
+        """Remember that primary storage had nothing for a key."""
+        try:
+            await self.redis.set(f"{key}:miss", b'1', ex=negative_ttl, nx=True)
+            self._breaker.success()
+        except Exception as e:
+            self._breaker.failure()
+            self.logger.error(f"Error caching miss for {key}: {e}")
+    
+    @staticmethod
+    def _pipe_swr(pipe, key: str, serialized_data: bytes, ttl: int, stale_ttl: int):
+        """Queue a value and its freshness marker on a pipeline."""
+        pipe.setex(key, ttl + stale_ttl, serialized_data)
+        pipe.setex(f"{key}:fresh_until", ttl, int(time.time()) + ttl)
+    
+    def _schedule_refresh(self, key: str, factory: Callable[[], Awaitable[Any]],
+                          ttl: int, stale_ttl: int, downcast: bool = False):
+        """Start a background refresh of a stale key unless one is already in flight."""
+        if key in self._inflight:
+            return
+        self._inflight.add(key)
+        
+        task = asyncio.create_task(self._background_refresh(key, factory, ttl, stale_ttl, downcast))
+        self._refresh_tasks.add(task)
+        task.add_done_callback(self._refresh_tasks.discard)
+    
+    async def _background_refresh(self, key: str, factory: Callable[[], Awaitable[Any]],
+                                  ttl: int, stale_ttl: int, downcast: bool = False):
+        """
+        Reload a stale key unless another client is already refreshing it.
+        
+        Only the Redis lock calls count towards the circuit breaker; a failing
+        factory is a primary-storage problem and must not switch the cache off.
+        """
+        lock_key = f"{key}:refreshing"
+        try:
+            async with self._refresh_sem:
+                try:
+                    locked = await self.redis.set(lock_key, b'1', nx=True, ex=max(ttl, 1))
+                    self._breaker.success()
+                except Exception as e:
+                    self._breaker.failure()
+                    self.logger.error(f"Error locking {key} for refresh: {e}")
+                    return
+                
+                if not locked:
+                    return
+                
+                try:
+                    value = await factory()
+                except Exception as e:
+                    self.logger.error(f"Error reloading {key} from primary storage: {e}")
+                else:
+                    await self._store_swr(key, value, ttl, stale_ttl, downcast)
+                finally:
+                    try:
+                        await self.redis.delete(lock_key)
+                    except Exception as e:
+                        self._breaker.failure()
+                        self.logger.error(f"Error unlocking {key} after refresh: {e}")
+        finally:
+            self._inflight.discard(key)
+    
+    async def invalidate_keys(self, key_specs: List[tuple]) -> bool:
+        """
+        Evict cached keys with their freshness and miss markers in a single UNLINK.
+        
+        Args:
+            key_specs: (prefix, *key_args) tuples as passed to _make_key
+            
+        Returns:
+            True if the keys were evicted
+        """
+        try:
+            if not self._cache_available() or not key_specs:
+                return False
+            
+            keys = []
+            for prefix, *key_args in key_specs:
+                key = self._make_key(prefix, *key_args)
+                self._local_drop(key)
+                keys.extend((key, f"{key}:fresh_until", f"{key}:miss"))
+            
+            await self.redis.unlink(*keys)
+            self._breaker.success()
+            return True
+            
+        except Exception as e:
+            self._breaker.failure()
+            self.logger.error(f"Error invalidating cache keys: {e}")
+            return False
+    
     # Market Data Caching
     async def cache_market_data(self, symbol: str, data: pd.DataFrame, 
-                               asset_type: str = '') -> bool:
-        """Cache market data for a symbol."""
+                               asset_type: str = '', ttl: Optional[int] = None,
+                               latest_ttl: Optional[int] = None) -> bool:
+        """Cache market data for a symbol (TTLs default to TTL['market_data'] / TTL['latest_data'])."""
+        if data.empty:
+            return False
+        return await self.cache_market_data_bulk([(symbol, asset_type, data)], ttl, latest_ttl)
+    
+    async def cache_market_data_bulk(self, items: List[Tuple[str, str, pd.DataFrame]],
+                                     ttl: Optional[int] = None,
+                                     latest_ttl: Optional[int] = None) -> bool:
+        """
+        Cache market data and latest points for many symbols in one pipelined
+        round trip. Frames are serialized in a worker thread. Both keys get
+        freshness markers, so get_or_set_swr readers treat them as fresh.
+        
+        Args:
+            items: (symbol, asset_type, data) tuples
+            ttl: Market data TTL (defaults to TTL['market_data'])
+            latest_ttl: Latest data TTL (defaults to TTL['latest_data'])
+            
+        Returns:
+            True if the items were cached
+        """
         try:
-            if not self._initialized or data.empty:
+            items = [item for item in items if not item[2].empty]
+            if not self._cache_available() or not items:
                 return False
             
-            key = self._make_key('market_data', symbol, asset_type)
-            serialized_data = await self._serialize_data(data)
+            ttl = ttl or self.TTL['market_data']
+            latest_ttl = latest_ttl or self.TTL['latest_data']
+            
+            def serialize():
+                return [
+                    (self._make_key('market_data', symbol, asset_type),
+                     _compress(self._encode(_downcast_numeric(data))),
+                     self._make_key('latest_data', symbol),
+                     _compress(pickle.dumps(data.iloc[-1].to_dict())))
+                    for symbol, asset_type, data in items
+                ]
+            
+            payloads = await asyncio.to_thread(serialize)
+            
+            async with self._bulk_redis.pipeline(transaction=False) as pipe:
+                for key, serialized_data, latest_key, latest_data in payloads:
+                    self._local_drop(key, latest_key)
+                    self._pipe_swr(pipe, key, serialized_data, ttl, ttl)
+                    self._pipe_swr(pipe, latest_key, latest_data, latest_ttl, latest_ttl)
+                await pipe.execute()
+            
+            self.logger.debug(f"Cached market data for {len(items)} symbols")
+            self._breaker.success()
+            return True
             
-            await self.redis.setex(
-                key, 
-                self.TTL['market_data'], 
-                serialized_data
-            )
+        except Exception as e:
+            self._breaker.failure()
+            self.logger.error(f"Error caching market data: {e}")
+            return False
+    
+    async def cache_market_data_batch(self, entries: Dict[tuple, List[Dict[str, Any]]],
+                                      ttl: Optional[int] = None,
+                                      latest_ttl: Optional[int] = None) -> bool:
+        """
+        Cache market data for many symbols in one pipelined round trip.
+        
+        Args:
+            entries: (symbol, asset_type) -> records in timestamp order
+            ttl: Market data TTL (defaults to TTL['market_data'])
+            latest_ttl: Latest data TTL (defaults to TTL['latest_data'])
             
-            # Also cache the latest data point separately for faster access
-            if not data.empty:
-                latest_key = self._make_key('latest_data', symbol)
-                latest_data = await self._serialize_data(data.iloc[-1])
-                await self.redis.setex(
-                    latest_key,
-                    self.TTL['latest_data'],
-                    latest_data
-                )
-            
-            self.logger.debug(f"Cached market data for {symbol}")
+        Returns:
+            True if the entries were cached
+        """
+        try:
+            if not self._cache_available() or not entries:
+                return False
+            
+            ttl = ttl or self.TTL['market_data']
+            latest_ttl = latest_ttl or self.TTL['latest_data']
+            
+            # Records are stored in the same pickled layout _serialize_data
+            # produces for a DataFrame / Series, without building either
+            async with self._bulk_redis.pipeline(transaction=False) as pipe:
+                for (symbol, asset_type), records in entries.items():
+                    if not records:
+                        continue
+                    key = self._make_key('market_data', symbol, asset_type)
+                    latest_key = self._make_key('latest_data', symbol)
+                    self._local_drop(key, latest_key)
+                    self._pipe_swr(pipe, key, _compress(pickle.dumps(records)), ttl, ttl)
+                    self._pipe_swr(pipe, latest_key,
+                                   _compress(pickle.dumps(records[-1])), latest_ttl, latest_ttl)
+                await pipe.execute()
+            
+            self.logger.debug(f"Cached market data for {len(entries)} symbols")
+            self._breaker.success()
             return True
             
         except Exception as e:
-            self.logger.error(f"Error caching market data for {symbol}: {e}")
+            self._breaker.failure()
+            self.logger.error(f"Error batch caching market data: {e}")
             return False
     
     async def get_cached_market_data(self, symbol: str, 
                                    asset_type: str = '') -> Optional[pd.DataFrame]:
         """Retrieve cached market data for a symbol."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return None
             
             key = self._make_key('market_data', symbol, asset_type)
             data = await self.redis.get(key)
+            self._breaker.success()
             
             if data:
                 return await self._deserialize_data(data, 'dataframe')
@@ -238,17 +826,53 @@ class RedisCacheLayer:
             return None
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error getting cached market data for {symbol}: {e}")
             return None
     
+    async def get_cached_market_data_many(self, symbols: List[str],
+                                          asset_type: str = '') -> Dict[str, pd.DataFrame]:
+        """
+        Retrieve cached market data for many symbols with a single MGET.
+        
+        Args:
+            symbols: Symbols to look up
+            asset_type: Asset type part of the cache key
+            
+        Returns:
+            Symbol -> DataFrame for the symbols found in cache
+        """
+        try:
+            if not self._cache_available() or not symbols:
+                return {}
+            
+            keys = [self._make_key('market_data', symbol, asset_type) for symbol in symbols]
+            values = await self._bulk_redis.mget(keys)
+            self._breaker.success()
+            
+            cached = {}
+            for symbol, data in zip(symbols, values):
+                if data is not None:
+                    df = await self._deserialize_data(data, 'dataframe')
+                    if df is not None:
+                        cached[symbol] = df
+            
+            return cached
+            
+        except Exception as e:
+            self._breaker.failure()
+            self.logger.error(f"Error getting cached market data for {len(symbols)} symbols: {e}")
+            return {}
+    
     async def get_cached_latest_data(self, symbol: str) -> Optional[pd.Series]:
         """Retrieve the latest cached data point for a symbol."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return None
             
             key = self._make_key('latest_data', symbol)
             data = await self.redis.get(key)
+            self._breaker.success()
             
             if data:
                 data_dict = await self._deserialize_data(data)
@@ -257,40 +881,44 @@ class RedisCacheLayer:
             return None
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error getting cached latest data for {symbol}: {e}")
             return None
     
     # Symbol and Metadata Caching
     async def cache_symbols_by_asset_type(self, asset_type: str, 
-                                        symbols: List[str]) -> bool:
-        """Cache symbols list for an asset type."""
+                                        symbols: List[str], ttl: Optional[int] = None) -> bool:
+        """Cache symbols list for an asset type, with a freshness marker for get_or_set_swr."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return False
             
+            ttl = ttl or self.TTL['symbols']
             key = self._make_key('symbols', asset_type)
+            self._local_drop(key)
             serialized_data = await self._serialize_data(symbols)
             
-            await self.redis.setex(
-                key,
-                self.TTL['symbols'],
-                serialized_data
-            )
+            async with self.redis.pipeline(transaction=False) as pipe:
+                self._pipe_swr(pipe, key, serialized_data, ttl, ttl)
+                await pipe.execute()
             
+            self._breaker.success()
             return True
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error caching symbols for {asset_type}: {e}")
             return False
     
     async def get_cached_symbols_by_asset_type(self, asset_type: str) -> Optional[List[str]]:
         """Retrieve cached symbols for an asset type."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return None
             
             key = self._make_key('symbols', asset_type)
             data = await self.redis.get(key)
+            self._breaker.success()
             
             if data:
                 return await self._deserialize_data(data)
@@ -298,14 +926,15 @@ class RedisCacheLayer:
             return None
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error getting cached symbols for {asset_type}: {e}")
             return None
     
     # Signal Caching
-    async def cache_signal(self, signal_data: Dict[str, Any]) -> bool:
+    async def cache_signal(self, signal_data: Dict[str, Any], ttl: Optional[int] = None) -> bool:
         """Cache a trading signal."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return False
             
             signal_id = signal_data.get('signal_id', 
@@ -313,72 +942,82 @@ class RedisCacheLayer:
             key = self._make_key('signals', signal_id)
             
             serialized_data = await self._serialize_data(signal_data)
+            ttl = ttl or self.TTL['signals']
             
-            await self.redis.setex(
-                key,
-                self.TTL['signals'],
-                serialized_data
-            )
-            
-            # Add to symbol-specific signals list
-            symbol = signal_data.get('symbol')
-            if symbol:
-                list_key = self._make_key('signals', 'by_symbol', symbol)
-                await self.redis.lpush(list_key, signal_id)
-                await self.redis.expire(list_key, self.TTL['signals'])
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.setex(key, ttl, serialized_data)
+                
+                # Add to symbol-specific signals list
+                symbol = signal_data.get('symbol')
+                if symbol:
+                    list_key = self._make_key('signals', 'by_symbol', symbol)
+                    pipe.lpush(list_key, signal_id)
+                    pipe.expire(list_key, ttl)
+                    
+                    # Keep only recent signals (last 100)
+                    pipe.ltrim(list_key, 0, 99)
                 
-                # Keep only recent signals (last 100)
-                await self.redis.ltrim(list_key, 0, 99)
+                await pipe.execute()
             
+            self._breaker.success()
             return True
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error caching signal: {e}")
             return False
     
     async def get_cached_signals_for_symbol(self, symbol: str) -> List[Dict[str, Any]]:
         """Retrieve cached signals for a symbol."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return []
             
             list_key = self._make_key('signals', 'by_symbol', symbol)
             signal_ids = await self.redis.lrange(list_key, 0, -1)
+            if not signal_ids:
+                self._breaker.success()
+                return []
+            
+            # One MGET for every listed signal; expired ones come back as None
+            keys = [self._make_key('signals', signal_id.decode()) for signal_id in signal_ids]
+            values = await self.redis.mget(keys)
+            self._breaker.success()
             
             signals = []
-            for signal_id in signal_ids:
-                key = self._make_key('signals', signal_id.decode())
-                data = await self.redis.get(key)
+            for data in values:
                 if data:
-                    signal = await self._deserialize_data(data)
-                    signals.append(signal)
+                    signals.append(await self._deserialize_data(data))
             
             return signals
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error getting cached signals for {symbol}: {e}")
             return []
     
     # Options Data Caching
     async def cache_options_chain(self, underlying: str, expiry_date: str,
-                                 data: pd.DataFrame) -> bool:
-        """Cache options chain data."""
+                                 data: pd.DataFrame, ttl: Optional[int] = None) -> bool:
+        """Cache options chain data, with a freshness marker for get_or_set_swr."""
         try:
-            if not self._initialized or data.empty:
+            if not self._cache_available() or data.empty:
                 return False
             
+            ttl = ttl or self.TTL['options']
             key = self._make_key('options', underlying, expiry_date)
+            self._local_drop(key)
             serialized_data = await self._serialize_data(data)
             
-            await self.redis.setex(
-                key,
-                self.TTL['options'],
-                serialized_data
-            )
+            async with self.redis.pipeline(transaction=False) as pipe:
+                self._pipe_swr(pipe, key, serialized_data, ttl, ttl)
+                await pipe.execute()
             
+            self._breaker.success()
             return True
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error caching options chain for {underlying}: {e}")
             return False
     
@@ -386,11 +1025,12 @@ class RedisCacheLayer:
                                      expiry_date: str) -> Optional[pd.DataFrame]:
         """Retrieve cached options chain data."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return None
             
             key = self._make_key('options', underlying, expiry_date)
             data = await self.redis.get(key)
+            self._breaker.success()
             
             if data:
                 return await self._deserialize_data(data, 'dataframe')
@@ -398,15 +1038,17 @@ class RedisCacheLayer:
             return None
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error getting cached options chain for {underlying}: {e}")
             return None
     
     # Performance and Analytics Caching
     async def cache_performance_data(self, strategy: str, symbol: str,
-                                   performance_data: Dict[str, Any]) -> bool:
+                                   performance_data: Dict[str, Any],
+                                   ttl: Optional[int] = None) -> bool:
         """Cache strategy performance data."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return False
             
             key = self._make_key('performance', strategy, symbol)
@@ -414,13 +1056,15 @@ class RedisCacheLayer:
             
             await self.redis.setex(
                 key,
-                self.TTL['performance'],
+                ttl or self.TTL['performance'],
                 serialized_data
             )
             
+            self._breaker.success()
             return True
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error caching performance data: {e}")
             return False
     
@@ -428,11 +1072,12 @@ class RedisCacheLayer:
                                         symbol: str) -> Optional[Dict[str, Any]]:
         """Retrieve cached performance data."""
         try:
-            if not self._initialized:
+            if not self._cache_available():
                 return None
             
             key = self._make_key('performance', strategy, symbol)
             data = await self.redis.get(key)
+            self._breaker.success()
             
             if data:
                 return await self._deserialize_data(data)
@@ -440,6 +1085,7 @@ class RedisCacheLayer:
             return None
             
         except Exception as e:
+            self._breaker.failure()
             self.logger.error(f"Error getting cached performance data: {e}")
             return None
     
@@ -469,11 +1115,12 @@ class RedisCacheLayer:
             if not self._initialized:
                 return None
             
-            # Check last few minutes for cached results
+            # Check the last 5 minutes for cached results in one MGET, newest first
             current_minute = int(get_current_time().timestamp() // 60)
-            for i in range(5):  # Check last 5 minutes
-                key = self._make_key('analytics', analysis_type, current_minute - i)
-                data = await self.redis.get(key)
+            keys = [self._make_key('analytics', analysis_type, current_minute - i)
+                    for i in range(5)]
+            
+            for data in await self.redis.mget(keys):
                 if data:
                     return await self._deserialize_data(data)
             
@@ -484,24 +1131,48 @@ class RedisCacheLayer:
             return None
     
     # Utility Methods
+    async def _scan_unlink(self, pattern: str) -> int:
+        """
+        UNLINK every key matching pattern, walking the keyspace with SCAN in
+        batches instead of blocking Redis with a single KEYS call.
+        
+        Returns:
+            Number of keys removed
+        """
+        removed = 0
+        batch = []
+        
+        async for key in self._bulk_redis.scan_iter(match=pattern, count=self.SCAN_BATCH):
+            batch.append(key)
+            if len(batch) >= self.SCAN_BATCH:
+                removed += await self._bulk_redis.unlink(*batch)
+                batch = []
+        
+        if batch:
+            removed += await self._bulk_redis.unlink(*batch)
+        
+        return removed
+    
     async def invalidate_symbol_cache(self, symbol: str):
         """Invalidate all cached data for a symbol."""
         try:
             if not self._initialized:
                 return
             
-            # Find all keys for this symbol
+            # Exact keys (with their SWR markers) need no scan
+            await self.invalidate_keys([
+                ('latest_data', symbol),
+                ('signals', 'by_symbol', symbol),
+            ])
+            
+            # Find the remaining keys for this symbol
             patterns = [
                 f"{self.PREFIXES['market_data']}:{symbol}:*",
-                f"{self.PREFIXES['latest_data']}:{symbol}",
-                f"{self.PREFIXES['signals']}:by_symbol:{symbol}",
                 f"{self.PREFIXES['performance']}:*:{symbol}",
             ]
             
             for pattern in patterns:
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    await self.redis.delete(*keys)
+                await self._scan_unlink(pattern)
             
             self.logger.debug(f"Invalidated cache for {symbol}")
             
@@ -515,14 +1186,15 @@ class RedisCacheLayer:
                 return {}
             
             # Get Redis info
-            info = await self.redis.info()
+            info = await self._bulk_redis.info()
             
-            # Count keys by prefix
+            # Count keys by prefix, incrementally so Redis is never blocked
             key_counts = {}
             for prefix_name, prefix in self.PREFIXES.items():
-                pattern = f"{prefix}:*"
-                keys = await self.redis.keys(pattern)
-                key_counts[prefix_name] = len(keys)
+                count = 0
+                async for _ in self._bulk_redis.scan_iter(match=f"{prefix}:*", count=self.SCAN_BATCH):
+                    count += 1
+                key_counts[prefix_name] = count
             
             return {
                 'total_keys': info.get('db0', {}).get('keys', 0),
@@ -538,30 +1210,53 @@ class RedisCacheLayer:
             self.logger.error(f"Error getting cache stats: {e}")
             return {}
     
-    async def cleanup_expired_keys(self):
-        """Manually cleanup expired keys."""
+    async def cleanup_expired_keys(self) -> int:
+        """
+        Remove this layer's keys that were left without a TTL.
+        
+        Redis expires everything written here on its own (every write sets a
+        TTL), so this only catches strays. Keys are walked with SCAN and their
+        TTLs checked in pipelined batches, yielding to the event loop between
+        batches so neither Redis nor the caller is blocked.
+        
+        Returns:
+            Number of keys removed
+        """
         try:
             if not self._initialized:
-                return
+                return 0
+            
+            removed = 0
+            for prefix in self.PREFIXES.values():
+                batch = []
+                async for key in self._bulk_redis.scan_iter(match=f"{prefix}:*", count=200):
+                    batch.append(key)
+                    if len(batch) >= 100:
+                        removed += await self._unlink_persistent(batch)
+                        batch = []
+                        await asyncio.sleep(0)
+                
+                if batch:
+                    removed += await self._unlink_persistent(batch)
             
-            # This is usually handled by Redis automatically,
-            # but we can do some manual cleanup if needed
-            await self.redis.eval("""
-                local expired = 0
-                local keys = redis.call('keys', '*')
-                for i=1,#keys do
-                    if redis.call('ttl', keys[i]) == -1 then
-                        redis.call('del', keys[i])
-                        expired = expired + 1
-                    end
-                end
-                return expired
-            """, 0)
-            
-            self.logger.debug("Cleaned up expired keys")
+            self.logger.debug(f"Cleaned up {removed} keys without TTL")
+            return removed
             
         except Exception as e:
             self.logger.error(f"Error cleaning up expired keys: {e}")
+            return 0
+    
+    async def _unlink_persistent(self, keys: List[bytes]) -> int:
+        """UNLINK the keys in a batch that have no TTL (TTL == -1)."""
+        pipe = self._bulk_redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.ttl(key)
+        ttls = await pipe.execute()
+        
+        persistent = [key for key, ttl in zip(keys, ttls) if ttl == -1]
+        if not persistent:
+            return 0
+        return await self._bulk_redis.unlink(*persistent)
     
     async def flush_cache(self, pattern: Optional[str] = None):
         """Flush cache (optionally by pattern)."""
@@ -570,12 +1265,12 @@ class RedisCacheLayer:
                 return
             
             if pattern:
-                keys = await self.redis.keys(pattern)
-                if keys:
-                    await self.redis.delete(*keys)
-                    self.logger.info(f"Flushed {len(keys)} keys matching pattern: {pattern}")
+                removed = await self._scan_unlink(pattern)
+                if removed:
+                    self.logger.info(f"Flushed {removed} keys matching pattern: {pattern}")
             else:
-                await self.redis.flushdb()
+                self._local.clear()
+                await self._bulk_redis.flushdb()
                 self.logger.info("Flushed entire cache database")
             
         except Exception as e:
@@ -597,7 +1292,7 @@ class RedisCacheLayer:
                 return {'status': 'unhealthy', 'error': 'Read/write test failed'}
             
             # Get server info
-            info = await self.redis.info()
+            info = await self._bulk_redis.info()
             
             return {
                 'status': 'healthy',
@@ -11,8 +11,12 @@ THREAD SAFETY: Lock-free design using:
 """
 
 import asyncio
+import itertools
 import logging
-from collections import Counter
+import os
+import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
@@ -24,6 +28,30 @@ from ..utils.timezone_utils import get_current_time, to_ist, to_utc, is_market_h
 
 logger = setup_logger("event_bus")
 
+# Slotted dataclasses need Python 3.10+; older versions keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Event IDs are a random per-process prefix plus a counter: unique like a
+# UUID without a urandom read and UUID formatting for every event
+_EVENT_ID_PREFIX = uuid4().hex[:12]
+_event_seq = itertools.count()
+
+
+def _reseed_event_ids():
+    """Give a forked child its own prefix, so it can't repeat the parent's IDs."""
+    global _EVENT_ID_PREFIX, _event_seq
+    _EVENT_ID_PREFIX = uuid4().hex[:12]
+    _event_seq = itertools.count()
+
+
+# os.register_at_fork is POSIX-only; there is no fork to guard against elsewhere
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_event_ids)
+
+
+def _next_event_id() -> str:
+    return f"{_EVENT_ID_PREFIX}-{next(_event_seq):x}"
+
 
 class EventType(Enum):
     """Types of events in the system"""
@@ -80,23 +108,23 @@ class EventPriority(Enum):
     CRITICAL = 0
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Event:
     """Base event class with metadata"""
     
     event_type: EventType
     data: Dict[str, Any]
     timestamp: datetime = field(default_factory=datetime.now)
-    event_id: str = field(default_factory=lambda: str(uuid4()))
+    event_id: str = field(default_factory=_next_event_id)
     priority: EventPriority = EventPriority.NORMAL
     source: Optional[str] = None
     correlation_id: Optional[str] = None  # For tracking related events
     
     def __repr__(self):
-        return f"Event(type={self.event_type.value}, id={self.event_id[:8]}, source={self.source})"
+        return f"Event(type={self.event_type.value}, id={self.event_id}, source={self.source})"
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Subscription:
     """Represents a subscription to an event type"""
     
@@ -105,8 +133,13 @@ class Subscription:
     subscriber_id: str
     filter_fn: Optional[Callable[[Event], bool]] = None
     priority: int = 0
+    is_async: bool = field(init=False, default=False)
+    
+    def __post_init__(self):
+        # Resolved once here instead of on every delivery
+        self.is_async = asyncio.iscoroutinefunction(self.handler)
     
-    async def matches(self, event: Event) -> bool:
+    def matches(self, event: Event) -> bool:
         """Check if this subscription matches the event"""
         if self.event_type != event.event_type:
             return False
@@ -142,13 +175,26 @@ class EventBus:
     - Immutable event objects
     """
     
-    def __init__(self, max_history: int = 1000, enable_history: bool = True):
+    # The processor yields to other coroutines after this many back-to-back
+    # events, so a deep queue can't starve the rest of the loop
+    DISPATCH_BATCH_SIZE = 100
+    
+    def __init__(self, max_history: int = 1000, enable_history: bool = True,
+                 handler_threads: Optional[int] = None, inline_dispatch: bool = False,
+                 max_dead_letters: int = 10_000):
         """
         Initialize event bus.
         
         Args:
             max_history: Maximum number of events to keep in history
             enable_history: Whether to keep event history
+            handler_threads: Threads for running sync handlers
+                (defaults to max(4, CPU count))
+            inline_dispatch: Let publish() run handlers itself while the bus is
+                idle (publish then returns after the handlers finish); the
+                queue only buffers events published while a dispatch is running
+            max_dead_letters: Maximum number of failed deliveries to keep
+                (oldest are dropped first)
         """
         # Subscriptions stored but only read during event dispatch
         # New subscriptions are rare, so we accept potential race conditions
@@ -156,21 +202,36 @@ class EventBus:
         self.subscriptions: Dict[EventType, List[Subscription]] = {}
         self.wildcard_subscriptions: List[Subscription] = []
         
-        # Thread-safe queue for event passing
-        self.event_queue: asyncio.Queue = asyncio.Queue()
+        # Queue for event passing, ordered by (priority, publish order) so
+        # CRITICAL/HIGH events overtake a LOW/NORMAL backlog
+        self.event_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._publish_seq = itertools.count()
+        
+        # Number of dispatches in progress, inline or by the processor; a
+        # counter so one path finishing can't mark the other idle
+        self.inline_dispatch = inline_dispatch
+        self._dispatches_running = 0
         
-        # Circular buffer for history (accept potential race on boundary)
-        self.event_history: List[Event] = []
+        # Circular buffer for history; the deque drops the oldest event itself
+        self.event_history: deque = deque(maxlen=max_history)
         self.max_history = max_history
         self.enable_history = enable_history
-        self._history_index = 0  # Circular buffer index
         
-        # Dead letter queue (append-only, accept race conditions)
-        self.dead_letter_queue: List[Dict] = []
+        # Dead letter queue; bounded so a handler failing on a busy event
+        # type can't grow it without limit
+        self.dead_letter_queue: deque = deque(maxlen=max_dead_letters)
         
         self.is_running = False
         self._processing_task: Optional[asyncio.Task] = None
         
+        # Loop the bus runs on, captured by start() for sync handler dispatch
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        
+        # Bounded pool for sync handlers (created by start(), shut down by stop()),
+        # so bursts can't grow or contend for the loop's default executor
+        self.handler_threads = handler_threads or max(4, os.cpu_count() or 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
         # Atomic statistics using Counter (thread-safe)
         self._stats = Counter({
             "events_published": 0,
@@ -189,6 +250,10 @@ class EventBus:
             return
         
         self.is_running = True
+        self._loop = asyncio.get_running_loop()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.handler_threads, thread_name_prefix="event_handler"
+        )
         self._processing_task = asyncio.create_task(self._process_events())
         logger.info("EventBus started")
     
@@ -210,6 +275,10 @@ class EventBus:
             except asyncio.CancelledError:
                 pass
         
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        
         logger.info("EventBus stopped")
     
     def subscribe(
@@ -290,47 +359,66 @@ class EventBus:
             correlation_id=correlation_id
         )
         
-        await self.event_queue.put(event)
         self._stats["events_published"] += 1
-        
         logger.debug(f"Published event: {event}")
         
+        if (self.inline_dispatch and self.is_running
+                and not self._dispatches_running and self.event_queue.empty()):
+            # Nothing queued or in flight: skip the queue round trip
+            await self._dispatch(event)
+            return event
+        
+        await self.event_queue.put((priority.value, next(self._publish_seq), event))
+        
         return event
     
     async def _process_events(self):
-        """Process events from the queue"""
-        while self.is_running:
+        """
+        Process events from the queue.
+        
+        Pending events are taken with get_nowait(); the loop awaits the
+        queue once it is empty and otherwise yields to the scheduler every
+        DISPATCH_BATCH_SIZE events. stop() cancels the task while it waits,
+        so no timeout is needed to notice is_running going False. Events
+        still queued when stop() is called are drained first, so its join()
+        can complete.
+        """
+        dispatched = 0
+        while self.is_running or not self.event_queue.empty():
+            try:
+                _, _, event = self.event_queue.get_nowait()
+            except asyncio.QueueEmpty:
+                _, _, event = await self.event_queue.get()
+                dispatched = 0
+            
             try:
-                # Get event with timeout to allow checking is_running
-                try:
-                    event = await asyncio.wait_for(
-                        self.event_queue.get(),
-                        timeout=1.0
-                    )
-                except asyncio.TimeoutError:
-                    continue
-                
-                # Add to history using circular buffer (lock-free)
-                if self.enable_history:
-                    if len(self.event_history) < self.max_history:
-                        self.event_history.append(event)
-                    else:
-                        # Circular buffer: overwrite oldest event
-                        # Accept potential race condition on boundary
-                        idx = self._history_index % self.max_history
-                        if idx < len(self.event_history):
-                            self.event_history[idx] = event
-                        self._history_index += 1
-                
-                # Process event (spawns independent tasks for each handler)
-                await self._handle_event(event)
-                
-                self._stats["events_processed"] += 1
+                await self._dispatch(event)
+            finally:
                 self.event_queue.task_done()
-                
-            except Exception as e:
-                logger.error(f"Error processing event: {e}")
-                self._stats["events_failed"] += 1
+            
+            dispatched += 1
+            if dispatched >= self.DISPATCH_BATCH_SIZE:
+                dispatched = 0
+                await asyncio.sleep(0)
+    
+    async def _dispatch(self, event: Event):
+        """Record an event in history and run its handlers."""
+        self._dispatches_running += 1
+        try:
+            # Add to history (circular buffer)
+            if self.enable_history:
+                self.event_history.append(event)
+            
+            # Process event (spawns independent tasks for each handler)
+            await self._handle_event(event)
+            
+            self._stats["events_processed"] += 1
+            
+        except Exception as e:
+            logger.error(f"Error processing event: {e}")
+            self._stats["events_failed"] += 1
+        finally:
+            self._dispatches_running -= 1
     
     async def _handle_event(self, event: Event):
         """
@@ -341,6 +429,8 @@ class EventBus:
         - Handler failures don't affect other handlers
         - True concurrent execution
         - Lock-free isolation
+        
+        A single matching handler is awaited directly, without a task or gather.
         """
         # Get subscriptions for this event type (snapshot, no lock needed)
         subscriptions = self.subscriptions.get(event.event_type, [])
@@ -349,35 +439,35 @@ class EventBus:
             logger.debug(f"No handlers for event: {event.event_type.value}")
             return
         
-        # Create independent task for each handler
-        tasks = []
-        for subscription in subscriptions:
-            task = asyncio.create_task(
-                self._execute_handler(subscription, event)
-            )
-            tasks.append(task)
+        # Apply filters up front so rejected subscriptions cost no task
+        subscriptions = [s for s in subscriptions if s.matches(event)]
         
-        # Execute all handlers concurrently, continue on errors
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        if not subscriptions:
+            logger.debug(f"No handlers matched event: {event.event_type.value}")
+            return
+        
+        if len(subscriptions) == 1:
+            try:
+                results = [await self._execute_handler(subscriptions[0], event)]
+            except Exception as e:
+                results = [e]
+        else:
+            # Create independent task for each handler
+            tasks = []
+            for subscription in subscriptions:
+                task = asyncio.create_task(
+                    self._execute_handler(subscription, event)
+                )
+                tasks.append(task)
+            
+            # Execute all handlers concurrently, continue on errors
+            results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Process results
         handlers_executed = 0
-        for idx, result in enumerate(results):
+        for subscription, result in zip(subscriptions, results):
             if isinstance(result, Exception):
-                subscription = subscriptions[idx]
-                logger.error(
-                    f"Error in handler {subscription.subscriber_id} "
-                    f"for event {event.event_type.value}: {result}"
-                )
-                self._stats["handlers_failed"] += 1
-                
-                # Add to dead letter queue
-                self.dead_letter_queue.append({
-                    "event": event,
-                    "subscription": subscription,
-                    "error": str(result),
-                    "timestamp": get_current_time()
-                })
+                self._record_failure(subscription, event, result)
             elif result:  # Handler executed successfully
                 handlers_executed += 1
                 self._stats["handlers_executed"] += 1
@@ -385,27 +475,38 @@ class EventBus:
         if handlers_executed == 0:
             logger.debug(f"No handlers executed successfully for event: {event.event_type.value}")
     
+    def _record_failure(self, subscription: Subscription, event: Event, error: Exception):
+        """Log a failed handler and add it to the dead letter queue."""
+        logger.error(
+            f"Error in handler {subscription.subscriber_id} "
+            f"for event {event.event_type.value}: {error}"
+        )
+        self._stats["handlers_failed"] += 1
+        
+        self.dead_letter_queue.append({
+            "event": event,
+            "subscription": subscription,
+            "error": str(error),
+            "timestamp": get_current_time()
+        })
+    
     async def _execute_handler(self, subscription: Subscription, event: Event) -> bool:
         """
-        Execute a single handler in isolation.
+        Execute a single handler in isolation (the subscription already matched).
         
         Returns:
-            bool: True if handler executed, False if filtered out
+            bool: True once the handler has run
         
         Raises:
             Exception: Any exception from the handler (caught by gather)
         """
-        # Check if subscription matches
-        if not await subscription.matches(event):
-            return False
-        
         # Execute handler (async or sync)
-        if asyncio.iscoroutinefunction(subscription.handler):
+        if subscription.is_async:
             await subscription.handler(event)
         else:
             # Run sync handler in executor to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, subscription.handler, event)
+            loop = self._loop or asyncio.get_running_loop()
+            await loop.run_in_executor(self._executor, subscription.handler, event)
         
         return True
     
@@ -436,7 +537,7 @@ class EventBus:
         Returns:
             List of events
         """
-        events = self.event_history
+        events = list(self.event_history)
         
         if event_type:
             events = [e for e in events if e.event_type == event_type]
@@ -2,14 +2,12 @@
 Signal-related events for the trading system.
 """
 
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from .event_bus import Event, EventType, EventPriority
 
 
-@dataclass
 class SignalGeneratedEvent(Event):
     """
     Event emitted when a strategy generates a new trading signal.
@@ -17,6 +15,8 @@ class SignalGeneratedEvent(Event):
     This is the primary event that triggers options trading workflow.
     """
     
+    __slots__ = ()
+    
     def __init__(
         self,
         signal_id: str,
@@ -117,10 +117,11 @@ class SignalGeneratedEvent(Event):
         return self.data["metadata"]
 
 
-@dataclass
 class SignalActivatedEvent(Event):
     """Event emitted when a signal is activated (order placed)"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         signal_id: str,
@@ -150,10 +151,11 @@ class SignalActivatedEvent(Event):
         )
 
 
-@dataclass
 class SignalUpdatedEvent(Event):
     """Event emitted when a signal is updated"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         signal_id: str,
@@ -175,10 +177,11 @@ class SignalUpdatedEvent(Event):
         )
 
 
-@dataclass
 class SignalCompletedEvent(Event):
     """Event emitted when a signal is completed (target hit)"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         signal_id: str,
@@ -206,10 +209,11 @@ class SignalCompletedEvent(Event):
         )
 
 
-@dataclass
 class SignalStoppedEvent(Event):
     """Event emitted when a signal is stopped (stop-loss hit)"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         signal_id: str,
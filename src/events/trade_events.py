@@ -2,17 +2,17 @@
 Trade and position-related events for the trading system.
 """
 
-from dataclasses import dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 
 from .event_bus import Event, EventType, EventPriority
 
 
-@dataclass
 class TradeExecutedEvent(Event):
     """Event emitted when a trade is executed"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         trade_id: str,
@@ -67,10 +67,11 @@ class TradeExecutedEvent(Event):
         )
 
 
-@dataclass
 class TradeExitEvent(Event):
     """Event emitted when a trade is exited"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         trade_id: str,
@@ -100,10 +101,11 @@ class TradeExitEvent(Event):
         )
 
 
-@dataclass
 class PositionOpenedEvent(Event):
     """Event emitted when a position is opened"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         position_id: str,
@@ -158,10 +160,11 @@ class PositionOpenedEvent(Event):
         )
 
 
-@dataclass
 class PositionUpdatedEvent(Event):
     """Event emitted when a position is updated"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         position_id: str,
@@ -189,10 +192,11 @@ class PositionUpdatedEvent(Event):
         )
 
 
-@dataclass
 class PositionClosedEvent(Event):
     """Event emitted when a position is closed"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         position_id: str,
@@ -222,10 +226,11 @@ class PositionClosedEvent(Event):
         )
 
 
-@dataclass
 class OrderPlacedEvent(Event):
     """Event emitted when an order is placed"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         order_id: str,
@@ -255,10 +260,11 @@ class OrderPlacedEvent(Event):
         )
 
 
-@dataclass
 class OrderFilledEvent(Event):
     """Event emitted when an order is filled"""
     
+    __slots__ = ()
+    
     def __init__(
         self,
         order_id: str,
@@ -0,0 +1,187 @@
+"""
+Tests for the ClickHouse data layer client pool and signal streaming
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.data.clickhouse_data_layer import ClickHouseDataLayer
+
+
+COLUMNS = ['signal_id', 'symbol', 'timestamp']
+
+
+class FakeStream:
+    """Stand-in for the clickhouse-connect row block stream."""
+
+    def __init__(self, blocks, fail_after=None):
+        self.source = SimpleNamespace(column_names=COLUMNS)
+        self._blocks = blocks
+        self._fail_after = fail_after
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def __iter__(self):
+        for i, block in enumerate(self._blocks):
+            if self._fail_after is not None and i == self._fail_after:
+                raise RuntimeError("connection reset mid-stream")
+            time.sleep(0.001)
+            yield block
+
+
+class FakeClient:
+    """Client that refuses concurrent use, like a clickhouse-connect session."""
+
+    def __init__(self, blocks=None, fail_after=None):
+        self.blocks = blocks if blocks is not None else [
+            [(f"s{i}", "NIFTY", datetime(2025, 1, 1, 9, 15))] for i in range(3)
+        ]
+        self.fail_after = fail_after
+        self.busy = threading.Lock()
+        self.closed = False
+
+    def query_row_block_stream(self, query, parameters=None):
+        return FakeStream(self.blocks, self.fail_after)
+
+    def query(self, query, parameters=None):
+        if not self.busy.acquire(blocking=False):
+            raise RuntimeError("concurrent queries within the same session")
+        try:
+            time.sleep(0.001)
+            return SimpleNamespace(result_rows=[(1,)])
+        finally:
+            self.busy.release()
+
+    def close(self):
+        self.closed = True
+
+
+@contextmanager
+def executor(loop, workers):
+    """Run the loop's to_thread calls on a small executor."""
+    pool = ThreadPoolExecutor(max_workers=workers)
+    loop.set_default_executor(pool)
+    try:
+        yield
+    finally:
+        pool.shutdown(wait=False)
+
+
+class TestClientPool:
+    """Test cases for ClickHouse client checkout."""
+
+    @pytest.fixture
+    def layer(self):
+        """Create a layer whose clients are FakeClient instances."""
+        layer = ClickHouseDataLayer(pool_size=2)
+        layer._create_client = MagicMock(side_effect=lambda: FakeClient())
+        return layer
+
+    def test_clients_created_lazily(self, layer):
+        """No client exists until one is needed."""
+        assert layer._clients_created == 0
+
+        with layer._acquire() as client:
+            assert isinstance(client, FakeClient)
+
+        assert layer._clients_created == 1
+        assert layer._create_client.call_count == 1
+
+    def test_idle_client_reused(self, layer):
+        """A returned client is handed out again."""
+        with layer._acquire() as first:
+            pass
+        with layer._acquire() as second:
+            pass
+
+        assert first is second
+        assert layer._create_client.call_count == 1
+
+    def test_checkout_times_out_when_exhausted(self, layer):
+        """Checkout raises instead of hanging once every client is out."""
+        layer.POOL_CHECKOUT_TIMEOUT = 0.05
+        held = [layer._checkout(), layer._checkout()]
+
+        with pytest.raises(TimeoutError):
+            layer._checkout()
+
+        for client in held:
+            layer._checkin(client)
+
+    async def test_use_after_close_reconnects(self, layer):
+        """close() discards idle clients and later calls create new ones."""
+        with layer._acquire() as client:
+            pass
+
+        await layer.close()
+
+        assert client.closed
+        assert layer._clients_created == 0
+
+        with layer._acquire() as fresh:
+            assert fresh is not client
+
+    async def test_concurrent_runs_never_share_a_client(self, layer):
+        """More callers than clients all complete without overlap."""
+        with executor(asyncio.get_running_loop(), 4):
+            results = await asyncio.wait_for(
+                asyncio.gather(*(layer._run('query', 'SELECT 1') for _ in range(12))),
+                timeout=10,
+            )
+
+        assert all(r.result_rows == [(1,)] for r in results)
+        assert layer._clients_created <= layer.pool_size
+
+
+class TestIterSignals:
+    """Test cases for streaming signals through pooled clients."""
+
+    @pytest.mark.parametrize("pool_size,workers,callers", [(2, 5, 60), (4, 4, 12)])
+    async def test_concurrent_get_signals_does_not_deadlock(self, pool_size, workers, callers):
+        """Streams holding clients never starve checkouts of executor threads."""
+        layer = ClickHouseDataLayer(pool_size=pool_size)
+        layer._create_client = MagicMock(side_effect=lambda: FakeClient())
+
+        with executor(asyncio.get_running_loop(), workers):
+            results = await asyncio.wait_for(
+                asyncio.gather(*(layer.get_signals(symbol='NIFTY') for _ in range(callers))),
+                timeout=10,
+            )
+
+        assert all(len(signals) == 3 for signals in results)
+        assert all(s['id'] == s['signal_id'] for s in results[0])
+        assert layer._clients_created <= pool_size
+        assert layer._pool.qsize() == layer._clients_created
+
+    async def test_mid_stream_error_propagates(self):
+        """A failure after the first block reaches the caller."""
+        layer = ClickHouseDataLayer(pool_size=1)
+        layer._create_client = MagicMock(side_effect=lambda: FakeClient(fail_after=1))
+
+        received = []
+        with pytest.raises(RuntimeError, match="mid-stream"):
+            async for signal in layer.iter_signals(symbol='NIFTY'):
+                received.append(signal)
+
+        assert len(received) == 1
+        # The client went back to the pool despite the failure
+        assert layer._pool.qsize() == 1
+
+    async def test_get_signals_returns_empty_on_error(self):
+        """get_signals keeps its log-and-return-empty contract."""
+        layer = ClickHouseDataLayer(pool_size=1)
+        layer._create_client = MagicMock(side_effect=lambda: FakeClient(fail_after=1))
+
+        assert await layer.get_signals(symbol='NIFTY') == []
@@ -0,0 +1,58 @@
+"""
+Tests for the data layer factory
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+from src.data.data_layer_factory import CacheTTLPolicy, DataLayerFactory, HybridDataLayer
+from src.data.redis_cache_layer import RedisCacheLayer
+
+
+class TestBackendKwargs:
+    """Constructor arguments reach the backends; unknown keys are dropped."""
+
+    def test_postgresql_tuning_knob_passed_through(self):
+        """Arguments without an environment variable still reach the layer."""
+        layer = DataLayerFactory().create_postgresql_layer(latest_cache_ttl=0, unknown_option=1)
+        assert layer.latest_cache_ttl == 0
+
+    def test_clickhouse_tuning_knob_passed_through(self):
+        """ClickHouse-only arguments are accepted."""
+        layer = DataLayerFactory().create_clickhouse_layer(pool_size=3, last_signal_cache_ttl=0)
+        assert layer.pool_size == 3
+
+    def test_redis_unsupported_key_ignored(self):
+        """Keys the layer sets itself (decode_responses) are filtered out."""
+        layer = DataLayerFactory().create_redis_cache_layer(decode_responses=True, local_cache_size=5)
+        assert layer.local_cache_size == 5
+
+
+class TestSharedCacheRelease:
+    """Hybrid layers release their shared cache reference exactly once."""
+
+    async def test_failed_init_then_close_keeps_other_owner(self):
+        """A hybrid layer whose primary failed doesn't close a peer's cache."""
+        cache = RedisCacheLayer()
+
+        async def initialize():
+            cache._initialized = True
+            return True
+
+        cache.initialize = initialize
+        cache.retain()
+
+        failed_primary = MagicMock()
+        failed_primary.initialize = AsyncMock(return_value=False)
+        failed_primary.close = AsyncMock()
+        healthy_primary = MagicMock()
+        healthy_primary.initialize = AsyncMock(return_value=True)
+
+        failed = HybridDataLayer(failed_primary, cache, ttl_policy=CacheTTLPolicy())
+        healthy = HybridDataLayer(healthy_primary, cache, ttl_policy=CacheTTLPolicy())
+
+        assert await healthy.initialize() is True
+        assert await failed.initialize() is False
+        await failed.close()
+
+        assert cache._initialized
+        assert cache._ref_count == 1
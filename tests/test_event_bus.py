@@ -0,0 +1,218 @@
+"""
+Tests for the EventBus
+"""
+
+import asyncio
+import os
+import threading
+
+import pytest
+
+from src.events.event_bus import EventBus, EventPriority, EventType, _next_event_id
+
+
+@pytest.fixture
+async def bus():
+    """Create and start an EventBus, stopping it afterwards."""
+    bus = EventBus()
+    await bus.start()
+    yield bus
+    await bus.stop()
+
+
+class TestQueueProcessing:
+    """Test cases for the queue processor."""
+
+    async def test_deep_queue_does_not_starve_loop(self):
+        """The processor yields while a backlog is being drained."""
+        bus = EventBus()
+        handled = []
+
+        async def handler(event):
+            handled.append(event)
+
+        bus.subscribe(EventType.TICK_RECEIVED, handler, "ticks")
+        total = bus.DISPATCH_BATCH_SIZE * 5
+        for i in range(total):
+            await bus.publish(EventType.TICK_RECEIVED, {"i": i})
+
+        seen_by_ticker = []
+
+        async def ticker():
+            while len(handled) < total:
+                seen_by_ticker.append(len(handled))
+                await asyncio.sleep(0)
+
+        await bus.start()
+        await asyncio.wait_for(ticker(), timeout=5)
+        await bus.stop()
+
+        assert len(handled) == total
+        # The ticker ran in between batches, not only before and after
+        assert any(0 < n < total for n in seen_by_ticker)
+
+
+class TestInlineDispatch:
+    """Test cases for publish() dispatching handlers inline."""
+
+    async def test_idle_bus_dispatches_in_publisher(self):
+        """An idle bus runs handlers before publish() returns."""
+        bus = EventBus(inline_dispatch=True)
+        handled = []
+
+        async def handler(event):
+            handled.append(asyncio.current_task())
+
+        bus.subscribe(EventType.ORDER_PLACED, handler, "orders")
+        await bus.start()
+
+        await bus.publish(EventType.ORDER_PLACED, {})
+        assert handled == [asyncio.current_task()]
+
+        await bus.stop()
+
+    async def test_queue_processor_does_not_clear_inline_busy(self):
+        """A queued dispatch finishing while an inline one runs keeps the bus busy."""
+        bus = EventBus(inline_dispatch=True)
+        gate = asyncio.Event()
+        handled = {}
+
+        async def handler(event):
+            name = event.data["name"]
+            if name == "slow":
+                await gate.wait()
+            handled[name] = asyncio.current_task()
+
+        bus.subscribe(EventType.ORDER_PLACED, handler, "orders")
+        await bus.start()
+
+        slow = asyncio.create_task(bus.publish(EventType.ORDER_PLACED, {"name": "slow"}))
+        await asyncio.sleep(0)
+
+        # Queued behind the inline dispatch and handled by the processor
+        await bus.publish(EventType.ORDER_PLACED, {"name": "queued"})
+        await asyncio.wait_for(bus.event_queue.join(), timeout=5)
+        assert "queued" in handled
+
+        # The inline dispatch is still running, so this one must be queued too
+        await bus.publish(EventType.ORDER_PLACED, {"name": "next"})
+        assert "next" not in handled
+
+        gate.set()
+        await slow
+        await bus.stop()
+
+        assert handled["next"] is not asyncio.current_task()
+        assert handled["slow"] is slow
+
+
+class TestPriorityAndFiltering:
+    """Test cases for event ordering and subscription filters."""
+
+    async def test_higher_priority_overtakes_backlog(self):
+        """Queued CRITICAL events are dispatched before earlier NORMAL ones."""
+        bus = EventBus()
+        order = []
+
+        async def handler(event):
+            order.append(event.data["name"])
+
+        bus.subscribe(EventType.ORDER_PLACED, handler, "orders")
+        await bus.publish(EventType.ORDER_PLACED, {"name": "normal1"})
+        await bus.publish(EventType.ORDER_PLACED, {"name": "low"}, priority=EventPriority.LOW)
+        await bus.publish(EventType.ORDER_PLACED, {"name": "normal2"})
+        await bus.publish(EventType.ORDER_PLACED, {"name": "critical"}, priority=EventPriority.CRITICAL)
+
+        await bus.start()
+        await bus.stop()
+
+        assert order == ["critical", "normal1", "normal2", "low"]
+
+    async def test_filtered_out_subscription_not_called(self, bus):
+        """Only subscriptions whose filter accepts the event run."""
+        calls = []
+
+        async def nifty(event):
+            calls.append("nifty")
+
+        async def every(event):
+            calls.append("every")
+
+        bus.subscribe(EventType.SIGNAL_GENERATED, nifty, "nifty",
+                      filter_fn=lambda e: e.data.get("symbol") == "NIFTY")
+        bus.subscribe(EventType.SIGNAL_GENERATED, every, "every")
+
+        await bus.publish(EventType.SIGNAL_GENERATED, {"symbol": "TCS"})
+        await bus.event_queue.join()
+
+        assert calls == ["every"]
+        assert bus.get_stats()["handlers_executed"] == 1
+
+    async def test_sync_handler_runs_in_executor(self, bus):
+        """Sync handlers run off the event loop thread."""
+        threads = []
+
+        def handler(event):
+            threads.append(threading.current_thread().name)
+
+        bus.subscribe(EventType.ORDER_FILLED, handler, "fills")
+        await bus.publish(EventType.ORDER_FILLED, {})
+        await bus.event_queue.join()
+
+        assert threads and threads[0].startswith("event_handler")
+
+
+class TestDeadLetterQueue:
+    """Test cases for failed handler bookkeeping."""
+
+    async def test_failures_recorded(self, bus):
+        """A raising handler lands in the dead letter queue."""
+        async def broken(event):
+            raise ValueError("boom")
+
+        bus.subscribe(EventType.ORDER_REJECTED, broken, "broken")
+        await bus.publish(EventType.ORDER_REJECTED, {})
+        await bus.event_queue.join()
+
+        assert len(bus.dead_letter_queue) == 1
+        assert bus.dead_letter_queue[0]["error"] == "boom"
+        assert bus.get_stats()["handlers_failed"] == 1
+
+    async def test_queue_bounded_keeps_newest(self):
+        """Past max_dead_letters the oldest failures are dropped."""
+        bus = EventBus(max_dead_letters=3)
+
+        async def broken(event):
+            raise ValueError(str(event.data["i"]))
+
+        bus.subscribe(EventType.ORDER_REJECTED, broken, "broken")
+        await bus.start()
+        for i in range(10):
+            await bus.publish(EventType.ORDER_REJECTED, {"i": i})
+        await bus.stop()
+
+        assert [entry["error"] for entry in bus.dead_letter_queue] == ["7", "8", "9"]
+        assert bus.get_stats()["handlers_failed"] == 10
+
+
+class TestEventIds:
+    """Test cases for event ID generation."""
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+    def test_forked_child_issues_distinct_ids(self):
+        """A forked worker does not repeat its parent's event IDs."""
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            os.write(write_fd, _next_event_id().encode())
+            os._exit(0)
+
+        os.close(write_fd)
+        parent_id = _next_event_id()
+        with os.fdopen(read_fd) as pipe:
+            child_id = pipe.read()
+        os.waitpid(pid, 0)
+
+        assert child_id and child_id != parent_id
+        assert child_id.split('-')[0] != parent_id.split('-')[0]
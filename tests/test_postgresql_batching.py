@@ -0,0 +1,186 @@
+"""
+Tests for PostgreSQL signal batching and market data coalescing
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pandas as pd
+import pytest
+
+from src.data.postgresql_data_layer import PostgreSQLDataLayer
+
+
+def make_signal(signal_id, action='BUY'):
+    """Build a minimal signal payload."""
+    return {
+        'signal_id': signal_id,
+        'symbol': 'NIFTY',
+        'asset_type': 'index',
+        'strategy': 'ma_crossover',
+        'action': action,
+        'price': 100.0,
+        'quantity': 1,
+        'timestamp': datetime(2025, 1, 1, 9, 15),
+    }
+
+
+class FakeConnection:
+    """asyncpg connection that rejects actions longer than VARCHAR(10)."""
+
+    def __init__(self):
+        self.inserted = []
+
+    async def execute(self, query, *args):
+        if len(args[5]) > 10:
+            raise ValueError("value too long for type character varying(10)")
+        self.inserted.append(args[1])
+
+
+class TestSignalBatching:
+    """Test cases for buffered store_signal writes."""
+
+    @pytest.fixture
+    def layer(self):
+        """Create a layer with the database calls mocked out."""
+        layer = PostgreSQLDataLayer()
+        layer.SIGNAL_FLUSH_INTERVAL = 0.01
+        layer._copy_ignore_conflicts = AsyncMock()
+        layer._fetch_frame = AsyncMock(return_value=pd.DataFrame())
+        layer.connection = FakeConnection()
+
+        @asynccontextmanager
+        async def raw_connection():
+            yield layer.connection
+
+        layer._raw_connection = raw_connection
+        return layer
+
+    async def test_concurrent_signals_share_one_copy(self, layer):
+        """Signals queued together are written by a single COPY."""
+        results = await asyncio.gather(*(layer.store_signal(make_signal(f"s{i}")) for i in range(5)))
+
+        assert results == [True] * 5
+        layer._copy_ignore_conflicts.assert_awaited_once()
+        rows = layer._copy_ignore_conflicts.await_args.args[1]
+        assert [row[1] for row in rows] == [f"s{i}" for i in range(5)]
+
+    async def test_store_returns_after_write(self, layer):
+        """store_signal does not report success before the COPY ran."""
+        assert await layer.store_signal(make_signal("s1")) is True
+        layer._copy_ignore_conflicts.assert_awaited_once()
+
+    async def test_full_batch_flushes_immediately(self, layer):
+        """Reaching SIGNAL_BATCH_SIZE flushes without waiting for the timer."""
+        layer.SIGNAL_BATCH_SIZE = 3
+        layer.SIGNAL_FLUSH_INTERVAL = 60
+
+        results = await asyncio.wait_for(
+            asyncio.gather(*(layer.store_signal(make_signal(f"s{i}")) for i in range(3))),
+            timeout=5,
+        )
+
+        assert results == [True] * 3
+        layer._copy_ignore_conflicts.assert_awaited_once()
+
+    async def test_bad_row_only_fails_its_caller(self, layer):
+        """A failed COPY falls back to per-row inserts."""
+        layer._copy_ignore_conflicts.side_effect = ValueError("value too long")
+
+        results = await asyncio.gather(
+            layer.store_signal(make_signal("good1")),
+            layer.store_signal(make_signal("bad", action='STRONG_BUY_NOW')),
+            layer.store_signal(make_signal("good2")),
+        )
+
+        assert results == [True, False, True]
+        assert layer.connection.inserted == ["good1", "good2"]
+
+    async def test_get_signals_flushes_pending(self, layer):
+        """Queued signals are written before a read runs."""
+        layer.SIGNAL_FLUSH_INTERVAL = 60
+        store = asyncio.ensure_future(layer.store_signal(make_signal("s1")))
+        await asyncio.sleep(0)
+
+        await layer.get_signals(symbol='NIFTY')
+
+        layer._copy_ignore_conflicts.assert_awaited_once()
+        assert await store is True
+
+    async def test_close_waits_for_pending_flush(self, layer):
+        """close() lets the timer flush write its batch."""
+        copied = []
+
+        async def slow_copy(table, rows, columns, conflict_columns):
+            await asyncio.sleep(0.05)
+            copied.extend(row[1] for row in rows)
+
+        layer._copy_ignore_conflicts.side_effect = slow_copy
+        store = asyncio.ensure_future(layer.store_signal(make_signal("s1")))
+        # Let the timer take the batch and start copying
+        await asyncio.sleep(0.03)
+
+        await layer.close()
+
+        assert copied == ["s1"]
+        assert await store is True
+
+
+class TestMarketDataCoalescing:
+    """Test cases for coalesced store_market_data writes."""
+
+    @pytest.fixture
+    def layer(self):
+        """Create a layer with the COPY mocked out."""
+        layer = PostgreSQLDataLayer()
+        layer._copy_rows = AsyncMock()
+        layer._invalidate_latest = MagicMock()
+        return layer
+
+    @staticmethod
+    def frame(close):
+        """Build a one-row market data frame."""
+        return pd.DataFrame({
+            'timestamp': [pd.Timestamp('2025-01-01 09:15', tz='UTC')],
+            'open': [close], 'high': [close], 'low': [close], 'close': [close], 'volume': [10],
+        })
+
+    async def test_calls_in_window_share_one_copy(self, layer):
+        """Stores within the window are written together."""
+        results = await asyncio.gather(*(
+            layer.store_market_data(symbol, 'equity', self.frame(100.0), 'runner')
+            for symbol in ('TCS', 'INFY', 'SBIN')
+        ))
+
+        assert results == [True] * 3
+        layer._copy_rows.assert_awaited_once()
+        records = list(layer._copy_rows.await_args.args[1])
+        assert len(records) == 3
+        assert set(layer._invalidate_latest.call_args.args) == {'TCS', 'INFY', 'SBIN'}
+
+    async def test_failure_reaches_every_caller(self, layer):
+        """A failed shared COPY is reported to each coalesced caller."""
+        layer._copy_rows.side_effect = RuntimeError("connection lost")
+
+        results = await asyncio.gather(*(
+            layer.store_market_data(symbol, 'equity', self.frame(100.0), 'runner')
+            for symbol in ('TCS', 'INFY')
+        ))
+
+        assert results == [False, False]
+
+    async def test_coalescing_disabled(self, layer):
+        """A zero window writes each call on its own."""
+        layer.MARKET_DATA_COALESCE_WINDOW = 0
+
+        await layer.store_market_data('TCS', 'equity', self.frame(100.0), 'runner')
+        await layer.store_market_data('INFY', 'equity', self.frame(101.0), 'runner')
+
+        assert layer._copy_rows.await_count == 2
+
+    async def test_empty_frame_skipped(self, layer):
+        """Empty frames never queue a write."""
+        assert await layer.store_market_data('TCS', 'equity', pd.DataFrame(), 'runner') is True
+        layer._copy_rows.assert_not_awaited()
@@ -0,0 +1,45 @@
+"""
+Tests for PostgreSQL data layer helpers
+"""
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.engine import make_url
+
+from src.data.postgresql_data_layer import PostgreSQLDataLayer, _frame_rows
+
+
+class TestFrameRows:
+    """Test cases for building COPY rows from DataFrames."""
+
+    def test_nan_cells_become_none(self):
+        """Missing floats, integers and timestamps are written as NULL."""
+        df = pd.DataFrame({
+            'timestamp': pd.to_datetime(['2025-01-01 09:15', None], utc=True),
+            'close': [100.5, np.nan],
+            'volume': [10.0, np.nan],
+        })
+
+        rows = list(_frame_rows(df, ['timestamp', 'close', 'volume']))
+
+        assert rows[0][1:] == (100.5, 10)
+        assert isinstance(rows[0][2], int)
+        assert rows[1] == (None, None, None)
+
+    def test_complete_columns_untouched(self):
+        """Columns without gaps keep their values and zero-fill absent ones."""
+        df = pd.DataFrame({'close': [1.5, 2.5], 'volume': [1.0, 2.0]})
+
+        rows = list(_frame_rows(df, ['close', 'volume', 'open_interest']))
+
+        assert rows == [(1.5, 1, 0), (2.5, 2, 0)]
+
+
+class TestConnectionUrls:
+    """Test cases for the engine connection strings."""
+
+    def test_sync_url_uses_psycopg2(self):
+        """The executemany options need the psycopg2 dialect, not psycopg 3."""
+        url = make_url(PostgreSQLDataLayer().sync_url)
+
+        assert url.get_dialect().driver == 'psycopg2'
@@ -0,0 +1,242 @@
+"""
+Tests for the Redis cache layer
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.redis_cache_layer import RedisCacheLayer, _downcast_numeric
+
+
+class FakeRedis:
+    """In-memory subset of redis.asyncio.Redis used by the SWR paths."""
+
+    def __init__(self):
+        self.store = {}
+
+    def _live(self, key):
+        entry = self.store.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self.store[key]
+            return None
+        return value
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = (value if isinstance(value, bytes) else str(value).encode(),
+                           time.monotonic() + ttl)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and self._live(key) is not None:
+            return None
+        self.store[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    async def mget(self, *keys):
+        return [self._live(key) for key in keys]
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    unlink = delete
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline that applies queued SETEX calls on execute()."""
+
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def setex(self, key, ttl, value):
+        self.commands.append((key, ttl, value))
+
+    async def execute(self):
+        for command in self.commands:
+            await self.redis.setex(*command)
+        self.commands = []
+
+
+class TestDowncastNumeric:
+    """Test cases for shrinking cached DataFrames."""
+
+    def test_small_ints_stop_at_int32(self):
+        """Small integer columns become int32, never int8/int16."""
+        df = pd.DataFrame({'volume': np.array([1, 2, 3], dtype='int64')})
+
+        result = _downcast_numeric(df)
+
+        assert result['volume'].dtype == np.int32
+        assert (result['volume'] * 100_000).tolist() == [100_000, 200_000, 300_000]
+
+    def test_large_ints_stay_int64(self):
+        """Values outside the int32 range keep int64."""
+        df = pd.DataFrame({'volume': np.array([1, 2**40], dtype='int64')})
+
+        assert _downcast_numeric(df)['volume'].dtype == np.int64
+
+    def test_floats_become_float32(self):
+        """float64 columns are stored as float32 and the input is untouched."""
+        df = pd.DataFrame({'close': [100.5, 101.25]})
+
+        result = _downcast_numeric(df)
+
+        assert result['close'].dtype == np.float32
+        assert df['close'].dtype == np.float64
+
+
+class TestWriteThroughFreshness:
+    """Write-through paths must leave SWR-read keys fresh."""
+
+    @pytest.fixture
+    def cache(self):
+        """Create a cache layer backed by FakeRedis."""
+        cache = RedisCacheLayer()
+        cache.redis = cache._bulk_redis = FakeRedis()
+        cache._initialized = True
+        return cache
+
+    @staticmethod
+    def frame():
+        """Build a small options chain frame."""
+        return pd.DataFrame({'strike': [100.0, 110.0], 'ltp': [5.5, 2.25], 'oi': [10, 20]})
+
+    async def test_options_chain_served_without_refresh(self, cache):
+        """A cached options chain is read without touching primary storage."""
+        await cache.cache_options_chain('NIFTY', '2025-01-30', self.frame(), ttl=60)
+        factory = AsyncMock(return_value=pd.DataFrame())
+
+        result = await cache.get_or_set_swr('options', ('NIFTY', '2025-01-30'), factory,
+                                            ttl=60, data_type='dataframe')
+
+        assert len(result) == 2
+        factory.assert_not_awaited()
+        assert not cache._inflight
+
+    async def test_symbols_served_without_refresh(self, cache):
+        """A cached symbols list is read without a background refresh."""
+        await cache.cache_symbols_by_asset_type('equity', ['TCS', 'INFY'], ttl=60)
+        factory = AsyncMock(return_value=[])
+
+        result = await cache.get_or_set_swr('symbols', ('equity',), factory, ttl=60)
+
+        assert result == ['TCS', 'INFY']
+        factory.assert_not_awaited()
+        assert not cache._inflight
+
+    async def test_market_data_bulk_writes_markers(self, cache):
+        """Bulk market data writes both keys with freshness markers."""
+        await cache.cache_market_data_bulk([('TCS', '', self.frame())], ttl=60, latest_ttl=5)
+        factory = AsyncMock(return_value=pd.DataFrame())
+
+        result = await cache.get_or_set_swr('market_data', ('TCS', ''), factory,
+                                            ttl=60, data_type='dataframe')
+
+        assert len(result) == 2
+        factory.assert_not_awaited()
+        assert not cache._inflight
+        assert cache.redis._live(cache._make_key('latest_data', 'TCS') + ':fresh_until')
+
+    async def test_market_data_batch_writes_markers(self, cache):
+        """Record batches write market data keys with freshness markers."""
+        records = self.frame().to_dict('records')
+        await cache.cache_market_data_batch({('TCS', ''): records}, ttl=60, latest_ttl=5)
+
+        key = cache._make_key('market_data', 'TCS', '')
+        assert cache.redis._live(f"{key}:fresh_until") is not None
+
+    async def test_stale_value_served_and_refreshed(self, cache):
+        """Without a marker the value is served and reloaded in the background."""
+        key = cache._make_key('symbols', 'equity')
+        await cache.redis.setex(key, 60, await cache._serialize_data(['OLD']))
+        factory = AsyncMock(return_value=['NEW'])
+
+        assert await cache.get_or_set_swr('symbols', ('equity',), factory, ttl=60) == ['OLD']
+        await asyncio.gather(*cache._refresh_tasks)
+
+        factory.assert_awaited_once()
+        assert await cache.get_or_set_swr('symbols', ('equity',), factory, ttl=60) == ['NEW']
+
+    async def test_failed_refresh_does_not_trip_breaker(self, cache):
+        """Primary-storage errors during refreshes leave the cache switched on."""
+        asset_types = [f"type{i}" for i in range(cache._breaker.fail_threshold + 1)]
+        for asset_type in asset_types:
+            key = cache._make_key('symbols', asset_type)
+            await cache.redis.setex(key, 600, await cache._serialize_data(['OLD']))
+        factory = AsyncMock(side_effect=RuntimeError("database down"))
+
+        # Every stale read schedules a refresh; they then all fail back to back
+        for asset_type in asset_types:
+            assert await cache.get_or_set_swr('symbols', (asset_type,), factory, ttl=60) == ['OLD']
+        await asyncio.gather(*cache._refresh_tasks)
+
+        assert factory.await_count == len(asset_types)
+        assert not cache._breaker.open
+        assert not any(key.endswith(':refreshing') for key in cache.redis.store)
+
+class TestLocalCache:
+    """In-process copies handed out by get_or_set_swr(local_ttl=...)."""
+
+    async def test_callers_get_private_copies(self):
+        """Mutating one caller's result leaves the cached entry intact."""
+        cache = RedisCacheLayer()
+        cache.redis = cache._bulk_redis = FakeRedis()
+        cache._initialized = True
+        factory = AsyncMock(return_value=pd.Series({'close': 100.0}))
+
+        first, second = await asyncio.gather(*(
+            cache.get_or_set_swr('latest_data', ('TCS',), factory, ttl=30,
+                                 data_type='series', local_ttl=5)
+            for _ in range(2)
+        ))
+        first['close'] = -1.0
+        third = await cache.get_or_set_swr('latest_data', ('TCS',), factory, ttl=30,
+                                           data_type='series', local_ttl=5)
+        third['close'] = -2.0
+        fourth = await cache.get_or_set_swr('latest_data', ('TCS',), factory, ttl=30,
+                                            data_type='series', local_ttl=5)
+
+        factory.assert_awaited_once()
+        assert second['close'] == 100.0
+        assert fourth['close'] == 100.0
+
+
+class TestConnectionTimeouts:
+    """Hot-path and bulk pools get their own timeouts."""
+
+    def test_pool_timeouts(self):
+        """The bulk pool keeps the connect timeout but a longer reply timeout."""
+        cache = RedisCacheLayer(socket_timeout=0.25, socket_connect_timeout=0.5,
+                                bulk_socket_timeout=10.0)
+
+        hot = cache._create_pool(cache.max_connections, cache.socket_timeout).connection_kwargs
+        bulk = cache._create_pool(cache.BULK_MAX_CONNECTIONS, cache.bulk_socket_timeout).connection_kwargs
+
+        assert hot['socket_timeout'] == 0.25
+        assert bulk['socket_timeout'] == 10.0
+        assert hot['socket_connect_timeout'] == bulk['socket_connect_timeout'] == 0.5
+
+    def test_retry_on_timeout_off_by_default(self):
+        """Timed-out commands are not retried unless asked for."""
+        cache = RedisCacheLayer()
+        assert cache._create_pool(1, 0.25).connection_kwargs['retry_on_timeout'] is False
+
+        cache = RedisCacheLayer(retry_on_timeout=True)
+        assert cache._create_pool(1, 0.25).connection_kwargs['retry_on_timeout'] is True